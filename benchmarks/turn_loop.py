@@ -0,0 +1,301 @@
+"""
+End-to-end benchmark of the turn loop on the offline fake LLM backend.
+
+Drives TurnManager.process_ai_responses over the Pirate Adventure characters
+and story for many player turns, without network access or an API key, and reports:
+- wall time per stage (scene decision, scenes, movements, speaker decisions,
+  responses, background judge and summaries, saves)
+- LLM calls, tokens and estimated cost per turn
+- snapshot and resume time against timeline length
+
+Usage:
+    python benchmarks/turn_loop.py --turns 2000
+    python benchmarks/turn_loop.py --turns 500 --latency 0.4 --sigma 0.6 --two-stage
+"""
+
+import argparse
+import asyncio
+import contextlib
+import io
+import json
+import statistics
+import sys
+import tempfile
+import time
+from contextvars import ContextVar
+from functools import wraps
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from config import Config
+
+STORY_DIR = Path(__file__).parent.parent / "Pirate Adventure"
+CHARACTER_FILES = ["marina", "jack", "captain"]
+PLAYER_NAME = "Henry"
+PLAYER_LINES = [
+    "Captain, what do you make of these markings on the map?",
+    "[leans over the barrel] Jack, you've sailed these waters before, haven't you?",
+    "Marina, can you read the old script along the edge?",
+    "We should set a course before the storm catches us.",
+    "[looks toward the horizon] Is that another ship following us?",
+    "What is the first thing we do when we reach the island?",
+]
+
+
+class StageTimer:
+    """
+    Accumulates wall time per stage by wrapping methods of live objects.
+    A call nested inside another call of the same stage is not counted twice.
+    """
+
+    def __init__(self):
+        self.seconds: Dict[str, float] = {}
+        self.counts: Dict[str, int] = {}
+        self._active: ContextVar[frozenset] = ContextVar("active_stages", default=frozenset())
+
+    def wrap(self, owner: Any, method_name: str, stage: str) -> None:
+        """Time every call of owner.method_name under the given stage."""
+        method = getattr(owner, method_name)
+
+        if asyncio.iscoroutinefunction(method):
+            @wraps(method)
+            async def timed(*args, **kwargs):
+                active = self._active.get()
+                if stage in active:
+                    return await method(*args, **kwargs)
+                token = self._active.set(active | {stage})
+                started = time.perf_counter()
+                try:
+                    return await method(*args, **kwargs)
+                finally:
+                    self._add(stage, time.perf_counter() - started)
+                    self._active.reset(token)
+        else:
+            @wraps(method)
+            def timed(*args, **kwargs):
+                started = time.perf_counter()
+                try:
+                    return method(*args, **kwargs)
+                finally:
+                    self._add(stage, time.perf_counter() - started)
+
+        setattr(owner, method_name, timed)
+
+    def _add(self, stage: str, seconds: float) -> None:
+        self.seconds[stage] = self.seconds.get(stage, 0.0) + seconds
+        self.counts[stage] = self.counts.get(stage, 0) + 1
+
+
+def configure(args: argparse.Namespace) -> None:
+    """Point Config at the fake backend with the requested settings."""
+    Config.LLM_BACKEND = "fake"
+    Config.LLM_CACHE_MODE = "off"
+    Config.FAKE_LATENCY_MEDIAN = args.latency
+    Config.FAKE_LATENCY_SIGMA = args.sigma
+    Config.FAKE_TOKEN_DELAY = args.token_delay
+    Config.FAKE_SEED = args.seed
+    Config.RANDOM_SEED = args.seed
+    if not args.rate_limit:
+        Config.RATE_LIMIT_REQUESTS_PER_MINUTE = 0
+        Config.RATE_LIMIT_TOKENS_PER_MINUTE = 0
+    Config.STREAM_RESPONSES = args.stream
+    Config.PIPELINED_TURNS = args.pipelined
+    Config.TWO_STAGE_DECISIONS = args.two_stage
+    Config.REUSE_CANDIDATES = args.reuse_candidates
+    Config.ROLLING_SUMMARIES = not args.no_summaries
+    Config.JUDGE_IN_BACKGROUND = not args.inline_judge
+    Config.JUDGE_EVERY_CYCLES = args.judge_every
+    Config.DIRECTOR_MODE = args.director
+    Config.STORAGE_BACKEND = args.storage
+    Config.PACING = "none"
+
+
+def build_system(storage_dir: str):
+    """Create a RoleplaySystem over the Pirate Adventure data (quietly)."""
+    from roleplay_system import RoleplaySystem
+    from loaders.character_loader import CharacterLoader
+    from loaders.story_loader import StoryLoader
+    from managers.storyManager import StoryManager
+
+    with contextlib.redirect_stdout(io.StringIO()):
+        characters = CharacterLoader(str(STORY_DIR)).load_multiple_characters(CHARACTER_FILES)
+        story_manager = StoryManager(StoryLoader(str(STORY_DIR)).load_story())
+        system = RoleplaySystem(
+            player_name=PLAYER_NAME,
+            characters=characters,
+            chat_storage_dir=storage_dir,
+            story_manager=story_manager,
+            story_name="benchmark",
+            initial_location="The Sea Serpent - Main Deck"
+        )
+    return system
+
+
+def instrument(system: Any) -> StageTimer:
+    """Wrap the stages of a system's turn loop in a StageTimer."""
+    timer = StageTimer()
+    turn_manager = system.turn_manager
+    timeline_manager = system.timeline_manager
+    timer.wrap(timeline_manager, "should_generate_scene_async", "scene_decision")
+    timer.wrap(timeline_manager, "generate_scene_event_async", "scene")
+    timer.wrap(timeline_manager, "decide_character_movements_async", "movement")
+    timer.wrap(timeline_manager, "direct_scene_async", "director")
+    timer.wrap(turn_manager, "select_next_speaker_async", "decisions")
+    timer.wrap(turn_manager, "_stream_response_async", "response")
+    timer.wrap(turn_manager, "_generate_winner_response_async", "response")
+    timer.wrap(turn_manager, "_evaluate_objectives_with_judge_async", "judge")
+    timer.wrap(turn_manager, "_update_summaries_async", "summaries (background)")
+    timer.wrap(system, "_save_conversation", "save")
+    return timer
+
+
+def measure_storage(system: Any, storage_dir: str) -> Dict[str, Any]:
+    """Time a full snapshot and a resume of the current timeline."""
+    started = time.perf_counter()
+    system.store.write_snapshot(system.timeline)
+    snapshot_seconds = time.perf_counter() - started
+
+    started = time.perf_counter()
+    resumed = build_system(storage_dir)
+    resume_seconds = time.perf_counter() - started
+    resumed.store.close()
+
+    return {
+        "events": len(system.timeline.events),
+        "snapshot_ms": snapshot_seconds * 1000,
+        "resume_ms": resume_seconds * 1000,
+        "log_bytes": sum(path.stat().st_size for path in Path(storage_dir).rglob("*") if path.is_file()),
+    }
+
+
+async def run_benchmark(turns: int, checkpoints: int, storage_dir: str) -> Dict[str, Any]:
+    """Play the given number of player turns and collect measurements."""
+    from helpers.fake_llm import get_fake_client
+    from helpers.metrics import get_metrics
+
+    system = build_system(storage_dir)
+    timer = instrument(system)
+    fake = get_fake_client()
+    checkpoint_every = max(turns // max(checkpoints, 1), 1)
+
+    turn_seconds: List[float] = []
+    calls_per_turn: List[int] = []
+    tokens_per_turn: List[int] = []
+    storage: List[Dict[str, Any]] = []
+    ai_lines = 0
+
+    for turn in range(turns):
+        before = fake.stats()
+        started = time.perf_counter()
+        with contextlib.redirect_stdout(io.StringIO()):
+            system._add_player_message(PLAYER_LINES[turn % len(PLAYER_LINES)])
+            responses = await system.turn_manager.process_ai_responses_async()
+        turn_seconds.append(time.perf_counter() - started)
+        ai_lines += len(responses)
+
+        after = fake.stats()
+        calls_per_turn.append(after["calls"] - before["calls"])
+        tokens_per_turn.append(
+            after["prompt_tokens"] + after["completion_tokens"]
+            - before["prompt_tokens"] - before["completion_tokens"]
+        )
+
+        if (turn + 1) % checkpoint_every == 0 or turn + 1 == turns:
+            with contextlib.redirect_stdout(io.StringIO()):
+                storage.append(measure_storage(system, storage_dir))
+            print(f"  turn {turn + 1}/{turns}: {storage[-1]['events']} events", file=sys.stderr)
+
+    background = [system.turn_manager._summary_task, system.turn_manager._judge_task]
+    await asyncio.gather(*[task for task in background if task is not None], return_exceptions=True)
+    system.store.close()
+
+    stats = fake.stats()
+    cost = get_metrics().totals((), session=system.turn_manager.session_id).get((), {}).get("cost_usd", 0.0)
+    return {
+        "turns": turns,
+        "ai_lines": ai_lines,
+        "events": len(system.timeline.events),
+        "turn_ms": {
+            "mean": statistics.fmean(turn_seconds) * 1000,
+            "p50": _percentile(turn_seconds, 0.5) * 1000,
+            "p95": _percentile(turn_seconds, 0.95) * 1000,
+            "max": max(turn_seconds) * 1000,
+        },
+        "stage_ms_per_turn": {stage: seconds * 1000 / turns for stage, seconds in timer.seconds.items()},
+        "stage_calls": dict(timer.counts),
+        "llm_calls_per_turn": statistics.fmean(calls_per_turn),
+        "tokens_per_turn": statistics.fmean(tokens_per_turn),
+        "prompt_tokens_per_turn": stats["prompt_tokens"] / turns,
+        "completion_tokens_per_turn": stats["completion_tokens"] / turns,
+        "llm_calls_by_kind": stats["calls_by_kind"],
+        "cost_usd_per_turn": cost / turns,
+        "storage": storage,
+    }
+
+
+def print_report(results: Dict[str, Any]) -> None:
+    """Print benchmark results as tables."""
+    print(f"\n{results['turns']} player turns, {results['ai_lines']} AI lines, {results['events']} events")
+    turn_ms = results["turn_ms"]
+    print(f"Turn wall time (ms): mean {turn_ms['mean']:.1f}  p50 {turn_ms['p50']:.1f}  "
+          f"p95 {turn_ms['p95']:.1f}  max {turn_ms['max']:.1f}")
+
+    print("\nStage                      ms/turn     calls")
+    for stage, ms in sorted(results["stage_ms_per_turn"].items(), key=lambda item: -item[1]):
+        print(f"  {stage:<24} {ms:>8.2f}  {results['stage_calls'][stage]:>8}")
+
+    print(f"\nLLM calls per turn: {results['llm_calls_per_turn']:.2f}")
+    print(f"Tokens per turn: {results['tokens_per_turn']:.0f} "
+          f"(prompt {results['prompt_tokens_per_turn']:.0f}, completion {results['completion_tokens_per_turn']:.0f})")
+    print(f"Estimated cost per turn: ${results['cost_usd_per_turn']:.5f}")
+    print("Calls by kind: " + ", ".join(f"{kind} {count}" for kind, count in sorted(results["llm_calls_by_kind"].items())))
+
+    print("\nEvents    snapshot ms   resume ms   storage KB")
+    for row in results["storage"]:
+        print(f"  {row['events']:>6}  {row['snapshot_ms']:>11.1f}  {row['resume_ms']:>10.1f}  {row['log_bytes'] / 1024:>11.1f}")
+
+
+def _percentile(values: List[float], fraction: float) -> float:
+    ordered = sorted(values)
+    return ordered[min(int(fraction * len(ordered)), len(ordered) - 1)]
+
+
+def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--turns", type=int, default=1000, help="Player turns to play")
+    parser.add_argument("--checkpoints", type=int, default=10, help="Snapshot/resume measurements")
+    parser.add_argument("--latency", type=float, default=0.0, help="Median fake LLM latency in seconds")
+    parser.add_argument("--sigma", type=float, default=0.5, help="Log-normal spread of the latency")
+    parser.add_argument("--token-delay", type=float, default=0.0, help="Seconds per generated token")
+    parser.add_argument("--seed", type=int, default=0, help="Seed for content, latencies and speaker selection")
+    parser.add_argument("--stream", action="store_true", help="Stream the selected speaker's response")
+    parser.add_argument("--pipelined", action="store_true", help="Overlap meta-narrative and decisions")
+    parser.add_argument("--two-stage", action="store_true", help="Bid first, write only the winner's response")
+    parser.add_argument("--reuse-candidates", action="store_true", help="Reuse runner-up decisions")
+    parser.add_argument("--no-summaries", action="store_true", help="Disable rolling summaries")
+    parser.add_argument("--director", action="store_true", help="Decide scenes and movements in one call")
+    parser.add_argument("--inline-judge", action="store_true", help="Judge objectives inside the turn instead of in the background")
+    parser.add_argument("--judge-every", type=int, default=1, help="Response cycles between judge evaluations")
+    parser.add_argument("--rate-limit", action="store_true", help="Keep the configured client-side rate limits")
+    parser.add_argument("--storage", choices=["eventlog", "sqlite"], default="eventlog", help="Conversation storage backend")
+    parser.add_argument("--storage-dir", help="Directory for the conversation log (default: a temporary one)")
+    parser.add_argument("--json", help="Also write the results to this JSON file")
+    return parser.parse_args(argv)
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    args = parse_args(argv)
+    configure(args)
+    storage_dir = args.storage_dir or tempfile.mkdtemp(prefix="roleplay-bench-")
+
+    results = asyncio.run(run_benchmark(args.turns, args.checkpoints, storage_dir))
+
+    print_report(results)
+    if args.json:
+        Path(args.json).write_text(json.dumps(results, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -1,5 +1,5 @@
 import os
-from typing import Optional
+from typing import Dict, Optional, Tuple
 from dotenv import load_dotenv
 
 load_dotenv()
@@ -10,18 +10,100 @@ class Config:
     # API Settings - OpenRouter
     OPENROUTER_API_KEY: Optional[str] = os.getenv("OPENROUTER_API_KEY")
     OPENROUTER_BASE_URL: str = "https://openrouter.ai/api/v1"
+    LLM_BACKEND: str = os.getenv("LLM_BACKEND", "openrouter")  # "openrouter" or "fake" (offline stand-in, no API key needed)
+    
+    # Fake Backend Settings (LLM_BACKEND = "fake")
+    FAKE_LATENCY_MEDIAN: float = 0.0  # Median seconds before a fake completion starts
+    FAKE_LATENCY_SIGMA: float = 0.5  # Log-normal spread of fake latencies; 0 makes them fixed
+    FAKE_TOKEN_DELAY: float = 0.0  # Seconds per generated token
+    FAKE_SEED: Optional[int] = None  # Seed for fake content and latencies
+    FAKE_SCENE_PROBABILITY: float = 0.1  # Chance a scene decision generates a scene
+    FAKE_MOVEMENT_PROBABILITY: float = 0.1  # Chance a movement decision moves a character
     
     # Model Settings
     DEFAULT_MODEL: str = "x-ai/grok-4.1-fast" 
+    MODEL_PRICES: Dict[str, Tuple[float, float]] = {  # USD per million prompt / completion tokens, for cost estimates
+        "x-ai/grok-4.1-fast": (0.20, 0.50),
+    }
     
     MODEL_TEMPERATURE: float = 0.7
     MAX_TOKENS: int = 1024
-    RESPONSE_TIMEOUT: int = 20  
+    RESPONSE_TIMEOUT: int = 20  # Seconds before a single LLM call is abandoned (and retried)
+    HEDGE_REQUESTS: bool = False  # Send a duplicate of interactive calls still running past the usual latency
+    HEDGE_PERCENTILE: float = 0.9  # Latency percentile after which a call is hedged
+    HEDGE_MIN_SAMPLES: int = 20  # Calls of a kind to observe before hedging it
+    PROMPT_CACHE_CONTROL: bool = True  # Mark static system prompts with cache_control breakpoints
+    STRUCTURED_OUTPUT: bool = True  # Send each prompt's JSON schema as response_format (dropped for models that reject it)
+    
+    # LLM Response Cache
+    LLM_CACHE_MODE: str = os.getenv("LLM_CACHE_MODE", "off")  # "off", "cache" (reuse identical requests), "record" or "replay" (offline)
+    LLM_CACHE_BACKEND: str = "sqlite"  # "memory" or "sqlite"
+    LLM_CACHE_PATH: str = os.getenv("LLM_CACHE_PATH", "llm_cache.sqlite3")
+    LLM_CACHE_MAX_ENTRIES: int = 10000  # Cached completions kept (recordings are not evicted)
+    LLM_CACHE_TTL: float = 86400.0  # Seconds a cached completion stays valid; 0 never expires (recordings never expire)
+    RANDOM_SEED: Optional[int] = None  # Seed for speaker selection; record/replay default to 0
+    
+    # Metrics Settings
+    METRICS_TEXTFILE: Optional[str] = os.getenv("METRICS_TEXTFILE")  # Prometheus textfile rewritten after each round; None disables it
+    
+    # Connection Pool Settings (one shared pool per base URL)
+    MAX_CONCURRENT_DECISIONS: int = 16  # Max in-flight LLM calls per pool
+    KEEPALIVE_EXPIRY: float = 60.0  # Seconds an idle connection is kept open
+    
+    # Rate Limiting (one limiter shared by every request to the same provider)
+    RATE_LIMIT_REQUESTS_PER_MINUTE: int = 300  # 0 disables the request limit
+    RATE_LIMIT_TOKENS_PER_MINUTE: int = 1000000  # Prompt + completion tokens; 0 disables the token limit
+    RATE_LIMIT_BURST: int = 16  # Requests that may be sent back to back before the rate applies
+    MAX_RETRIES: int = 4  # Retries of a rate-limited or transiently failed request
+    RETRY_BASE_DELAY: float = 0.5  # Seconds; doubled per retry, with full jitter
+    RETRY_MAX_DELAY: float = 30.0  # Longest backoff; a longer Retry-After fails the request instead
     
     # Conversation Settings
     DEFAULT_CONTEXT_WINDOW: int = 100
     MAX_CONSECUTIVE_AI_TURNS: int = 3
     PRIORITY_RANDOMNESS: float = 0.1
+    STREAM_RESPONSES: bool = False  # Stream the selected speaker's words as they are generated
+    PIPELINED_TURNS: bool = False  # Overlap scene/movement decisions with a speculative first decision round
+    REUSE_CANDIDATES: bool = False  # Speak runners-up decisions in later slots instead of re-polling everyone
+    CANDIDATE_MAX_AGE: int = 3  # Events after which a remembered decision is considered stale
+    TWO_STAGE_DECISIONS: bool = False  # Poll with short bids; generate dialogue only for the selected speaker
+    BID_MAX_TOKENS: int = 120  # Token cap for a speaking bid (type, priority, reasoning)
+    ROUND_DEADLINE: float = 0  # Seconds a round of decisions (with its calls' retries) may take before choosing among those in; 0 waits for all
+    DIRECTOR_MODE: bool = False  # Decide scene events and entries/exits in one "director" call instead of two
+    
+    # Objective Judge Settings
+    JUDGE_IN_BACKGROUND: bool = True  # Judge in a background worker; updates apply before the next decision round
+    JUDGE_EVERY_CYCLES: int = 1  # Response cycles between judge evaluations; 0 judges only on trigger events
+    JUDGE_ON_SCENE_TRANSITION: bool = True  # Also judge after a scene transition
+    
+    # Pacing Settings (done by the console; the turn engine never waits)
+    PACING: str = "fixed"  # "none", "fixed" (pauses after lines, scenes and movements) or "typing"
+    PACING_LINE_DELAY: float = 2.0  # Seconds after each character line ("fixed")
+    PACING_SCENE_DELAY: float = 1.0  # Seconds after each scene event
+    PACING_MOVEMENT_DELAY: float = 1.0  # Seconds after each entry or exit ("fixed")
+    PACING_STALL_DELAY: float = 2.0  # Seconds after a scene generated when the conversation stalls ("fixed")
+    PACING_TYPING_CPS: float = 30.0  # Characters per second a line takes to "type" ("typing")
+    PACING_TYPING_MAX_DELAY: float = 6.0  # Longest typing pause for one line ("typing")
+    
+    # Summary Settings
+    ROLLING_SUMMARIES: bool = True  # Summarize older events in the background after each round
+    SUMMARY_CHUNK_SIZE: int = 20  # Events per first-level summary
+    SUMMARY_FANOUT: int = 4  # Summaries on one level rolled into one on the level above
+    SUMMARY_MAX_LEVELS: int = 3  # Summary levels; the top level rolls into itself
+    
+    # Memory Retrieval Settings
+    MEMORY_RETRIEVAL: bool = True  # Add relevant older memories to character prompts
+    MEMORY_RETRIEVAL_K: int = 4  # Max older memories recalled per prompt
+    MEMORY_RETRIEVAL_MIN_SCORE: float = 0.2  # Min cosine similarity of a recalled memory
+    MEMORY_QUERY_EVENTS: int = 3  # Latest remembered events used as the retrieval query
+    MEMORY_INDEX_DIM: int = 1024  # Hash buckets of the bag-of-words memory embedding
+    MEMORY_EMBEDDING_MODEL: Optional[str] = None  # Local sentence-transformers model; None uses bag-of-words
     
     # Storage Settings
-    CHAT_STORAGE_DIR: str = "Chat_Logs"
\ No newline at end of file
+    CHAT_STORAGE_DIR: str = "Chat_Logs"
+    STORAGE_BACKEND: str = "eventlog"  # "eventlog" (JSON snapshot + JSONL log per session) or "sqlite"
+    SQLITE_DB_NAME: str = "conversations.db"  # Database file in the storage directory (sqlite backend)
+    SQLITE_BUSY_TIMEOUT: float = 10.0  # Seconds a save waits for another writer's lock (sqlite backend)
+    CHAT_LOG_FSYNC_EVERY: int = 8  # Appended events per fsync of the conversation log
+    CHAT_LOG_FSYNC_INTERVAL: float = 2.0  # Max seconds between fsyncs of the conversation log
+    CHAT_SNAPSHOT_EVERY: int = 200  # Logged events before the log is compacted into a snapshot
\ No newline at end of file
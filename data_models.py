@@ -4,10 +4,14 @@ All Pydantic models are defined here.
 """
 
 from datetime import datetime
-from typing import List, Dict, Optional, Any
-from pydantic import BaseModel, Field
+from typing import List, Dict, Optional, Any, Iterable, Tuple
+from pydantic import BaseModel, Field, PrivateAttr
+import threading
 import uuid
 
+from helpers.memory_view import MemoryView
+from helpers.event_store import EventStore
+
 
 class TimelineEvent(BaseModel):
     """Base class for all timeline events (messages, scenes, etc.)."""
@@ -66,17 +70,120 @@ class CharacterExit(TimelineEvent):
     
     character: str = Field(..., description="Name of the character leaving")
     description: str = Field(..., description="Description of how the character leaves (e.g., 'Hermione hurries off to the library')")
-    
+
+
+# Layout of each event class in a timeline's compact EventStore
+EventStore.register(Message, symbols=("character",), texts=("dialouge", "action_description"))
+EventStore.register(Scene, symbols=("scene_type", "location"), texts=("description",))
+EventStore.register(Action, symbols=("character",), texts=("description",))
+EventStore.register(CharacterEntry, symbols=("character",), texts=("description",))
+EventStore.register(CharacterExit, symbols=("character",), texts=("description",))
+
+
+class SummaryNode(BaseModel):
+    """A summary of a contiguous range of events, or of lower-level summaries of that range."""
+
+    level: int = Field(..., description="0 for a summary of events, n for a roll-up of level n-1 summaries")
+    start: int = Field(..., description="Position of the first event covered")
+    end: int = Field(..., description="Position after the last event covered")
+    text: str = Field(..., description="The summary")
+
+
+class RollingSummary(BaseModel):
+    """
+    Hierarchical summary of an append-only sequence of events.
+
+    Events are summarized once, in fixed-size chunks, in order. Whenever enough
+    summaries pile up on one level they are replaced by a single summary on the
+    level above; the top level rolls into itself. Only this frontier is kept,
+    so its size is bounded however long the sequence gets.
+    """
+
+    summarized_count: int = Field(default=0, description="Number of events already covered by summaries")
+    last_event_id: Optional[str] = Field(default=None, description="timeline_id of the last summarized event")
+    nodes: List[SummaryNode] = Field(default_factory=list, description="Summaries, oldest first")
+
+    def align(self, events: List[TimelineEvent]) -> None:
+        """
+        Re-locate the summarized prefix in a rebuilt event sequence (e.g. a memory
+        restored on resume) using the id of the last summarized event.
+        """
+        count = self.summarized_count
+        if not count or self.last_event_id is None:
+            return
+        if count <= len(events) and events[count - 1].timeline_id == self.last_event_id:
+            return
+        for position in range(min(len(events), count + 8) - 1, -1, -1):
+            if events[position].timeline_id == self.last_event_id:
+                shift = position + 1 - count
+                for node in self.nodes:
+                    node.start = max(node.start + shift, 0)
+                    node.end += shift
+                self.summarized_count = position + 1
+                return
+
+    def next_chunk(self, event_count: int, chunk_size: int) -> Optional[Tuple[int, int]]:
+        """Get the (start, end) of the next chunk of events to summarize, if a full one is available."""
+        if event_count - self.summarized_count < chunk_size:
+            return None
+        return self.summarized_count, self.summarized_count + chunk_size
+
+    def add_chunk(self, start: int, end: int, text: str, last_event_id: Optional[str] = None) -> bool:
+        """
+        Record the summary of events[start:end].
+
+        Returns:
+            False (and nothing is recorded) if the chunk does not directly follow the
+            summarized prefix, so no event is ever summarized twice
+        """
+        if start != self.summarized_count or end <= start:
+            return False
+        self.nodes.append(SummaryNode(level=0, start=start, end=end, text=text))
+        self.summarized_count = end
+        self.last_event_id = last_event_id
+        return True
+
+    def next_rollup(self, fanout: int, max_levels: int) -> Optional[List[SummaryNode]]:
+        """Get the lowest-level group of summaries due to be rolled up, if any."""
+        top_level = max_levels - 1
+        for level in range(top_level + 1):
+            group = [node for node in self.nodes if node.level == level]
+            if len(group) >= fanout:
+                return group[:fanout]
+        return None
+
+    def apply_rollup(self, children: List[SummaryNode], text: str, max_levels: int) -> bool:
+        """
+        Replace a group of summaries (from next_rollup) with one summary a level up.
+
+        Returns:
+            False if the group is no longer part of the frontier
+        """
+        indexes = [
+            index for index, node in enumerate(self.nodes)
+            if any(node is child for child in children)
+        ]
+        if len(indexes) != len(children) or indexes != list(range(indexes[0], indexes[0] + len(children))):
+            return False
+        parent = SummaryNode(
+            level=min(children[0].level + 1, max_levels - 1),
+            start=children[0].start,
+            end=children[-1].end,
+            text=text
+        )
+        self.nodes[indexes[0]:indexes[-1] + 1] = [parent]
+        return True
+
 
 class TimelineHistory(BaseModel):
     """Represents the complete conversation history."""
 
     id: str = Field(default_factory=lambda: str(uuid.uuid4()), description="Unique ID for the conversation")
     title: Optional[str] = Field(default=None, description="Optional title for the conversation (e.g., 'Midnight Planning')")
-    events: List[TimelineEvent] = Field(
-        default_factory=list,
-        description="List of all timeline events (messages and scenes)"
-    ) 
+    events: EventStore = Field(
+        default_factory=EventStore,
+        description="All timeline events (messages and scenes), stored compactly and read back as models"
+    )
     participants: List[str] = Field(
         default_factory=list,
         description="List of characters involved in this conversation"
@@ -89,11 +196,99 @@ class TimelineHistory(BaseModel):
         default=None,
         description="Brief automatically generated summary of the timeline"
     )
+    summary: RollingSummary = Field(
+        default_factory=RollingSummary,
+        description="Rolling summaries of the events, maintained in the background"
+    )
+    character_summaries: Dict[str, RollingSummary] = Field(
+        default_factory=dict,
+        description="Rolling summaries of each character's memory, keyed by character name"
+    )
     visible_to_user: bool = Field(
         default=True,
         description="Whether the user can view this conversation (for private NPC chats, set False)"
     )
 
+    # Secondary indexes over `events`, kept in step with the list lazily
+    _type_positions: Dict[type, List[int]] = PrivateAttr(default_factory=dict)
+    _character_positions: Dict[str, List[int]] = PrivateAttr(default_factory=dict)
+    _current_location: Optional[str] = PrivateAttr(default=None)
+    _indexed_count: int = PrivateAttr(default=0)
+    _last_indexed: Optional[TimelineEvent] = PrivateAttr(default=None)
+    # Lookups (which update the indexes) come from the turn loop and from the caller's thread
+    _index_lock: threading.RLock = PrivateAttr(default_factory=threading.RLock)
+
+    def sync_indexes(self) -> None:
+        """
+        Index events appended since the last call.
+        Called by TimelineManager.add_event and before every indexed lookup, so events
+        appended to the list directly are picked up too. If the list was cleared or
+        replaced, the indexes are rebuilt from scratch.
+        """
+        with self._index_lock:
+            # Events appended by another thread meanwhile are picked up by the next call
+            end = len(self.events)
+            count = self._indexed_count
+            if count and (end < count or self.events[count - 1] is not self._last_indexed):
+                self._type_positions = {}
+                self._character_positions = {}
+                self._current_location = None
+                count = 0
+
+            for position in range(count, end):
+                event = self.events[position]
+                self._type_positions.setdefault(type(event), []).append(position)
+                character = getattr(event, "character", None)
+                if character is not None:
+                    self._character_positions.setdefault(character, []).append(position)
+                if isinstance(event, Scene):
+                    self._current_location = event.location
+
+            self._indexed_count = end
+            self._last_indexed = self.events[end - 1] if end else None
+
+    def get_events_of_type(self, event_class: type, n: Optional[int] = None) -> List[TimelineEvent]:
+        """
+        Get the n most recent events of one type, without scanning the whole timeline.
+
+        Args:
+            event_class: Event class to select (e.g. Scene)
+            n: Number of events, or None for all of them
+
+        Returns:
+            Matching events in timeline order
+        """
+        with self._index_lock:
+            self.sync_indexes()
+            positions = self._type_positions.get(event_class, [])
+            if n is not None:
+                positions = positions[-n:] if n > 0 else []
+            return [self.events[position] for position in positions]
+
+    def get_events_by_character(self, character: str, n: Optional[int] = None) -> List[TimelineEvent]:
+        """
+        Get the n most recent events by (or about the entry/exit of) one character.
+
+        Args:
+            character: Character name
+            n: Number of events, or None for all of them
+
+        Returns:
+            Matching events in timeline order
+        """
+        with self._index_lock:
+            self.sync_indexes()
+            positions = self._character_positions.get(character, [])
+            if n is not None:
+                positions = positions[-n:] if n > 0 else []
+            return [self.events[position] for position in positions]
+
+    def get_current_location(self) -> Optional[str]:
+        """Get the location of the most recent Scene."""
+        with self._index_lock:
+            self.sync_indexes()
+            return self._current_location
+
 
 class CharacterPersona(BaseModel):
     """Defines a character's personality, background, and relationships."""
@@ -135,10 +330,31 @@ class CharacterMemory(BaseModel):
 
     name: str = Field(..., description="Name of the character this memory belongs to")
 
-    event: List[TimelineEvent] = Field(
-        default_factory=list,
-        description="Scenes and Messages this character observed from its perspective"
-    )
+    # Ranges over the shared timeline rather than a private copy of every event
+    _events: MemoryView = PrivateAttr(default_factory=MemoryView)
+    _timeline: Optional["TimelineHistory"] = PrivateAttr(default=None)
+
+    def __init__(self, event: Optional[Iterable[TimelineEvent]] = None, **data):
+        super().__init__(**data)
+        if event:
+            self._events.extend(event)
+
+    @property
+    def event(self) -> MemoryView:
+        """Scenes and Messages this character observed from its perspective (list-like)."""
+        return self._events
+
+    def bind_timeline(self, timeline: "TimelineHistory") -> None:
+        """Store events broadcast from this timeline as references into it."""
+        self._events.bind(timeline.events)
+        self._timeline = timeline
+
+    @property
+    def summary(self) -> Optional[RollingSummary]:
+        """Rolling summary of this memory, stored with the bound timeline (None if unbound)."""
+        if self._timeline is None:
+            return None
+        return self._timeline.character_summaries.setdefault(self.name, RollingSummary())
 
 
 class CharacterState(BaseModel):
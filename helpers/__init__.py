@@ -2,6 +2,18 @@
 Helper utilities for the RoleRealm system.
 """
 
-from .response_parser import parse_json_response
+from .response_parser import parse_json_response, extract_json_object, StreamingJsonParser
+from .async_runner import run_sync
+from .decision_stream import DecisionStream
+from .memory_view import MemoryView
+from .event_store import EventStore
+from .memory_index import MemoryIndex
+from .llm_cache import ResponseCache, CacheMissError, get_response_cache
+from .fake_llm import FakeLLMClient, get_fake_client
+from .pacing import PacingPolicy, PacedOutput, get_pacing_policy
+from .metrics import MetricsRegistry, get_metrics
 
-__all__ = ['parse_json_response']
\ No newline at end of file
+__all__ = ['parse_json_response', 'extract_json_object', 'StreamingJsonParser', 'run_sync', 'DecisionStream', 'MemoryView', 'EventStore', 'MemoryIndex',
+           'ResponseCache', 'CacheMissError', 'get_response_cache',
+           'FakeLLMClient', 'get_fake_client', 'PacingPolicy', 'PacedOutput', 'get_pacing_policy',
+           'MetricsRegistry', 'get_metrics']
\ No newline at end of file
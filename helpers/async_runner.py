@@ -0,0 +1,150 @@
+"""
+Helpers for driving the asyncio turn engine from synchronous code.
+
+Every sync API in the managers is a thin wrapper that submits its async
+counterpart to one long-lived background event loop. Keeping a single loop
+(rather than calling asyncio.run per call) lets loop-bound resources such as
+the pooled HTTP clients survive between calls.
+"""
+
+import asyncio
+import atexit
+import threading
+from typing import Any, Awaitable, Callable, Coroutine, List, Optional, TypeVar
+
+T = TypeVar("T")
+
+_loop: Optional[asyncio.AbstractEventLoop] = None
+_thread: Optional[threading.Thread] = None
+_lock = threading.Lock()
+_shutdown_hooks: List[Callable[[], Awaitable[None]]] = []
+
+
+def get_background_loop() -> asyncio.AbstractEventLoop:
+    """
+    Get the shared background event loop, starting it on first use.
+
+    Returns:
+        The running background event loop
+    """
+    global _loop, _thread
+
+    with _lock:
+        if _loop is None or _loop.is_closed():
+            _loop = asyncio.new_event_loop()
+            _thread = threading.Thread(
+                target=_loop.run_forever,
+                name="roleplay-engine-loop",
+                daemon=True
+            )
+            _thread.start()
+        return _loop
+
+
+def run_sync(coro: Coroutine[Any, Any, T]) -> T:
+    """
+    Run a coroutine on the background event loop and block until it finishes.
+
+    Args:
+        coro: Coroutine to run
+
+    Returns:
+        The coroutine's result
+
+    Raises:
+        RuntimeError: If called from the background loop itself (await the async variant instead)
+    """
+    loop = get_background_loop()
+    if threading.current_thread() is _thread:
+        coro.close()
+        raise RuntimeError(
+            "Synchronous API called from inside the engine event loop. "
+            "Await the corresponding *_async method instead."
+        )
+    return asyncio.run_coroutine_threadsafe(coro, loop).result()
+
+
+def call_on_loop(func: Callable[..., T], *args: Any) -> T:
+    """
+    Call a plain function so that it never runs concurrently with the engine's tasks.
+
+    On a thread with a running event loop (the engine loop, or an embedder's loop
+    driving the async API) the function is called directly: no task can interleave
+    with it. Anywhere else it is run on the background loop and waited for.
+
+    Args:
+        func: Function to call (e.g. one that mutates the timeline)
+        *args: Its arguments
+
+    Returns:
+        The function's result
+    """
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        pass
+    else:
+        return func(*args)
+
+    async def call() -> T:
+        return func(*args)
+
+    return asyncio.run_coroutine_threadsafe(call(), get_background_loop()).result()
+
+
+def add_shutdown_hook(hook: Callable[[], Awaitable[None]]) -> None:
+    """
+    Register an async cleanup function (e.g. closing loop-bound HTTP clients)
+    to run on the background loop before it is stopped.
+
+    Args:
+        hook: Function returning an awaitable, called with no arguments
+    """
+    _shutdown_hooks.append(hook)
+
+
+def shutdown_background_loop(timeout: float = 5.0) -> None:
+    """
+    Run the shutdown hooks on the background loop, cancel its remaining tasks and stop it.
+    Called at interpreter exit; a later run_sync() starts a fresh loop.
+
+    Args:
+        timeout: Seconds to wait for each step
+    """
+    global _loop, _thread
+
+    with _lock:
+        loop, thread = _loop, _thread
+        _loop, _thread = None, None
+    if loop is None or loop.is_closed() or threading.current_thread() is thread:
+        return
+
+    for hook in _shutdown_hooks:
+        try:
+            asyncio.run_coroutine_threadsafe(_await(hook), loop).result(timeout)
+        except Exception as e:
+            print(f"⚠️  Error during engine shutdown: {e}")
+    try:
+        asyncio.run_coroutine_threadsafe(_cancel_pending_tasks(), loop).result(timeout)
+    except Exception:
+        pass  # Tasks that ignore cancellation are dropped with the loop
+
+    loop.call_soon_threadsafe(loop.stop)
+    thread.join(timeout)
+    if not loop.is_running():
+        loop.close()
+
+
+async def _await(hook: Callable[[], Awaitable[None]]) -> None:
+    await hook()
+
+
+async def _cancel_pending_tasks() -> None:
+    """Cancel every other task on the running loop (background summaries, judge) and wait for them."""
+    tasks = [task for task in asyncio.all_tasks() if task is not asyncio.current_task()]
+    for task in tasks:
+        task.cancel()
+    await asyncio.gather(*tasks, return_exceptions=True)
+
+
+atexit.register(shutdown_background_loop)
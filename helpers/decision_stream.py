@@ -0,0 +1,140 @@
+"""
+Streaming view of a character's turn decision.
+"""
+
+import asyncio
+from typing import AsyncIterator, Optional, Tuple
+
+from helpers.response_parser import StreamingJsonParser
+
+
+class DecisionStream:
+    """
+    A character's speak/act/silent decision while it is still being generated.
+
+    The decision header (type, priority, reasoning) becomes available as soon
+    as those fields are parsed, which is usually long before the dialogue is
+    finished. The "dialogue" and "action" text can then be consumed fragment
+    by fragment while the rest of the completion streams in.
+    """
+
+    HEADER_FIELDS = ("type", "priority", "reasoning")
+    STREAMED_FIELDS = ("dialogue", "action")
+
+    def __init__(self, character_name: str, header: Optional[Tuple[str, float, str]] = None):
+        """
+        Initialize an empty decision stream.
+
+        Args:
+            character_name: Name of the character making the decision
+            header: Already-decided (type, priority, reasoning), when only the
+                response is being streamed (two-stage selection)
+        """
+        self.character_name = character_name
+        self.error: Optional[Exception] = None
+        self._parser = StreamingJsonParser()
+        self._fragments: asyncio.Queue = asyncio.Queue()
+        self._header_ready = asyncio.Event()
+        if header is not None:
+            response_type, priority, reasoning = header
+            self._parser.values.update(
+                {"type": response_type, "priority": priority, "reasoning": reasoning}
+            )
+            self._header_ready.set()
+        self._done = asyncio.Event()
+        self._task: Optional[asyncio.Task] = None
+
+    def start(self, chunks: AsyncIterator[str]) -> "DecisionStream":
+        """
+        Start consuming streamed text in a background task.
+
+        Args:
+            chunks: Async iterator of text deltas from the model
+
+        Returns:
+            This DecisionStream, for chaining
+        """
+        self._task = asyncio.ensure_future(self._consume(chunks))
+        return self
+
+    def cancel(self) -> None:
+        """Stop generating; used for characters that lost the turn."""
+        if self._task and not self._task.done():
+            self._task.cancel()
+
+    async def header(self) -> Tuple[str, float, str]:
+        """
+        Wait for the decision header.
+
+        Returns:
+            Tuple of (response_type, priority, reasoning)
+
+        Raises:
+            Exception: The generation or parse error if the header never arrived
+        """
+        await self._header_ready.wait()
+        values = self._parser.values
+        if self.error is not None and "type" not in values:
+            raise self.error
+
+        response_type = str(values.get("type", "silent")).lower()
+        try:
+            priority = float(values.get("priority", 0.0))
+        except (TypeError, ValueError):
+            priority = 0.0
+        reasoning = values.get("reasoning", "No reasoning provided")
+        return response_type, priority, reasoning
+
+    async def fragments(self) -> AsyncIterator[Tuple[str, str]]:
+        """
+        Iterate over "dialogue" and "action" text as it arrives.
+
+        Yields:
+            Tuples of (field, fragment) until the stream ends
+        """
+        while True:
+            item = await self._fragments.get()
+            if item is None:
+                return
+            yield item
+
+    async def result(self) -> Tuple[str, float, str, Optional[str], Optional[str]]:
+        """
+        Wait for the full decision.
+
+        Returns:
+            Tuple of (response_type, priority, reasoning, dialogue, action),
+            shaped like CharacterManager.decide_turn_response()
+        """
+        response_type, priority, reasoning = await self.header()
+        await self._done.wait()
+        values = self._parser.values
+
+        if response_type == "speak":
+            dialogue = values.get("dialogue")
+            action = values.get("action")
+        elif response_type == "act":
+            dialogue = None
+            action = values.get("action")
+        else:
+            dialogue = None
+            action = None
+        return response_type, priority, reasoning, dialogue, action
+
+    async def _consume(self, chunks: AsyncIterator[str]) -> None:
+        """Feed streamed text through the parser and publish fragments."""
+        try:
+            async for chunk in chunks:
+                for key, fragment in self._parser.feed(chunk):
+                    if key in self.STREAMED_FIELDS:
+                        self._fragments.put_nowait((key, fragment))
+                if all(field in self._parser.values for field in self.HEADER_FIELDS):
+                    self._header_ready.set()
+            if "type" not in self._parser.values:
+                self.error = ValueError(f"No decision could be parsed for {self.character_name}")
+        except Exception as e:
+            self.error = e
+        finally:
+            self._header_ready.set()
+            self._done.set()
+            self._fragments.put_nowait(None)
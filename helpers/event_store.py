@@ -0,0 +1,257 @@
+"""
+Compact, column-oriented storage for timeline events.
+"""
+
+import sys
+import threading
+import uuid
+import weakref
+from array import array
+from collections import deque
+from collections.abc import Sequence
+from datetime import datetime, timezone
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
+
+# Kind code of events kept as objects (unregistered types, non-uuid ids, aware timestamps)
+_OPAQUE = 255
+_NO_SYMBOL = 0xFFFFFFFF
+
+
+class EventStore(Sequence):
+    """
+    An append-only list of timeline events stored as parallel arrays.
+
+    A Pydantic event costs several hundred bytes before its text: the model
+    instance, its __dict__ and fields-set, a uuid4 string and a datetime. The
+    store keeps one row per event instead:
+
+    - kind: index of the event class (1 byte)
+    - timestamp: float seconds (8 bytes)
+    - id: the uuid as 16 raw bytes
+    - up to two symbols (character names, locations, scene types) as indexes
+      into a table of interned strings (4 bytes each)
+    - up to two free-text fields (dialogue, descriptions) as plain references
+
+    An event's sequence number is its position in the store. Events are
+    turned back into their Pydantic classes only when read, so everything
+    outside the store keeps working with the regular models. Read events are
+    cached weakly: while any caller (a character's memory, an index, a pending
+    candidate) still holds one, reading that position returns the same object.
+    The most recent events, which every prompt reads, are also kept alive.
+
+    Event classes are registered with register(); events of other classes,
+    or whose id or timestamp cannot be stored compactly, are kept as objects.
+
+    The store is thread-safe: the turn loop and the caller's thread may append
+    and read at the same time, and a reader never sees half of a row.
+    """
+
+    # Event class -> (kind code, symbol fields, text fields)
+    _layouts: Dict[type, Tuple[int, Tuple[str, ...], Tuple[str, ...]]] = {}
+    _classes: List[type] = []
+
+    # Recent events kept as objects, so windows over the end of the timeline are not rebuilt
+    TAIL = 64
+
+    @classmethod
+    def register(cls, event_class: type, symbols: Tuple[str, ...] = (), texts: Tuple[str, ...] = ()) -> None:
+        """
+        Store events of a class compactly.
+
+        Args:
+            event_class: Pydantic event class (with timeline_id and timestamp fields)
+            symbols: Up to two short, often repeated string fields (e.g. "character")
+            texts: Up to two free-text string fields
+        """
+        if len(symbols) > 2 or len(texts) > 2:
+            raise ValueError("an event layout has at most two symbol and two text fields")
+        if event_class in cls._layouts:
+            return
+        cls._layouts[event_class] = (len(cls._classes), tuple(symbols), tuple(texts))
+        cls._classes.append(event_class)
+
+    def __init__(self, events: Optional[Iterable[Any]] = None):
+        """
+        Initialize an empty (or pre-filled) store.
+
+        Args:
+            events: Optional initial events
+        """
+        self._lock = threading.RLock()
+        self._reset()
+        if events is not None:
+            self.extend(events)
+
+    def _reset(self) -> None:
+        """Drop every event and symbol."""
+        self._kinds = array('B')
+        self._times = array('d')
+        self._ids = bytearray()
+        self._symbols = array('I')  # Two per event
+        self._texts: List[Optional[str]] = []  # Two per event
+        self._symbol_table: List[str] = []
+        self._symbol_codes: Dict[str, int] = {}
+        self._opaque: Dict[int, Any] = {}
+        self._live: "weakref.WeakValueDictionary[int, Any]" = weakref.WeakValueDictionary()
+        self._tail: deque = deque(maxlen=self.TAIL)
+
+    # ========== Writing ==========
+
+    def append(self, event: Any) -> None:
+        """Add an event at the end of the store."""
+        layout = self._layouts.get(type(event))
+        with self._lock:
+            position = len(self._kinds)
+            row = self._compact(event, layout) if layout is not None else None
+
+            # The kind column is written last: its length is the store's length
+            if row is None:
+                self._times.append(0.0)
+                self._ids.extend(bytes(16))
+                self._symbols.extend((_NO_SYMBOL, _NO_SYMBOL))
+                self._texts.extend((None, None))
+                self._opaque[position] = event
+                self._kinds.append(_OPAQUE)
+                return
+
+            kind, timestamp, id_bytes, symbols, texts = row
+            self._times.append(timestamp)
+            self._ids.extend(id_bytes)
+            self._symbols.extend(symbols)
+            self._texts.extend(texts)
+            self._live[position] = event
+            self._tail.append(event)
+            self._kinds.append(kind)
+
+    def extend(self, events: Iterable[Any]) -> None:
+        """Add several events in order (as one batch for concurrent readers)."""
+        with self._lock:
+            for event in events:
+                self.append(event)
+
+    def clear(self) -> None:
+        """Remove every event."""
+        with self._lock:
+            self._reset()
+
+    def _compact(self, event: Any, layout: Tuple[int, Tuple[str, ...], Tuple[str, ...]]) -> Optional[tuple]:
+        """Get the row for an event, or None if it has to be kept as an object."""
+        kind, symbol_fields, text_fields = layout
+        timestamp = event.timestamp
+        if timestamp.tzinfo is not None:
+            return None
+        try:
+            event_uuid = uuid.UUID(event.timeline_id)
+        except (ValueError, TypeError, AttributeError):
+            return None
+        if str(event_uuid) != event.timeline_id:
+            return None
+
+        symbols = [_NO_SYMBOL, _NO_SYMBOL]
+        for slot, field in enumerate(symbol_fields):
+            value = getattr(event, field)
+            if type(value) is not str:
+                return None
+            symbols[slot] = self._symbol_code(value)
+        texts: List[Optional[str]] = [None, None]
+        for slot, field in enumerate(text_fields):
+            texts[slot] = getattr(event, field)
+
+        # Naive timestamps are stored as if they were UTC, so no local-time conversion can shift them
+        seconds = timestamp.replace(tzinfo=timezone.utc).timestamp()
+        return kind, seconds, event_uuid.bytes, symbols, texts
+
+    def _symbol_code(self, value: str) -> int:
+        """Get the table index of a symbol, interning it on first use."""
+        code = self._symbol_codes.get(value)
+        if code is None:
+            code = len(self._symbol_table)
+            value = sys.intern(value)
+            self._symbol_table.append(value)
+            self._symbol_codes[value] = code
+        return code
+
+    # ========== Reading ==========
+
+    def __len__(self) -> int:
+        return len(self._kinds)
+
+    def __iter__(self) -> Iterator[Any]:
+        # Events appended during iteration are included, like iterating a list
+        position = 0
+        while True:
+            with self._lock:
+                if position >= len(self._kinds):
+                    return
+                event = self._build_event(position)
+            yield event
+            position += 1
+
+    def __getitem__(self, position):
+        with self._lock:
+            if isinstance(position, slice):
+                return [self._event_at(i) for i in range(*position.indices(len(self._kinds)))]
+
+            if position < 0:
+                position += len(self._kinds)
+            if not 0 <= position < len(self._kinds):
+                raise IndexError("event index out of range")
+            return self._event_at(position)
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, (EventStore, list, tuple)):
+            return len(self) == len(other) and all(a == b for a, b in zip(self, other))
+        return NotImplemented
+
+    def __repr__(self) -> str:
+        return f"EventStore({len(self)} events)"
+
+    def _event_at(self, position: int) -> Any:
+        """Get the event at a (non-negative) position, building it if no live copy exists."""
+        with self._lock:
+            return self._build_event(position)
+
+    def _build_event(self, position: int) -> Any:
+        """Get or build the event at a position (with the lock held)."""
+        event = self._live.get(position)
+        if event is not None:
+            return event
+        kind = self._kinds[position]
+        if kind == _OPAQUE:
+            return self._opaque[position]
+
+        event_class = self._classes[kind]
+        _, symbol_fields, text_fields = self._layouts[event_class]
+        fields: Dict[str, Any] = {
+            "timeline_id": str(uuid.UUID(bytes=bytes(self._ids[position * 16:position * 16 + 16]))),
+            "timestamp": datetime.fromtimestamp(self._times[position], timezone.utc).replace(tzinfo=None),
+        }
+        for slot, field in enumerate(symbol_fields):
+            fields[field] = self._symbol_table[self._symbols[position * 2 + slot]]
+        for slot, field in enumerate(text_fields):
+            fields[field] = self._texts[position * 2 + slot]
+
+        # Rows were validated when they were first stored
+        event = event_class.model_construct(**fields)
+        self._live[position] = event
+        return event
+
+    # ========== Pydantic integration ==========
+
+    @classmethod
+    def __get_pydantic_core_schema__(cls, source_type: Any, handler: Any) -> Any:
+        """Accept a store or any iterable of events as a model field; dump as a list."""
+        from pydantic_core import core_schema
+
+        return core_schema.no_info_plain_validator_function(
+            cls._validate,
+            serialization=core_schema.plain_serializer_function_ser_schema(list)
+        )
+
+    @classmethod
+    def _validate(cls, value: Any) -> "EventStore":
+        if isinstance(value, EventStore):
+            return value
+        if isinstance(value, (str, bytes, dict)) or not isinstance(value, Iterable):
+            raise ValueError("events must be a list of timeline events")
+        return cls(value)
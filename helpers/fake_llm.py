@@ -0,0 +1,385 @@
+"""
+Offline stand-in for the OpenRouter chat-completions API.
+
+Selected with Config.LLM_BACKEND = "fake". FakeLLMClient has the part of the
+AsyncOpenAI surface the system uses (chat.completions.create, streaming and
+close) and answers every prompt the managers send - character decisions, bids
+and responses, scene decisions and scenes, movements, the director, the judge and summaries -
+with JSON in the format that prompt asks for. Latency is drawn from a
+log-normal distribution, so runs can be tuned to resemble a real provider.
+"""
+
+import asyncio
+import json
+import math
+import random
+import re
+import time
+import uuid
+from typing import Any, Callable, Dict, List, Optional
+
+from openai.types import CompletionUsage
+from openai.types.chat import ChatCompletion, ChatCompletionChunk
+
+_WORD_RE = re.compile(r"[A-Za-z][a-z']{3,}")
+
+_LOCATIONS = [
+    "The Captain's Cabin", "The Crow's Nest", "The Cargo Hold", "Smuggler's Cove",
+    "The Harbor Tavern", "The Gun Deck", "A Hidden Grotto", "The Galley",
+]
+
+_BODY_LANGUAGE = [
+    "leans forward eagerly", "crosses arms and frowns", "glances at the horizon",
+    "taps the map with a finger", "grins and rests a hand on the railing",
+    "lowers voice and looks around", "raises an eyebrow", "shrugs and paces the deck",
+]
+
+
+def estimate_tokens(text: str) -> int:
+    """Rough token count of a text (4 characters per token)."""
+    return max(len(text) // 4, 1)
+
+
+def lognormal_latency(median: float, sigma: float, rng: random.Random) -> float:
+    """
+    Draw a latency from a log-normal distribution.
+
+    Args:
+        median: Median latency in seconds (0 for none)
+        sigma: Spread (standard deviation of the log); 0 always returns the median
+        rng: Random source
+
+    Returns:
+        Latency in seconds
+    """
+    if median <= 0:
+        return 0.0
+    if sigma <= 0:
+        return median
+    return median * math.exp(rng.gauss(0.0, sigma))
+
+
+class _FakeCompletions:
+    """chat.completions of FakeLLMClient."""
+
+    def __init__(self, client: "FakeLLMClient"):
+        self._client = client
+
+    async def create(self, *, model: str, messages: List[Dict[str, Any]], stream: bool = False, **kwargs) -> Any:
+        include_usage = bool((kwargs.get("stream_options") or {}).get("include_usage"))
+        return await self._client._create(model, messages, stream, kwargs.get("max_tokens"), include_usage)
+
+
+class _FakeChat:
+    def __init__(self, client: "FakeLLMClient"):
+        self.completions = _FakeCompletions(client)
+
+
+class _FakeStream:
+    """Async iterator of ChatCompletionChunk objects, like the SDK's AsyncStream."""
+
+    def __init__(self, chunks: List[ChatCompletionChunk], token_delay: float):
+        self._chunks = chunks
+        self._token_delay = token_delay
+        self._closed = False
+
+    def __aiter__(self):
+        return self._iterate()
+
+    async def _iterate(self):
+        for chunk in self._chunks:
+            if self._closed:
+                return
+            if self._token_delay:
+                content = chunk.choices[0].delta.content if chunk.choices else ""
+                await asyncio.sleep(self._token_delay * estimate_tokens(content or ""))
+            yield chunk
+
+    async def close(self) -> None:
+        self._closed = True
+
+
+class FakeLLMClient:
+    """
+    Local stand-in for AsyncOpenAI that needs no API key or network.
+
+    Counts calls and tokens, which stats() reports.
+    """
+
+    def __init__(
+        self,
+        latency_median: float = 0.0,
+        latency_sigma: float = 0.5,
+        token_delay: float = 0.0,
+        seed: Optional[int] = None,
+        scene_probability: float = 0.1,
+        movement_probability: float = 0.1,
+        latency: Optional[Callable[[str], float]] = None
+    ):
+        """
+        Initialize the fake client.
+
+        Args:
+            latency_median: Median seconds before a completion starts
+            latency_sigma: Log-normal spread of that latency
+            token_delay: Seconds per generated token (streams arrive gradually)
+            seed: Seed for the generated content and latencies
+            scene_probability: Chance that a scene decision generates a scene
+            movement_probability: Chance that a movement decision moves a character
+            latency: Optional function (prompt kind) -> seconds replacing the log-normal draw
+        """
+        self.latency_median = latency_median
+        self.latency_sigma = latency_sigma
+        self.token_delay = token_delay
+        self.scene_probability = scene_probability
+        self.movement_probability = movement_probability
+        self._latency = latency
+        self._rng = random.Random(seed)
+        self.chat = _FakeChat(self)
+        self.calls: Dict[str, int] = {}
+        self.prompt_tokens = 0
+        self.completion_tokens = 0
+
+    def stats(self) -> Dict[str, Any]:
+        """Get the number of calls per prompt kind and the total tokens."""
+        return {
+            "calls": sum(self.calls.values()),
+            "calls_by_kind": dict(self.calls),
+            "prompt_tokens": self.prompt_tokens,
+            "completion_tokens": self.completion_tokens,
+        }
+
+    async def close(self) -> None:
+        pass
+
+    async def _create(
+        self,
+        model: str,
+        messages: List[Dict[str, Any]],
+        stream: bool,
+        max_tokens: Optional[int],
+        include_usage: bool = False
+    ) -> Any:
+        system = "\n".join(_message_text(m) for m in messages if m["role"] == "system")
+        prompt = "\n".join(_message_text(m) for m in messages if m["role"] != "system")
+        kind = classify_prompt(system, prompt)
+        text = json.dumps(self._respond(kind, system, prompt))
+
+        prompt_tokens = estimate_tokens(system + prompt)
+        completion_tokens = estimate_tokens(text)
+        if max_tokens:
+            completion_tokens = min(completion_tokens, max_tokens)
+        self.calls[kind] = self.calls.get(kind, 0) + 1
+        self.prompt_tokens += prompt_tokens
+        self.completion_tokens += completion_tokens
+
+        latency = self._latency(kind) if self._latency else lognormal_latency(
+            self.latency_median, self.latency_sigma, self._rng
+        )
+        if latency:
+            await asyncio.sleep(latency)
+
+        completion_id = f"fake-{uuid.uuid4().hex[:12]}"
+        created = int(time.time())
+        usage = CompletionUsage(
+            prompt_tokens=prompt_tokens, completion_tokens=completion_tokens,
+            total_tokens=prompt_tokens + completion_tokens
+        )
+        if stream:
+            chunks = [
+                ChatCompletionChunk(
+                    id=completion_id, created=created, model=model, object="chat.completion.chunk",
+                    choices=[{"index": 0, "delta": {"role": "assistant", "content": text[i:i + 16]}}]
+                )
+                for i in range(0, len(text), 16)
+            ]
+            if include_usage:
+                # Like the API, the usage comes in a last chunk without choices
+                chunks.append(ChatCompletionChunk(
+                    id=completion_id, created=created, model=model, object="chat.completion.chunk",
+                    choices=[], usage=usage
+                ))
+            return _FakeStream(chunks, self.token_delay)
+
+        if self.token_delay:
+            await asyncio.sleep(self.token_delay * completion_tokens)
+        return ChatCompletion(
+            id=completion_id, created=created, model=model, object="chat.completion",
+            choices=[{
+                "index": 0, "finish_reason": "stop",
+                "message": {"role": "assistant", "content": text}
+            }],
+            usage=usage
+        )
+
+    def _respond(self, kind: str, system: str, prompt: str) -> Dict[str, Any]:
+        """Build the JSON answer for a prompt kind."""
+        rng = self._rng
+        if kind == "summary":
+            return {"summary": self._sentence(prompt, 30)}
+
+        if kind == "scene_decision":
+            return self._scene_decision(prompt)
+
+        if kind == "scene":
+            location = _field(prompt, "Current Location") or "Unknown"
+            if "SCENE TRANSITION" in prompt:
+                location = rng.choice([name for name in _LOCATIONS if name != location])
+            return {"location": location, "event_description": self._sentence(prompt, 40)}
+
+        if kind == "movement":
+            return self._movements(prompt)
+
+        if kind == "director":
+            return {**self._scene_decision(prompt), **self._movements(prompt)}
+
+        if kind == "judge":
+            names = re.findall(r"^\s*- ([^:\n]+): Traits:", prompt, re.MULTILINE)
+            first = "You are assigning objectives" in prompt
+            updates = {}
+            for name in names:
+                status = "assigned" if first else ("completed" if rng.random() < 0.1 else "continuing")
+                updates[name] = {
+                    "objective": self._sentence(prompt, 12),
+                    "status": status,
+                    "reasoning": self._sentence(prompt, 10),
+                }
+            return {
+                "character_updates": updates,
+                "story_objective_complete": not first and rng.random() < 0.05,
+                "reasoning": self._sentence(prompt, 12),
+            }
+
+        if kind == "speak":
+            return {"dialogue": self._sentence(prompt, rng.randint(25, 70)), "action": rng.choice(_BODY_LANGUAGE)}
+        if kind == "act":
+            return {"action": rng.choice(_BODY_LANGUAGE)}
+
+        # Decisions and bids
+        response_type = rng.choices(["speak", "act", "silent"], weights=[0.6, 0.2, 0.2])[0]
+        decision = {
+            "type": response_type,
+            "priority": 0.0 if response_type == "silent" else round(rng.random(), 2),
+            "reasoning": self._sentence(prompt, 12),
+        }
+        if kind == "decision":
+            if response_type == "speak":
+                decision["dialogue"] = self._sentence(prompt, rng.randint(25, 70))
+                decision["action"] = rng.choice(_BODY_LANGUAGE)
+            elif response_type == "act":
+                decision["action"] = rng.choice(_BODY_LANGUAGE)
+        return decision
+
+    def _scene_decision(self, prompt: str) -> Dict[str, Any]:
+        """Decide whether a scene is generated, like the scene decision prompt asks."""
+        rng = self._rng
+        if rng.random() >= self.scene_probability:
+            return {"scene_generated": False}
+        scene_type = rng.choice(["transition", "environmental"])
+        location = rng.choice(_LOCATIONS) if scene_type == "transition" else _field(prompt, "Current Location")
+        return {
+            "scene_generated": True,
+            "scene_type": scene_type,
+            "location": location or "Unknown",
+            "event_description": self._sentence(prompt, 40),
+        }
+
+    def _movements(self, prompt: str) -> Dict[str, Any]:
+        """Decide entries and exits, like the movement prompt asks."""
+        rng = self._rng
+        present = _names(_field(prompt, "Currently Present"))
+        absent = _names(_field(prompt, "Absent Characters"))
+        entries, exits = [], []
+        if rng.random() < self.movement_probability:
+            if absent and (len(present) <= 2 or rng.random() < 0.5):
+                name = rng.choice(absent)
+                entries.append({"character": name, "description": f"{name} steps in. " + self._sentence(prompt, 25)})
+            elif len(present) > 2:
+                name = rng.choice(present)
+                exits.append({"character": name, "description": f"{name} heads for the door and leaves."})
+        return {"entries": entries, "exits": exits}
+
+    def _sentence(self, prompt: str, words: int) -> str:
+        """Make up text of the given length from words of the prompt."""
+        vocabulary = _WORD_RE.findall(prompt[-4000:]) or ["ahoy"]
+        return " ".join(self._rng.choice(vocabulary) for _ in range(words)).capitalize() + "."
+
+
+def classify_prompt(system: str, prompt: str) -> str:
+    """
+    Work out which manager call a prompt belongs to.
+
+    Returns:
+        One of "summary", "director", "scene_decision", "scene", "movement", "judge",
+        "bid", "speak", "act" or "decision"
+    """
+    if "You are summarizing" in prompt or "You are condensing consecutive summaries" in prompt:
+        return "summary"
+    if "You are the director of this roleplay story" in prompt:
+        return "director"
+    if "decide whether a SCENE EVENT should be generated" in prompt:
+        return "scene_decision"
+    if "SCENE TRANSITION" in prompt or "ENVIRONMENTAL SCENE EVENT" in prompt:
+        return "scene"
+    if "meta-narrator" in prompt:
+        return "movement"
+    if "character_updates" in prompt:
+        return "judge"
+    if "Do NOT write the response itself yet" in prompt:
+        return "bid"
+    if "You have decided to SPEAK" in prompt:
+        return "speak"
+    if "You have decided to ACT" in prompt:
+        return "act"
+    return "decision"
+
+
+def _message_text(message: Dict[str, Any]) -> str:
+    content = message["content"]
+    if isinstance(content, list):
+        return "".join(part.get("text", "") for part in content)
+    return content
+
+
+def _field(prompt: str, label: str) -> Optional[str]:
+    """Value of a 'Label: value' line of a prompt."""
+    match = re.search(rf"^\s*{re.escape(label)}: (.+)$", prompt, re.MULTILINE)
+    return match.group(1).strip() if match else None
+
+
+def _names(listing: Optional[str]) -> List[str]:
+    """Names of a comma-separated listing ('None' for none)."""
+    if not listing or listing == "None":
+        return []
+    return [name.strip() for name in listing.split(",") if name.strip()]
+
+
+_client: Optional[FakeLLMClient] = None
+
+
+def get_fake_client() -> FakeLLMClient:
+    """
+    Get the process-wide fake client configured by Config.FAKE_*.
+
+    Returns:
+        The shared FakeLLMClient
+    """
+    global _client
+    from config import Config
+
+    if _client is None:
+        _client = FakeLLMClient(
+            latency_median=Config.FAKE_LATENCY_MEDIAN,
+            latency_sigma=Config.FAKE_LATENCY_SIGMA,
+            token_delay=Config.FAKE_TOKEN_DELAY,
+            seed=Config.FAKE_SEED,
+            scene_probability=Config.FAKE_SCENE_PROBABILITY,
+            movement_probability=Config.FAKE_MOVEMENT_PROBABILITY
+        )
+    return _client
+
+
+def reset_fake_client(client: Optional[FakeLLMClient] = None) -> None:
+    """Replace the shared fake client (None rebuilds it from Config on next use)."""
+    global _client
+    _client = client
@@ -0,0 +1,287 @@
+"""
+Content-addressed cache of LLM completions.
+
+Requests are keyed by a hash of the model, the messages and the sampling
+parameters. The cache runs in one of these modes (Config.LLM_CACHE_MODE):
+- "off": no caching
+- "cache": identical requests are answered from the cache (subject to TTL and
+  size eviction), so repeated judge and scene prompts are only paid for once
+- "record": every completion of the session is stored and kept
+- "replay": completions are served from a recording without network access;
+  a request that was never recorded raises CacheMissError
+
+Recordings number repeated identical requests (first, second, ... occurrence),
+so a replayed session gets back exactly what the recorded one saw.
+"""
+
+import hashlib
+import json
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Dict, Optional, Tuple
+
+CACHE_MODES = ("off", "cache", "record", "replay")
+
+# Request fields that determine the completion
+_KEY_FIELDS = ("model", "messages", "temperature", "max_tokens", "top_p", "frequency_penalty")
+
+
+class CacheMissError(Exception):
+    """Replay mode has no recorded completion for a request."""
+
+
+def request_key(params: Dict[str, Any]) -> str:
+    """
+    Get the content address of a chat-completions request.
+
+    Args:
+        params: Request parameters (model, messages and sampling parameters)
+
+    Returns:
+        Hex SHA-256 of the canonical JSON of the fields that determine the completion
+    """
+    material = {field: params.get(field) for field in _KEY_FIELDS}
+    encoded = json.dumps(material, sort_keys=True, ensure_ascii=False, separators=(",", ":"))
+    return hashlib.sha256(encoded.encode("utf-8")).hexdigest()
+
+
+class MemoryCacheBackend:
+    """In-process LRU store with optional TTL."""
+
+    def __init__(self, max_entries: int = 10000, ttl: float = 0):
+        """
+        Initialize an empty store.
+
+        Args:
+            max_entries: Unpinned entries kept before the least recently used are evicted
+            ttl: Seconds an unpinned entry stays valid (0 keeps it until evicted)
+        """
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self._entries: "OrderedDict[str, Tuple[str, float, bool]]" = OrderedDict()
+        self._unpinned = 0
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> Optional[str]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            text, created, pinned = entry
+            if not pinned and self.ttl and time.time() - created > self.ttl:
+                del self._entries[key]
+                self._unpinned -= 1
+                return None
+            self._entries.move_to_end(key)
+            return text
+
+    def put(self, key: str, model: str, text: str, pinned: bool = False) -> None:
+        with self._lock:
+            old = self._entries.pop(key, None)
+            if old is not None and not old[2]:
+                self._unpinned -= 1
+            self._entries[key] = (text, time.time(), pinned)
+            if not pinned:
+                self._unpinned += 1
+            if self._unpinned > self.max_entries:
+                for old_key in list(self._entries):
+                    if self._unpinned <= self.max_entries:
+                        break
+                    if not self._entries[old_key][2]:
+                        del self._entries[old_key]
+                        self._unpinned -= 1
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._unpinned = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+class SQLiteCacheBackend:
+    """On-disk store in a SQLite file, shared between runs."""
+
+    def __init__(self, path: str, max_entries: int = 10000, ttl: float = 0):
+        """
+        Open (or create) the store.
+
+        Args:
+            path: SQLite database file
+            max_entries: Unpinned entries kept before the least recently used are evicted
+            ttl: Seconds an unpinned entry stays valid (0 keeps it until evicted)
+        """
+        self.path = Path(path)
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self._lock = threading.Lock()
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._db = sqlite3.connect(str(self.path), check_same_thread=False, isolation_level=None)
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.execute(
+            "CREATE TABLE IF NOT EXISTS completions ("
+            " key TEXT PRIMARY KEY, model TEXT, text TEXT NOT NULL,"
+            " created REAL NOT NULL, accessed REAL NOT NULL, pinned INTEGER NOT NULL)"
+        )
+        self._db.execute("CREATE INDEX IF NOT EXISTS completions_lru ON completions (pinned, accessed)")
+
+    def get(self, key: str) -> Optional[str]:
+        with self._lock:
+            row = self._db.execute(
+                "SELECT text, created, pinned FROM completions WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None:
+                return None
+            text, created, pinned = row
+            now = time.time()
+            if not pinned and self.ttl and now - created > self.ttl:
+                self._db.execute("DELETE FROM completions WHERE key = ?", (key,))
+                return None
+            self._db.execute("UPDATE completions SET accessed = ? WHERE key = ?", (now, key))
+            return text
+
+    def put(self, key: str, model: str, text: str, pinned: bool = False) -> None:
+        with self._lock:
+            now = time.time()
+            self._db.execute(
+                "INSERT OR REPLACE INTO completions (key, model, text, created, accessed, pinned)"
+                " VALUES (?, ?, ?, ?, ?, ?)",
+                (key, model, text, now, now, int(pinned))
+            )
+            if not pinned:
+                self._db.execute(
+                    "DELETE FROM completions WHERE key IN ("
+                    " SELECT key FROM completions WHERE pinned = 0"
+                    " ORDER BY accessed DESC LIMIT -1 OFFSET ?)",
+                    (self.max_entries,)
+                )
+
+    def clear(self) -> None:
+        with self._lock:
+            self._db.execute("DELETE FROM completions")
+
+    def close(self) -> None:
+        with self._lock:
+            self._db.close()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._db.execute("SELECT COUNT(*) FROM completions").fetchone()[0]
+
+
+class ResponseCache:
+    """Applies a cache mode on top of a storage backend."""
+
+    def __init__(self, backend: Any, mode: str = "cache"):
+        """
+        Initialize the cache.
+
+        Args:
+            backend: MemoryCacheBackend or SQLiteCacheBackend
+            mode: "cache", "record" or "replay"
+
+        Raises:
+            ValueError: If the mode is unknown
+        """
+        if mode not in CACHE_MODES or mode == "off":
+            raise ValueError(f"Unknown LLM cache mode: {mode!r}")
+        self.backend = backend
+        self.mode = mode
+        self.hits = 0
+        self.misses = 0
+        self._occurrences: Dict[str, int] = {}
+        self._lock = threading.Lock()
+
+    def lookup(self, params: Dict[str, Any]) -> Tuple[str, Optional[str]]:
+        """
+        Look a request up.
+
+        Args:
+            params: Request parameters
+
+        Returns:
+            Tuple of (slot, cached text or None); pass the slot to store() once
+            the completion is known
+
+        Raises:
+            CacheMissError: In replay mode, if the request was never recorded
+        """
+        key = request_key(params)
+        if self.mode == "cache":
+            text = self.backend.get(key)
+            self._count(text is not None)
+            return key, text
+
+        with self._lock:
+            occurrence = self._occurrences.get(key, 0)
+            self._occurrences[key] = occurrence + 1
+        slot = f"{key}#{occurrence}"
+        if self.mode == "record":
+            return slot, None
+
+        # Replay: the same occurrence, or the latest one recorded before it
+        for earlier in range(occurrence, -1, -1):
+            text = self.backend.get(f"{key}#{earlier}")
+            if text is not None:
+                self._count(True)
+                return slot, text
+        self._count(False)
+        raise CacheMissError(f"No recorded completion for request {key[:12]} (occurrence {occurrence})")
+
+    def store(self, slot: str, model: str, text: str) -> None:
+        """Store a completion under the slot returned by lookup()."""
+        if self.mode == "replay":
+            return
+        # Recordings are kept regardless of TTL and size limits
+        self.backend.put(slot, model, text, pinned=self.mode == "record")
+
+    def stats(self) -> Dict[str, Any]:
+        """Get the mode, hit and miss counts and number of stored entries."""
+        return {"mode": self.mode, "hits": self.hits, "misses": self.misses, "entries": len(self.backend)}
+
+    def _count(self, hit: bool) -> None:
+        with self._lock:
+            if hit:
+                self.hits += 1
+            else:
+                self.misses += 1
+
+
+_cache: Optional[ResponseCache] = None
+_cache_config: Optional[Tuple[Any, ...]] = None
+_cache_lock = threading.Lock()
+
+
+def get_response_cache() -> Optional[ResponseCache]:
+    """
+    Get the process-wide response cache configured by Config.LLM_CACHE_*.
+
+    Returns:
+        The shared ResponseCache, or None when caching is off
+    """
+    global _cache, _cache_config
+    from config import Config
+
+    config = (
+        Config.LLM_CACHE_MODE, Config.LLM_CACHE_BACKEND, Config.LLM_CACHE_PATH,
+        Config.LLM_CACHE_MAX_ENTRIES, Config.LLM_CACHE_TTL
+    )
+    if config[0] == "off":
+        return None
+
+    with _cache_lock:
+        if _cache is None or _cache_config != config:
+            mode, backend_name, path, max_entries, ttl = config
+            if backend_name == "sqlite":
+                backend = SQLiteCacheBackend(path, max_entries=max_entries, ttl=ttl)
+            elif backend_name == "memory":
+                backend = MemoryCacheBackend(max_entries=max_entries, ttl=ttl)
+            else:
+                raise ValueError(f"Unknown LLM cache backend: {backend_name!r}")
+            _cache = ResponseCache(backend, mode)
+            _cache_config = config
+        return _cache
@@ -0,0 +1,205 @@
+"""
+Vector index over a character's memory, for recalling relevant older events.
+
+Runs fully offline. Events are embedded with a hashed bag-of-words (unigrams and
+bigrams hashed into a fixed number of buckets, weighted by IDF at query time)
+unless a local sentence-transformers model is configured and installed.
+"""
+
+import math
+import re
+import zlib
+from typing import Any, Callable, Dict, List, Optional, Sequence
+
+import numpy as np
+
+_TOKEN_RE = re.compile(r"[a-z0-9']+")
+
+# Words too common to say anything about what an event is about
+_STOPWORDS = frozenset("""
+a an and are as at be but by for from had has have he her here him his i if in into is it its
+me my no not of on or our she so that the their them then there they this to was we were what
+when where which who will with you your yours i'm it's don't just like very can
+""".split())
+
+
+def tokenize(text: str) -> List[str]:
+    """Lowercase words of a text, without stopwords."""
+    return [token for token in _TOKEN_RE.findall(text.lower()) if token not in _STOPWORDS]
+
+
+def hashed_bow_vector(text: str, dim: int) -> np.ndarray:
+    """
+    Embed a text as a hashed bag of unigrams and bigrams.
+
+    Args:
+        text: Text to embed
+        dim: Number of hash buckets
+
+    Returns:
+        Vector of log-scaled term counts (not normalized)
+    """
+    tokens = tokenize(text)
+    features = tokens + [f"{a} {b}" for a, b in zip(tokens, tokens[1:])]
+    vector = np.zeros(dim, dtype=np.float32)
+    for feature in features:
+        # crc32 is stable across runs, unlike hash()
+        vector[zlib.crc32(feature.encode("utf-8")) % dim] += 1.0
+    np.log1p(vector, out=vector)
+    return vector
+
+
+_embedders: Dict[str, Optional[Callable[[List[str]], np.ndarray]]] = {}
+
+
+def load_embedder(model_name: Optional[str]) -> Optional[Callable[[List[str]], np.ndarray]]:
+    """
+    Load a local sentence-transformers model as an embedding function.
+
+    Args:
+        model_name: Model name or local path (None for the hashed bag-of-words)
+
+    Returns:
+        Function (texts) -> normalized embeddings, or None if no model is configured
+        or sentence-transformers is not installed
+    """
+    if not model_name:
+        return None
+    if model_name not in _embedders:
+        try:
+            from sentence_transformers import SentenceTransformer
+            model = SentenceTransformer(model_name, device="cpu")
+            _embedders[model_name] = lambda texts: np.asarray(
+                model.encode(texts, normalize_embeddings=True), dtype=np.float32
+            )
+        except Exception as e:
+            print(f"⚠️  Could not load embedding model '{model_name}' ({e}); using hashed bag-of-words")
+            _embedders[model_name] = None
+    return _embedders[model_name]
+
+
+class MemoryIndex:
+    """
+    Incrementally built vector index over an append-only sequence of events.
+
+    Rows are added for events appended since the last sync(); if the sequence was
+    cleared or replaced the index is rebuilt. search() returns the positions of the
+    events most similar to a query text.
+    """
+
+    def __init__(self, dim: int = 1024, embed: Optional[Callable[[List[str]], np.ndarray]] = None):
+        """
+        Initialize an empty index.
+
+        Args:
+            dim: Hash buckets for the bag-of-words embedding
+            embed: Optional function (texts) -> normalized embeddings replacing the bag-of-words
+        """
+        self.dim = dim
+        self._embed = embed
+        self._matrix: Optional[np.ndarray] = None  # Rows beyond _count are spare capacity
+        self._document_frequency = np.zeros(dim, dtype=np.float32)
+        self._count = 0
+        self._last_indexed: Any = None
+
+    def __len__(self) -> int:
+        return self._count
+
+    def sync(
+        self,
+        events: Sequence[Any],
+        render: Callable[[Any], Optional[str]],
+        end: Optional[int] = None
+    ) -> int:
+        """
+        Index events appended since the last call.
+
+        Args:
+            events: The indexed sequence (e.g. CharacterMemory.event)
+            render: Function event -> text to embed (None embeds as empty)
+            end: Only index events before this position (None for all of them)
+
+        Returns:
+            Number of events added to the index
+        """
+        count = self._count
+        if count and (len(events) < count or events[count - 1] is not self._last_indexed):
+            self.clear()
+            count = 0
+        end = len(events) if end is None else min(end, len(events))
+        if end <= count:
+            return 0
+
+        new_events = events[count:end]
+        texts = [render(event) or "" for event in new_events]
+        if self._embed is not None:
+            rows = self._embed(texts)
+        else:
+            rows = np.stack([hashed_bow_vector(text, self.dim) for text in texts])
+            self._document_frequency += (rows > 0).sum(axis=0)
+
+        self._append_rows(rows)
+        self._last_indexed = new_events[-1]
+        return len(new_events)
+
+    def search(
+        self,
+        query: str,
+        k: int,
+        before: Optional[int] = None,
+        min_score: float = 0.0
+    ) -> List[int]:
+        """
+        Find the events most similar to a query by cosine similarity.
+
+        Args:
+            query: Text to match (e.g. the recent conversation)
+            k: Maximum number of results
+            before: Only consider positions below this (e.g. to skip the recent window)
+            min_score: Minimum cosine similarity of a result
+
+        Returns:
+            Matching positions in chronological order
+        """
+        limit = self._count if before is None else max(min(before, self._count), 0)
+        if limit == 0 or k <= 0 or not query.strip():
+            return []
+
+        rows = self._matrix[:limit]
+        if self._embed is not None:
+            query_vector = self._embed([query])[0]
+            scores = rows @ query_vector
+        else:
+            # IDF weighting so rare words (names, places, objects) dominate the match
+            idf = np.log((self._count + 1.0) / (self._document_frequency + 1.0)) + 1.0
+            query_vector = hashed_bow_vector(query, self.dim) * idf
+            query_norm = float(np.linalg.norm(query_vector))
+            if query_norm == 0.0:
+                return []
+            weighted = rows * idf
+            norms = np.linalg.norm(weighted, axis=1)
+            norms[norms == 0.0] = math.inf
+            scores = (weighted @ query_vector) / (norms * query_norm)
+
+        k = min(k, limit)
+        top = np.argpartition(-scores, k - 1)[:k]
+        return sorted(int(position) for position in top if scores[position] >= min_score)
+
+    def clear(self) -> None:
+        """Forget every indexed event."""
+        self._matrix = None
+        self._document_frequency = np.zeros(self.dim, dtype=np.float32)
+        self._count = 0
+        self._last_indexed = None
+
+    def _append_rows(self, rows: np.ndarray) -> None:
+        """Append embedding rows, growing the matrix geometrically."""
+        needed = self._count + len(rows)
+        if self._matrix is None or needed > len(self._matrix):
+            capacity = max(needed, 2 * (0 if self._matrix is None else len(self._matrix)), 64)
+            matrix = np.zeros((capacity, rows.shape[1]), dtype=np.float32)
+            if self._matrix is not None:
+                matrix[:self._count] = self._matrix[:self._count]
+            self._matrix = matrix
+        self._matrix[self._count:needed] = rows
+        self._count = needed
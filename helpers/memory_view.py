@@ -0,0 +1,130 @@
+"""
+List-like view of the timeline events a character witnessed.
+"""
+
+from bisect import bisect_right
+from collections.abc import Sequence
+from typing import Any, Iterable, Iterator, List, Optional
+
+
+class MemoryView(Sequence):
+    """
+    A character's memory stored as ranges over shared event lists.
+
+    Instead of holding its own reference to every event, a view keeps a short
+    list of (source, start, end) ranges, where source is usually the shared
+    timeline's event list. A character that stays in the scene for the whole
+    conversation needs a single range however long the conversation gets.
+
+    Events that are not in the bound timeline are kept in a small private
+    list, so the view behaves like a plain list of events for any caller.
+    """
+
+    # Events just broadcast are at the end of the timeline; look back this far before giving up
+    LOOKBACK = 32
+
+    def __init__(self, events: Optional[Iterable[Any]] = None):
+        """
+        Initialize an empty (or pre-filled) view.
+
+        Args:
+            events: Optional initial events
+        """
+        self._timeline_events: Optional[List[Any]] = None
+        self._extra: List[Any] = []
+        self._ranges: List[List[Any]] = []  # [source, start, end] in memory order
+        self._offsets: List[int] = []  # Memory position where each range starts
+        self._length = 0
+        if events is not None:
+            self.extend(events)
+
+    def bind(self, timeline_events: List[Any]) -> None:
+        """
+        Back future appends by the given event list (normally TimelineHistory.events).
+
+        Args:
+            timeline_events: The shared, append-only list of timeline events
+        """
+        self._timeline_events = timeline_events
+
+    def append(self, event: Any) -> None:
+        """Add an event, as a reference into the timeline when possible."""
+        events = self._timeline_events
+        if events is not None:
+            last = len(events) - 1
+            for index in range(last, max(last - self.LOOKBACK, -1), -1):
+                if events[index] is event:
+                    self.add_range(events, index, index + 1)
+                    return
+
+        self._extra.append(event)
+        self.add_range(self._extra, len(self._extra) - 1, len(self._extra))
+
+    def extend(self, events: Iterable[Any]) -> None:
+        """Add several events in order."""
+        for event in events:
+            self.append(event)
+
+    def add_range(self, source: List[Any], start: int, end: Optional[int] = None) -> None:
+        """
+        Add source[start:end] to the memory without copying it.
+
+        Args:
+            source: List the events live in (e.g. TimelineHistory.events)
+            start: First index
+            end: End index (exclusive); None means up to the current end of source
+        """
+        if end is None:
+            end = len(source)
+        if end <= start:
+            return
+
+        if self._ranges:
+            last = self._ranges[-1]
+            if last[0] is source and last[2] == start:
+                last[2] = end
+                self._length += end - start
+                return
+
+        self._ranges.append([source, start, end])
+        self._offsets.append(self._length)
+        self._length += end - start
+
+    def clear(self) -> None:
+        """Forget every event."""
+        self._extra = []
+        self._ranges = []
+        self._offsets = []
+        self._length = 0
+
+    def __len__(self) -> int:
+        return self._length
+
+    def __iter__(self) -> Iterator[Any]:
+        for source, start, end in self._ranges:
+            for index in range(start, end):
+                yield source[index]
+
+    def __getitem__(self, position):
+        if isinstance(position, slice):
+            return [self._event_at(i) for i in range(*position.indices(self._length))]
+
+        if position < 0:
+            position += self._length
+        if not 0 <= position < self._length:
+            raise IndexError("memory index out of range")
+        return self._event_at(position)
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, (MemoryView, list, tuple)):
+            return len(self) == len(other) and all(a == b for a, b in zip(self, other))
+        return NotImplemented
+
+    def __repr__(self) -> str:
+        return f"MemoryView({list(self)!r})"
+
+    def _event_at(self, position: int) -> Any:
+        """Get the event at a valid memory position."""
+        range_index = bisect_right(self._offsets, position) - 1
+        source, start, _ = self._ranges[range_index]
+        return source[start + position - self._offsets[range_index]]
@@ -0,0 +1,254 @@
+"""
+In-process accounting of LLM calls: tokens, latency and estimated cost.
+
+Every call made through GenerativeModel is recorded under its stage (decision,
+bid, response, scene_decision, scene_gen, movement, director, judge, summary),
+the character it was made for and the session it belongs to. Totals can be grouped
+by any of these and exported in the Prometheus text format.
+"""
+
+import threading
+from contextvars import ContextVar
+from pathlib import Path
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
+
+# Session of the turn being processed; asyncio tasks inherit it from the task that created them
+current_session: ContextVar[str] = ContextVar("current_session", default="default")
+
+LABELS = ("session", "stage", "character", "model")
+
+_COUNTERS = (
+    ("calls", "LLM calls made"),
+    ("errors", "LLM calls that failed"),
+    ("cache_hits", "LLM calls answered from the response cache"),
+    ("prompt_tokens", "Prompt tokens sent"),
+    ("completion_tokens", "Completion tokens received"),
+    ("cost_usd", "Estimated cost in US dollars"),
+)
+
+
+class CallStats:
+    """Totals for one combination of labels."""
+
+    __slots__ = ("calls", "errors", "cache_hits", "prompt_tokens", "completion_tokens", "cost_usd", "latency_seconds")
+
+    def __init__(self):
+        self.calls = 0
+        self.errors = 0
+        self.cache_hits = 0
+        self.prompt_tokens = 0
+        self.completion_tokens = 0
+        self.cost_usd = 0.0
+        self.latency_seconds = 0.0
+
+    def add(self, other: "CallStats") -> None:
+        for field in self.__slots__:
+            setattr(self, field, getattr(self, field) + getattr(other, field))
+
+    def as_dict(self) -> Dict[str, float]:
+        stats = {field: getattr(self, field) for field in self.__slots__}
+        stats["avg_latency_seconds"] = self.latency_seconds / self.calls if self.calls else 0.0
+        return stats
+
+
+def estimate_cost(model: str, prompt_tokens: int, completion_tokens: int) -> float:
+    """
+    Estimate the cost of a call from Config.MODEL_PRICES.
+
+    Returns:
+        Cost in US dollars (0 for models without a price)
+    """
+    from config import Config
+
+    prompt_price, completion_price = Config.MODEL_PRICES.get(model, (0.0, 0.0))
+    return (prompt_tokens * prompt_price + completion_tokens * completion_price) / 1_000_000
+
+
+class MetricsRegistry:
+    """Thread-safe totals of LLM calls keyed by (session, stage, character, model)."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._stats: Dict[Tuple[str, str, str, str], CallStats] = {}
+        self._gauges: List[Tuple[str, Callable[[], Dict[str, float]]]] = []
+
+    def record_call(
+        self,
+        stage: str,
+        model: str,
+        prompt_tokens: int = 0,
+        completion_tokens: int = 0,
+        latency: float = 0.0,
+        character: Optional[str] = None,
+        session: Optional[str] = None,
+        cached: bool = False,
+        error: bool = False
+    ) -> None:
+        """
+        Record one LLM call.
+
+        Args:
+            stage: Stage of the turn that made the call
+            model: Model name
+            prompt_tokens: Prompt tokens of the call
+            completion_tokens: Completion tokens of the call
+            latency: Seconds from the request to the complete response
+            character: Character the call was made for, if any
+            session: Session of the call (defaults to current_session)
+            cached: The response came from the response cache (costs nothing)
+            error: The call failed
+        """
+        key = (session or current_session.get(), stage, character or "", model)
+        cost = 0.0 if cached else estimate_cost(model, prompt_tokens, completion_tokens)
+        with self._lock:
+            stats = self._stats.get(key)
+            if stats is None:
+                stats = self._stats[key] = CallStats()
+            stats.calls += 1
+            stats.errors += int(error)
+            stats.cache_hits += int(cached)
+            stats.prompt_tokens += prompt_tokens
+            stats.completion_tokens += completion_tokens
+            stats.cost_usd += cost
+            stats.latency_seconds += latency
+
+    def register_gauges(self, prefix: str, collect: Callable[[], Dict[str, float]]) -> None:
+        """
+        Export the values returned by collect() as gauges named <prefix>_<key>.
+
+        Args:
+            prefix: Metric name prefix
+            collect: Function returning the current values (e.g. RateLimiter.stats)
+        """
+        with self._lock:
+            self._gauges.append((prefix, collect))
+
+    def totals(
+        self,
+        group_by: Iterable[str] = ("stage",),
+        session: Optional[str] = None
+    ) -> Dict[Tuple[str, ...], Dict[str, float]]:
+        """
+        Sum the recorded calls.
+
+        Args:
+            group_by: Labels to group by (any of "session", "stage", "character", "model");
+                empty for a single grand total
+            session: Only count calls of this session
+
+        Returns:
+            Dictionary mapping label values (in group_by order) to totals
+        """
+        positions = [LABELS.index(label) for label in group_by]
+        grouped: Dict[Tuple[str, ...], CallStats] = {}
+        with self._lock:
+            for key, stats in self._stats.items():
+                if session is not None and key[0] != session:
+                    continue
+                group = tuple(key[position] for position in positions)
+                grouped.setdefault(group, CallStats()).add(stats)
+        return {group: stats.as_dict() for group, stats in sorted(grouped.items())}
+
+    def to_prometheus(self, prefix: str = "roleplay_llm") -> str:
+        """
+        Render every total in the Prometheus text exposition format.
+
+        Returns:
+            The exposition text
+        """
+        with self._lock:
+            items = [(key, _copy(stats)) for key, stats in sorted(self._stats.items())]
+            gauges = list(self._gauges)
+
+        lines = []
+        for field, description in _COUNTERS:
+            name = f"{prefix}_{field}_total"
+            lines.append(f"# HELP {name} {description}")
+            lines.append(f"# TYPE {name} counter")
+            for key, stats in items:
+                lines.append(f"{name}{{{_labels(key)}}} {_number(getattr(stats, field))}")
+
+        name = f"{prefix}_latency_seconds"
+        lines.append(f"# HELP {name} Seconds from request to complete response")
+        lines.append(f"# TYPE {name} summary")
+        for key, stats in items:
+            lines.append(f"{name}_sum{{{_labels(key)}}} {_number(stats.latency_seconds)}")
+            lines.append(f"{name}_count{{{_labels(key)}}} {stats.calls}")
+
+        for gauge_prefix, collect in gauges:
+            try:
+                values = collect()
+            except Exception:
+                continue
+            for key, value in sorted(values.items()):
+                if isinstance(value, bool) or not isinstance(value, (int, float)):
+                    continue
+                name = f"{gauge_prefix}_{key}"
+                lines.append(f"# TYPE {name} gauge")
+                lines.append(f"{name} {_number(value)}")
+        return "\n".join(lines) + "\n"
+
+    def write_prometheus(self, path: str) -> None:
+        """Write the exposition text to a file atomically (for a textfile collector)."""
+        target = Path(path)
+        temporary = target.with_name(target.name + ".tmp")
+        temporary.write_text(self.to_prometheus(), encoding="utf-8")
+        temporary.replace(target)
+
+    def clear(self) -> None:
+        """Forget every recorded call."""
+        with self._lock:
+            self._stats.clear()
+
+
+def format_totals(registry: "MetricsRegistry", session: Optional[str] = None) -> str:
+    """
+    Format per-stage totals and the grand total as a console table.
+
+    Args:
+        registry: Registry to read
+        session: Only count calls of this session
+
+    Returns:
+        The table text
+    """
+    rows = registry.totals(("stage",), session=session)
+    total = registry.totals((), session=session).get(())
+    if not total:
+        return "No LLM calls recorded yet."
+
+    lines = [f"{'Stage':<16}{'Calls':>7}{'Prompt tok':>12}{'Compl. tok':>12}{'Avg s':>8}{'Cost $':>10}"]
+    for (stage,), stats in list(rows.items()) + [(("TOTAL",), total)]:
+        lines.append(
+            f"{stage:<16}{stats['calls']:>7}{stats['prompt_tokens']:>12}{stats['completion_tokens']:>12}"
+            f"{stats['avg_latency_seconds']:>8.2f}{stats['cost_usd']:>10.4f}"
+        )
+    if total["errors"] or total["cache_hits"]:
+        lines.append(f"Errors: {total['errors']}  Cache hits: {total['cache_hits']}")
+    return "\n".join(lines)
+
+
+def _copy(stats: CallStats) -> CallStats:
+    copy = CallStats()
+    copy.add(stats)
+    return copy
+
+
+def _labels(key: Tuple[str, str, str, str]) -> str:
+    return ",".join(f'{label}="{_escape(value)}"' for label, value in zip(LABELS, key))
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _number(value: float) -> str:
+    return repr(round(value, 9)) if isinstance(value, float) else str(value)
+
+
+_registry = MetricsRegistry()
+
+
+def get_metrics() -> MetricsRegistry:
+    """Get the process-wide metrics registry."""
+    return _registry
@@ -0,0 +1,217 @@
+"""
+Pacing of console output, done on the client side.
+
+The turn engine never sleeps for readability. It asks a pacing policy how long
+the console should hold back around each line, scene and movement, and posts
+that as a pause marker on sys.stdout. When the console is a PacedOutput (the
+interactive CLI installs one, and restores the real console when it is done),
+a writer thread honors the pauses; any other stream ignores them, so batch
+drivers, servers and benchmarks run unpaced.
+"""
+
+import atexit
+import contextlib
+import io
+import queue
+import sys
+import threading
+import time
+import traceback
+from typing import Optional, TextIO, Tuple
+
+# Kinds of paced output
+LINE = "line"          # A character speaking or acting
+SCENE = "scene"        # A scene event
+MOVEMENT = "movement"  # A character entering or leaving
+STALL = "stall"        # A scene event generated because no one wanted to speak
+
+
+class PacingPolicy:
+    """No pacing: output is shown as soon as it is produced."""
+
+    def delays(self, kind: str, text: str = "") -> Tuple[float, float]:
+        """
+        Get the pauses around one piece of output.
+
+        Args:
+            kind: LINE, SCENE, MOVEMENT or STALL
+            text: The text being shown (dialogue, action or description)
+
+        Returns:
+            Tuple of (seconds before it is shown, seconds before anything after it is shown)
+        """
+        return 0.0, 0.0
+
+
+class FixedPacing(PacingPolicy):
+    """A fixed pause after each line, scene and movement."""
+
+    def __init__(self, line: float = 2.0, scene: float = 1.0, movement: float = 1.0, stall: float = 2.0):
+        self.pauses = {LINE: line, SCENE: scene, MOVEMENT: movement, STALL: stall}
+
+    def delays(self, kind: str, text: str = "") -> Tuple[float, float]:
+        return 0.0, self.pauses.get(kind, 0.0)
+
+
+class TypingPacing(PacingPolicy):
+    """Characters take as long to appear as they would to type their line."""
+
+    def __init__(self, chars_per_second: float = 30.0, max_delay: float = 6.0, scene: float = 1.0):
+        self.chars_per_second = chars_per_second
+        self.max_delay = max_delay
+        self.scene = scene
+
+    def delays(self, kind: str, text: str = "") -> Tuple[float, float]:
+        if kind == LINE:
+            return min(len(text) / self.chars_per_second, self.max_delay), 0.0
+        return 0.0, self.scene
+
+
+def get_pacing_policy(name: Optional[str] = None) -> PacingPolicy:
+    """
+    Build a pacing policy from its name and Config.PACING_* settings.
+
+    Args:
+        name: "none", "fixed" or "typing" (defaults to Config.PACING)
+
+    Returns:
+        The pacing policy
+
+    Raises:
+        ValueError: If the name is unknown
+    """
+    from config import Config
+
+    name = name or Config.PACING
+    if name == "none":
+        return PacingPolicy()
+    if name == "fixed":
+        return FixedPacing(
+            line=Config.PACING_LINE_DELAY,
+            scene=Config.PACING_SCENE_DELAY,
+            movement=Config.PACING_MOVEMENT_DELAY,
+            stall=Config.PACING_STALL_DELAY
+        )
+    if name == "typing":
+        return TypingPacing(
+            chars_per_second=Config.PACING_TYPING_CPS,
+            max_delay=Config.PACING_TYPING_MAX_DELAY,
+            scene=Config.PACING_SCENE_DELAY
+        )
+    raise ValueError(f"Unknown pacing policy: {name!r}")
+
+
+def pause_output(seconds: float) -> None:
+    """Ask the console to hold back further output (ignored unless it is a PacedOutput)."""
+    if seconds <= 0:
+        return
+    pause = getattr(sys.stdout, "pause", None)
+    if pause is not None:
+        pause(seconds)
+
+
+class PacedOutput(io.TextIOBase):
+    """
+    Text stream that forwards writes to another stream from a writer thread,
+    holding back everything written after a pause() for that long.
+    Writers never block; errors of the underlying stream are reported on
+    sys.__stderr__ instead of being raised in the writer's thread.
+    """
+
+    def __init__(self, stream: TextIO):
+        """
+        Start the writer thread.
+
+        Args:
+            stream: Stream to write to (e.g. the real sys.stdout)
+        """
+        self.stream = stream
+        self._queue: "queue.Queue[Tuple[str, object]]" = queue.Queue()
+        self._writer = threading.Thread(target=self._run, name="paced-output", daemon=True)
+        self._writer.start()
+
+    def writable(self) -> bool:
+        return True
+
+    def isatty(self) -> bool:
+        return self.stream.isatty()
+
+    @property
+    def encoding(self) -> str:
+        return getattr(self.stream, "encoding", "utf-8")
+
+    def write(self, text: str) -> int:
+        if self.closed:
+            raise ValueError("write to closed paced console")
+        self._queue.put(("text", text))
+        return len(text)
+
+    def flush(self) -> None:
+        # The writer thread flushes after every write
+        pass
+
+    def pause(self, seconds: float) -> None:
+        """Hold back output written from now on for the given time."""
+        self._queue.put(("pause", seconds))
+
+    def drain(self) -> None:
+        """Block until everything written so far has been shown."""
+        self._queue.join()
+
+    def input(self, prompt: str = "") -> str:
+        """Show everything pending, then read a line from the player on the real console."""
+        self.drain()
+        with contextlib.redirect_stdout(self.stream):
+            return input(prompt)
+
+    def close(self) -> None:
+        """Show everything pending and stop the writer thread (the wrapped stream stays open)."""
+        if self.closed:
+            return
+        self._queue.put(("stop", None))
+        self._writer.join()
+        super().close()
+
+    def _run(self) -> None:
+        while True:
+            kind, value = self._queue.get()
+            try:
+                if kind == "stop":
+                    return
+                if kind == "text":
+                    self.stream.write(value)
+                    self.stream.flush()
+                else:
+                    time.sleep(value)
+            except Exception:
+                # Keep pacing the rest, but do not lose the error
+                if sys.__stderr__ is not None:
+                    print("⚠️  Console write failed:", file=sys.__stderr__)
+                    traceback.print_exc(file=sys.__stderr__)
+            finally:
+                self._queue.task_done()
+
+
+def install_paced_console() -> PacedOutput:
+    """
+    Route sys.stdout through a PacedOutput so pauses posted by the turn engine take effect.
+
+    Returns:
+        The console; read player input with its input() so pending output is shown first
+    """
+    if isinstance(sys.stdout, PacedOutput):
+        return sys.stdout
+    console = PacedOutput(sys.stdout)
+    sys.stdout = console
+    atexit.register(console.drain)
+    return console
+
+
+def uninstall_paced_console() -> None:
+    """Show pending output, stop pacing and restore the sys.stdout that install_paced_console() replaced."""
+    console = sys.stdout
+    if not isinstance(console, PacedOutput):
+        return
+    atexit.unregister(console.drain)
+    console.close()
+    sys.stdout = console.stream
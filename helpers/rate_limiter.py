@@ -0,0 +1,257 @@
+"""
+Client-side rate limiting for LLM requests.
+
+One limiter is shared by every model, manager and session talking to the same
+provider, whatever event loop they run on. Requests wait for both a request
+token and enough prompt/completion tokens in two token buckets, and the most
+urgent waiting request is always served first, so interactive character
+decisions are not stuck behind background judge or summary calls.
+
+Waiting requests do not poll: the first in line sleeps until the buckets
+can serve it, and the others sleep until they move to the front of the queue.
+"""
+
+import asyncio
+import heapq
+import itertools
+import threading
+import time
+from typing import Dict, List, Optional, Tuple
+
+# (priority, ticket) of a queued request
+_Entry = Tuple[int, int]
+
+# Request priorities (lower is served first)
+PRIORITY_INTERACTIVE = 0
+PRIORITY_BACKGROUND = 1
+
+PRIORITIES = {
+    "interactive": PRIORITY_INTERACTIVE,
+    "background": PRIORITY_BACKGROUND,
+}
+
+
+class RateLimiter:
+    """
+    Token buckets for requests and tokens per minute, with a priority queue of waiters.
+
+    A bucket holds at most its burst size and refills continuously at its per-minute
+    rate. A rate limit reported by the provider (HTTP 429) pauses every request until
+    its Retry-After time has passed.
+    """
+
+    def __init__(
+        self,
+        requests_per_minute: float,
+        tokens_per_minute: float,
+        request_burst: Optional[float] = None,
+        token_burst: Optional[float] = None
+    ):
+        """
+        Initialize the limiter with full buckets.
+
+        Args:
+            requests_per_minute: Sustained request rate (0 disables the request bucket)
+            tokens_per_minute: Sustained prompt + completion token rate (0 disables the token bucket)
+            request_burst: Request bucket size (defaults to one minute of requests)
+            token_burst: Token bucket size (defaults to one minute of tokens)
+        """
+        self.requests_per_minute = requests_per_minute
+        self.tokens_per_minute = tokens_per_minute
+        self.request_burst = request_burst or requests_per_minute
+        self.token_burst = token_burst or tokens_per_minute
+
+        self._lock = threading.Lock()
+        self._request_level = float(self.request_burst)
+        self._token_level = float(self.token_burst)
+        self._refilled_at = time.monotonic()
+        self._paused_until = 0.0
+
+        self._waiters: List[_Entry] = []  # Heap of (priority, ticket)
+        # Event each queued request sleeps on, and the loop it belongs to
+        self._wakeups: Dict[_Entry, Tuple[asyncio.AbstractEventLoop, asyncio.Event]] = {}
+        self._tickets = itertools.count()
+        self._stats: Dict[str, float] = {
+            "granted": 0,
+            "throttled": 0,
+            "rate_limited": 0,
+            "retries": 0,
+            "hedged": 0,
+            "wait_seconds": 0.0,
+        }
+        self._queued_by_priority: Dict[int, int] = {}
+
+    async def acquire(self, tokens: float = 0, priority: int = PRIORITY_INTERACTIVE) -> float:
+        """
+        Wait until a request of the given size may be sent.
+
+        Args:
+            tokens: Estimated prompt + completion tokens of the request
+            priority: PRIORITY_INTERACTIVE or PRIORITY_BACKGROUND
+
+        Returns:
+            Seconds spent waiting
+        """
+        started = time.monotonic()
+        wakeup = asyncio.Event()
+        with self._lock:
+            ticket = next(self._tickets)
+            entry = (priority, ticket)
+            heapq.heappush(self._waiters, entry)
+            self._wakeups[entry] = (asyncio.get_running_loop(), wakeup)
+            self._queued_by_priority[priority] = self._queued_by_priority.get(priority, 0) + 1
+
+        waited = False
+        try:
+            while True:
+                with self._lock:
+                    # Cleared before checking, so a wakeup for any later change is not lost
+                    wakeup.clear()
+                    delay = self._try_grant(entry, tokens)
+                if delay is not None and delay <= 0:
+                    break
+                waited = True
+                try:
+                    await asyncio.wait_for(wakeup.wait(), delay)
+                except asyncio.TimeoutError:
+                    pass
+        except BaseException:
+            with self._lock:
+                self._remove_waiter(entry)
+            raise
+
+        elapsed = time.monotonic() - started
+        with self._lock:
+            self._stats["granted"] += 1
+            if waited:
+                self._stats["throttled"] += 1
+                self._stats["wait_seconds"] += elapsed
+        return elapsed
+
+    def settle(self, estimated_tokens: float, actual_tokens: Optional[float]) -> None:
+        """
+        Correct the token bucket once a request's real usage is known.
+
+        Args:
+            estimated_tokens: Tokens taken by acquire()
+            actual_tokens: Tokens the provider reported, or None if unknown
+        """
+        if actual_tokens is None or not self.tokens_per_minute:
+            return
+        with self._lock:
+            self._refill(time.monotonic())
+            self._token_level = min(self._token_level + estimated_tokens - actual_tokens, self.token_burst)
+            if actual_tokens < estimated_tokens:
+                self._wake_first()
+
+    def release(self, estimated_tokens: float) -> None:
+        """
+        Give back the tokens taken by acquire() for a request that was not served
+        (it failed, timed out, was rate limited or was cancelled).
+
+        Args:
+            estimated_tokens: Tokens taken by acquire()
+        """
+        self.settle(estimated_tokens, 0)
+
+    def pause(self, seconds: float) -> None:
+        """Hold back every request for the given time (after the provider reported a rate limit)."""
+        with self._lock:
+            self._paused_until = max(self._paused_until, time.monotonic() + seconds)
+            self._stats["rate_limited"] += 1
+
+    def record_retry(self) -> None:
+        """Count a retried request."""
+        with self._lock:
+            self._stats["retries"] += 1
+
+    def record_hedge(self) -> None:
+        """Count a duplicate request sent to cut tail latency."""
+        with self._lock:
+            self._stats["hedged"] += 1
+
+    def stats(self) -> Dict[str, float]:
+        """
+        Get a snapshot of the limiter's metrics.
+
+        Returns:
+            Dictionary with the queue depth (in total and per priority), bucket levels,
+            the remaining pause, and counters of granted, throttled, rate-limited, retried
+            and hedged requests plus total seconds spent waiting
+        """
+        with self._lock:
+            now = time.monotonic()
+            self._refill(now)
+            snapshot = dict(self._stats)
+            snapshot["queue_depth"] = len(self._waiters)
+            for name, priority in PRIORITIES.items():
+                snapshot[f"queue_depth_{name}"] = self._queued_by_priority.get(priority, 0)
+            snapshot["request_tokens_available"] = self._request_level
+            snapshot["tokens_available"] = self._token_level
+            snapshot["paused_seconds"] = max(self._paused_until - now, 0.0)
+            return snapshot
+
+    def _try_grant(self, entry: _Entry, tokens: float) -> Optional[float]:
+        """
+        Grant the request if it is first in line and both buckets allow it (lock held).
+
+        Returns:
+            0 if granted, the seconds to wait before checking again, or None to wait
+            until woken (the request is not first in line)
+        """
+        now = time.monotonic()
+        if now < self._paused_until:
+            return self._paused_until - now
+        if self._waiters[0] != entry:
+            return None
+
+        self._refill(now)
+        # A request larger than the whole bucket is let through once the bucket is full
+        tokens = min(tokens, self.token_burst) if self.tokens_per_minute else 0
+        delay = 0.0
+        if self.requests_per_minute and self._request_level < 1:
+            delay = max(delay, (1 - self._request_level) * 60.0 / self.requests_per_minute)
+        if tokens and self._token_level < tokens:
+            delay = max(delay, (tokens - self._token_level) * 60.0 / self.tokens_per_minute)
+        if delay > 0:
+            return delay
+
+        if self.requests_per_minute:
+            self._request_level -= 1
+        self._token_level -= tokens
+        self._remove_waiter(entry)
+        return 0.0
+
+    def _refill(self, now: float) -> None:
+        """Top up both buckets for the time since the last refill (lock held)."""
+        elapsed = now - self._refilled_at
+        self._refilled_at = now
+        if self.requests_per_minute:
+            self._request_level = min(
+                self._request_level + elapsed * self.requests_per_minute / 60.0, self.request_burst
+            )
+        if self.tokens_per_minute:
+            self._token_level = min(
+                self._token_level + elapsed * self.tokens_per_minute / 60.0, self.token_burst
+            )
+
+    def _remove_waiter(self, entry: _Entry) -> None:
+        """Take a request out of the queue and wake the next in line (lock held)."""
+        try:
+            self._waiters.remove(entry)
+        except ValueError:
+            return
+        heapq.heapify(self._waiters)
+        del self._wakeups[entry]
+        self._queued_by_priority[entry[0]] -= 1
+        self._wake_first()
+
+    def _wake_first(self) -> None:
+        """Wake the request first in line, on whichever loop it waits (lock held)."""
+        if not self._waiters:
+            return
+        loop, wakeup = self._wakeups[self._waiters[0]]
+        try:
+            loop.call_soon_threadsafe(wakeup.set)
+        except RuntimeError:
+            pass  # Its loop is closed; nothing is waiting there any more
@@ -0,0 +1,106 @@
+"""
+Memoized rendering of timeline events into prompt lines.
+"""
+
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Hashable, List, Optional, Sequence, Tuple
+
+
+class RenderCache:
+    """
+    Cache of rendered event lines and of the windows joined from them.
+
+    Each event is rendered once per perspective. A perspective is whatever
+    changes the wording for a reader, e.g. whether the reader is the
+    character who acted ("You: ...") or anyone else ("Name: ..."), so all
+    other readers share one rendering. Consumers asking for the same window
+    of events again (the scene, movement and judge prompts of one turn all
+    use the last 15 events) get the previously joined string back.
+    """
+
+    def __init__(
+        self,
+        render: Callable[[Any, Hashable], Optional[str]],
+        perspective: Optional[Callable[[Any, Optional[str]], Hashable]] = None,
+        max_lines: int = 8192,
+        max_windows: int = 512
+    ):
+        """
+        Initialize the cache.
+
+        Args:
+            render: Function (event, perspective) -> line, or None to leave the event out
+            perspective: Function (event, reader) -> perspective key; readers all share
+                one perspective if omitted
+            max_lines: Rendered lines to keep before the oldest are evicted
+            max_windows: Joined windows to keep before the least recently used is evicted
+                (consumers come and go with sessions, so window keys are not reused forever)
+        """
+        self._render = render
+        self._perspective = perspective
+        self.max_lines = max_lines
+        self.max_windows = max_windows
+        self._lines: Dict[Tuple[str, Hashable], Optional[str]] = {}
+        self._windows: "OrderedDict[Hashable, Tuple[Tuple[str, ...], str]]" = OrderedDict()
+
+    def line(self, event: Any, reader: Optional[str] = None) -> Optional[str]:
+        """
+        Get the rendered line for one event, rendering it on first use.
+
+        Args:
+            event: A TimelineEvent
+            reader: Name of the character reading the line, or None for the narrator
+
+        Returns:
+            The rendered line, or None if the event is not shown
+        """
+        perspective = self._perspective(event, reader) if self._perspective else None
+        key = (event.timeline_id, perspective)
+        try:
+            return self._lines[key]
+        except KeyError:
+            pass
+
+        rendered = self._render(event, perspective)
+        if len(self._lines) >= self.max_lines:
+            # Dicts keep insertion order: drop the oldest renderings, which have left every window
+            for old_key in list(self._lines)[:self.max_lines // 4]:
+                del self._lines[old_key]
+        self._lines[key] = rendered
+        return rendered
+
+    def window(
+        self,
+        window_key: Hashable,
+        events: Sequence[Any],
+        reader: Optional[str] = None
+    ) -> str:
+        """
+        Join the rendered lines of a window of events.
+
+        Args:
+            window_key: Identifies the consumer's window (e.g. timeline id and size)
+            events: The events currently in the window, in order
+            reader: Name of the character reading the window, or None for the narrator
+
+        Returns:
+            The lines joined with newlines ("" if none are shown)
+        """
+        event_ids = tuple(event.timeline_id for event in events)
+        cached = self._windows.get(window_key)
+        if cached is not None and cached[0] == event_ids:
+            self._windows.move_to_end(window_key)
+            return cached[1]
+
+        lines: List[str] = []
+        for event in events:
+            rendered = self.line(event, reader)
+            if rendered is not None:
+                lines.append(rendered)
+        text = "\n".join(lines)
+
+        self._windows[window_key] = (event_ids, text)
+        self._windows.move_to_end(window_key)
+        while len(self._windows) > self.max_windows:
+            self._windows.popitem(last=False)
+        return text
@@ -3,21 +3,28 @@ Helper utilities for parsing LLM responses.
 """
 
 import json
-from typing import Dict, Any
+import re
+from typing import Dict, Any, List, Optional, Tuple
 
 
-def parse_json_response(response_text: str) -> Dict[str, Any]:
+def parse_json_response(response_text: str, defaults: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
     """
     Parse JSON response from LLM, handling markdown code blocks.
     
+    Well-formed responses are decoded directly. Otherwise the first balanced JSON
+    object is extracted from the text (so leading prose and trailing commentary are
+    ignored) and repaired if needed: trailing commas are dropped, and an object cut
+    off by the token limit has its open string, arrays and objects closed.
+    
     Args:
         response_text: Raw response text from the model
+        defaults: Values for keys the response leaves out or sets to null
         
     Returns:
         Parsed JSON dictionary
         
     Raises:
-        json.JSONDecodeError: If the response cannot be parsed as JSON
+        json.JSONDecodeError: If no JSON object can be recovered from the response
     """
     response_text = response_text.strip()
     
@@ -32,4 +39,264 @@ def parse_json_response(response_text: str) -> Dict[str, Any]:
     
     response_text = response_text.strip()
     
-    return json.loads(response_text)
+    try:
+        data = json.loads(response_text)
+    except json.JSONDecodeError as error:
+        data = _repair_json_object(response_text, error)
+    if not isinstance(data, dict):
+        data = _repair_json_object(response_text, json.JSONDecodeError("Expected a JSON object", response_text, 0))
+    
+    if defaults:
+        return {**defaults, **{key: value for key, value in data.items() if value is not None}}
+    return data
+
+
+_TRAILING_COMMA_RE = re.compile(r",(\s*[}\]])")
+
+
+def extract_json_object(text: str) -> Optional[str]:
+    """
+    Find the first balanced JSON object in a text.
+    
+    Args:
+        text: Text that contains a JSON object somewhere
+        
+    Returns:
+        The object's source text; if the text ends before the object is closed,
+        everything from its opening brace. None if the text has no '{'.
+    """
+    start = text.find("{")
+    if start < 0:
+        return None
+    
+    depth = 0
+    in_string = False
+    escape = False
+    for index in range(start, len(text)):
+        ch = text[index]
+        if in_string:
+            if escape:
+                escape = False
+            elif ch == "\\":
+                escape = True
+            elif ch == '"':
+                in_string = False
+        elif ch == '"':
+            in_string = True
+        elif ch in "{[":
+            depth += 1
+        elif ch in "}]":
+            depth -= 1
+            if depth == 0:
+                return text[start:index + 1]
+    return text[start:]
+
+
+def _repair_json_object(text: str, error: json.JSONDecodeError) -> Dict[str, Any]:
+    """
+    Recover the first JSON object of a malformed response.
+    
+    Raises:
+        json.JSONDecodeError: The original error, if nothing can be recovered
+    """
+    candidate = extract_json_object(text)
+    if candidate is None:
+        raise error
+    
+    for attempt in (candidate, _TRAILING_COMMA_RE.sub(r"\1", candidate), _close_truncated(candidate)):
+        try:
+            data = json.loads(attempt)
+        except json.JSONDecodeError:
+            continue
+        if isinstance(data, dict):
+            return data
+    raise error
+
+
+def _close_truncated(text: str) -> str:
+    """Close the string, arrays and objects a truncated JSON text leaves open."""
+    closers: List[str] = []
+    in_string = False
+    escape = False
+    for ch in text:
+        if in_string:
+            if escape:
+                escape = False
+            elif ch == "\\":
+                escape = True
+            elif ch == '"':
+                in_string = False
+        elif ch == '"':
+            in_string = True
+        elif ch == "{":
+            closers.append("}")
+        elif ch == "[":
+            closers.append("]")
+        elif ch in "}]" and closers:
+            closers.pop()
+    
+    if escape:
+        text = text[:-1]
+    if in_string:
+        text += '"'
+    # A dangling comma, colon or key cannot be completed; drop it
+    text = re.sub(r'(,\s*"[^"]*"\s*:?|[,:])\s*$', "", text.rstrip())
+    return _TRAILING_COMMA_RE.sub(r"\1", text + "".join(reversed(closers)))
+
+
+class StreamingJsonParser:
+    """
+    Incremental parser for a flat JSON object arriving in chunks.
+    
+    Feed it raw text as it streams in; it returns fragments of top-level
+    string values as soon as they are decoded, so callers can display a
+    field (e.g. "dialogue") before the closing brace arrives. Anything before
+    the first '{' (such as a markdown code fence) is ignored. Nested objects
+    and arrays are captured whole and decoded once complete.
+    
+    Completed top-level values are available in the `values` dictionary.
+    """
+    
+    _ESCAPES = {'"': '"', '\\': '\\', '/': '/', 'b': '\b', 'f': '\f', 'n': '\n', 'r': '\r', 't': '\t'}
+    
+    def __init__(self):
+        """Initialize an empty parser."""
+        self.values: Dict[str, Any] = {}
+        self.complete = False
+        self._state = "start"
+        self._key = ""
+        self._buffer: list = []
+        self._escape: Optional[str] = None
+        self._depth = 0
+        self._raw_in_string = False
+        self._raw_escape = False
+    
+    def feed(self, text: str) -> List[Tuple[str, str]]:
+        """
+        Consume the next chunk of streamed text.
+        
+        Args:
+            text: Newly received text
+            
+        Returns:
+            List of (key, fragment) tuples for string values decoded from this chunk
+        """
+        fragments: List[Tuple[str, str]] = []
+        current: list = []
+        
+        def flush():
+            if current:
+                fragments.append((self._key, "".join(current)))
+                current.clear()
+        
+        for ch in text:
+            state = self._state
+            if state == "start":
+                if ch == "{":
+                    self._state = "object"
+            elif state == "object":
+                if ch == '"':
+                    self._state = "key"
+                    self._buffer = []
+                elif ch == "}":
+                    self._state = "done"
+                    self.complete = True
+            elif state == "key":
+                decoded = self._decode_string_char(ch)
+                if decoded is None:
+                    self._key = "".join(self._buffer)
+                    self._state = "colon"
+                elif decoded:
+                    self._buffer.append(decoded)
+            elif state == "colon":
+                if ch == ":":
+                    self._state = "value"
+            elif state == "value":
+                if ch.isspace():
+                    continue
+                self._buffer = []
+                if ch == '"':
+                    self._state = "string"
+                elif ch in "{[":
+                    self._state = "nested"
+                    self._depth = 1
+                    self._raw_in_string = False
+                    self._raw_escape = False
+                    self._buffer.append(ch)
+                else:
+                    self._state = "scalar"
+                    self._buffer.append(ch)
+            elif state == "string":
+                decoded = self._decode_string_char(ch)
+                if decoded is None:
+                    flush()
+                    self.values[self._key] = "".join(self._buffer)
+                    self._state = "object"
+                elif decoded:
+                    self._buffer.append(decoded)
+                    current.append(decoded)
+            elif state == "scalar":
+                if ch in ",}":
+                    self._finish_raw_value()
+                    if ch == "}":
+                        self._state = "done"
+                        self.complete = True
+                else:
+                    self._buffer.append(ch)
+            elif state == "nested":
+                self._buffer.append(ch)
+                if self._raw_in_string:
+                    if self._raw_escape:
+                        self._raw_escape = False
+                    elif ch == "\\":
+                        self._raw_escape = True
+                    elif ch == '"':
+                        self._raw_in_string = False
+                elif ch == '"':
+                    self._raw_in_string = True
+                elif ch in "{[":
+                    self._depth += 1
+                elif ch in "}]":
+                    self._depth -= 1
+                    if self._depth == 0:
+                        self._finish_raw_value()
+        
+        flush()
+        return fragments
+    
+    def _decode_string_char(self, ch: str) -> Optional[str]:
+        """
+        Decode one character inside a JSON string.
+        
+        Returns:
+            The decoded text ("" while an escape sequence is incomplete),
+            or None when the closing quote is reached
+        """
+        if self._escape is not None:
+            self._escape += ch
+            if self._escape[0] == "u":
+                if len(self._escape) < 5:
+                    return ""
+                try:
+                    decoded = chr(int(self._escape[1:], 16))
+                except ValueError:
+                    decoded = ""
+            else:
+                decoded = self._ESCAPES.get(ch, ch)
+            self._escape = None
+            return decoded
+        if ch == "\\":
+            self._escape = ""
+            return ""
+        if ch == '"':
+            return None
+        return ch
+    
+    def _finish_raw_value(self) -> None:
+        """Store a completed non-string value and return to the object state."""
+        raw = "".join(self._buffer).strip()
+        try:
+            self.values[self._key] = json.loads(raw)
+        except json.JSONDecodeError:
+            self.values[self._key] = raw
+        self._state = "object"
@@ -0,0 +1,126 @@
+"""
+JSON schemas of the answers each prompt asks for.
+
+Managers pass them to GenerativeModel as response_format, so providers with
+structured outputs can only return JSON of the requested shape. The prompts
+still describe the format, and parse_json_response still repairs answers,
+for models that ignore or reject the schema.
+
+Strict schemas require every property, so optional fields are nullable.
+Properties are listed in the order the prompts (and DecisionStream) expect them.
+"""
+
+from typing import Any, Dict, Iterable, List
+
+_STRING = {"type": "string"}
+_NULLABLE_STRING = {"type": ["string", "null"]}
+_RESPONSE_TYPE = {"type": "string", "enum": ["speak", "act", "silent"]}
+_PRIORITY = {"type": "number"}
+_MOVEMENTS = {
+    "type": "array",
+    "items": {
+        "type": "object",
+        "properties": {"character": _STRING, "description": _STRING},
+        "required": ["character", "description"],
+        "additionalProperties": False,
+    },
+}
+_SCENE_DECISION_PROPERTIES = {
+    "scene_generated": {"type": "boolean"},
+    "scene_type": {"type": ["string", "null"], "enum": ["transition", "environmental", None]},
+    "location": _NULLABLE_STRING,
+    "event_description": _NULLABLE_STRING,
+}
+
+
+def json_schema_format(name: str, properties: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Build a strict response_format for an object with the given properties.
+
+    Args:
+        name: Schema name reported to the provider
+        properties: JSON schema of each property (all of them are required)
+
+    Returns:
+        The response_format parameter of a chat-completions request
+    """
+    return {
+        "type": "json_schema",
+        "json_schema": {
+            "name": name,
+            "strict": True,
+            "schema": {
+                "type": "object",
+                "properties": properties,
+                "required": list(properties),
+                "additionalProperties": False,
+            },
+        },
+    }
+
+
+DECISION = json_schema_format("turn_decision", {
+    "type": _RESPONSE_TYPE,
+    "priority": _PRIORITY,
+    "reasoning": _STRING,
+    "dialogue": _NULLABLE_STRING,
+    "action": _NULLABLE_STRING,
+})
+
+BID = json_schema_format("turn_bid", {
+    "type": _RESPONSE_TYPE,
+    "priority": _PRIORITY,
+    "reasoning": _STRING,
+})
+
+SPEAK = json_schema_format("speak_response", {"dialogue": _STRING, "action": _STRING})
+
+ACT = json_schema_format("act_response", {"action": _STRING})
+
+SCENE_DECISION = json_schema_format("scene_decision", _SCENE_DECISION_PROPERTIES)
+
+SCENE = json_schema_format("scene_event", {"location": _STRING, "event_description": _STRING})
+
+MOVEMENTS = json_schema_format("character_movements", {"entries": _MOVEMENTS, "exits": _MOVEMENTS})
+
+DIRECTOR = json_schema_format("director_decision", {
+    **_SCENE_DECISION_PROPERTIES,
+    "entries": _MOVEMENTS,
+    "exits": _MOVEMENTS,
+})
+
+SUMMARY = json_schema_format("summary", {"summary": _STRING})
+
+
+def judge_format(character_names: Iterable[str], statuses: List[str]) -> Dict[str, Any]:
+    """
+    Build the response_format of a judge evaluation of the given characters.
+
+    Args:
+        character_names: Characters that must each get an update
+        statuses: Statuses the judge may give ("assigned", or "completed" and "continuing")
+
+    Returns:
+        The response_format parameter of a chat-completions request
+    """
+    update = {
+        "type": "object",
+        "properties": {
+            "objective": _STRING,
+            "status": {"type": "string", "enum": statuses},
+            "reasoning": _STRING,
+        },
+        "required": ["objective", "status", "reasoning"],
+        "additionalProperties": False,
+    }
+    names = list(character_names)
+    return json_schema_format("judge_evaluation", {
+        "character_updates": {
+            "type": "object",
+            "properties": {name: update for name in names},
+            "required": names,
+            "additionalProperties": False,
+        },
+        "story_objective_complete": {"type": "boolean"},
+        "reasoning": _STRING,
+    })
@@ -11,6 +11,8 @@ from managers.storyManager import StoryManager
 from loaders.character_loader import CharacterLoader
 from loaders.story_loader import StoryLoader
 from data_models import Message, Scene, Action, CharacterEntry, CharacterExit
+from helpers.pacing import install_paced_console, uninstall_paced_console
+from helpers.async_runner import call_on_loop
 
 # Initialize colorama for Windows color support
 init(autoreset=True)
@@ -51,6 +53,7 @@ that guide them, and the story progresses automatically as objectives are comple
    • 'listen' - Stay quiet and let AI characters continue talking
    • 'skip' - Prompt AI characters to continue the conversation
    • 'progress' - Check current story progress and objectives
+   • 'stats' - See LLM calls, tokens and estimated cost per stage
    • 'info' - See character details
    • 'reset' - Start a completely new conversation (deletes history)
    • 'quit' or 'exit' - End the session and save the conversation
@@ -110,7 +113,11 @@ def main():
     character_names = [char.name for char in characters]
     display_welcome(PLAYER_NAME, character_names)
     
+    # Lines are paced on the console; the turn engine itself never waits
+    console = install_paced_console()
+    
     # Initialize the roleplay system
+    system = None
     try:
         system = RoleplaySystem(
             player_name=PLAYER_NAME,
@@ -180,10 +187,10 @@ def main():
             try:
                 # Get player input
                 print("\n" + "─"*70)
-                user_input = input(f"⚡ {PLAYER_NAME}: ").strip()
+                user_input = console.input(f"⚡ {PLAYER_NAME}: ").strip()
                 
                 # Track player messages
-                if user_input and user_input.lower() not in ['listen', 'skip', 'progress', 'info', 'quit', 'exit', 'reset']:
+                if user_input and user_input.lower() not in ['listen', 'skip', 'progress', 'stats', 'info', 'quit', 'exit', 'reset']:
                     player_messages_count += 1
                 
                 # Handle progress command
@@ -204,7 +211,7 @@ def main():
                 
                 # Handle reset command
                 if user_input.lower() == 'reset':
-                    confirm = input("\n⚠️  Are you sure you want to reset? This will delete all conversation history. (yes/no): ").strip().lower()
+                    confirm = console.input("\n⚠️  Are you sure you want to reset? This will delete all conversation history. (yes/no): ").strip().lower()
                     if confirm in ['yes', 'y']:
                         system.reset_conversation()
                         # Restart with initial greeting
@@ -215,7 +222,7 @@ def main():
                             location=SCENE_LOCATION,
                             description=SCENE_DESCRIPTION
                         )
-                        system.timeline_manager.add_event(system.timeline, initial_scene)
+                        call_on_loop(system.timeline_manager.add_event, system.timeline, initial_scene)
                         print(f"\n💬 {PLAYER_NAME}: {INITIAL_GREETING}")
                         system._add_player_message(INITIAL_GREETING)
                         ai_responses = system.turn_manager.process_ai_responses()
@@ -259,6 +266,15 @@ def main():
     except Exception as e:
         print(f"\n❌ Unexpected Error: {e}")
         print("Please check your configuration and try again.")
+    finally:
+        # Finish writing pending saves before the process exits
+        if system is not None:
+            try:
+                system.store.close()
+            except Exception as e:
+                print(f"⚠️  Error saving conversation: {e}")
+        # Show what is still paced, then give the real console back
+        uninstall_paced_console()
 
 
 if __name__ == "__main__":
@@ -4,6 +4,7 @@ Managers package for handling timeline events and characters.
 from managers.timelineManager import TimelineManager
 from managers.characterManager import CharacterManager
 from managers.storyManager import StoryManager
+from managers.summaryManager import SummaryManager
 from managers.turn_manager import TurnManager
 
-__all__ = ['TimelineManager', 'CharacterManager', 'StoryManager', 'TurnManager']
\ No newline at end of file
+__all__ = ['TimelineManager', 'CharacterManager', 'StoryManager', 'SummaryManager', 'TurnManager']
\ No newline at end of file
@@ -7,8 +7,179 @@ sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from data_models import CharacterPersona, Message, Character, CharacterMemory, CharacterState, TimelineEvent, Scene, Action, CharacterEntry, CharacterExit
 from config import Config
-from openrouter_client import GenerativeModel
+from openrouter_client import get_model
 from helpers.response_parser import parse_json_response
+from helpers import response_schemas
+from helpers.async_runner import run_sync
+from helpers.decision_stream import DecisionStream
+from helpers.render_cache import RenderCache
+from helpers.memory_index import MemoryIndex, load_embedder
+from managers.summaryManager import SummaryManager
+
+
+# Shared guidance for choosing between speaking, acting and staying silent
+DECISION_GUIDANCE = """THREE OPTIONS:
+        1. **SPEAK** - Respond with dialogue (and accompanying action)
+        2. **ACT** - React physically/emotionally WITHOUT speaking (silent action)
+        3. **SILENT** - Do nothing, stay quiet
+        
+        WHEN TO SPEAK (high priority):
+        1. **Someone greets the group or asks how everyone is doing** - It's natural to respond as friends!
+        2. **Someone reveals important/concerning information** - React with your authentic concern!
+        3. **You're directly addressed or mentioned** - Respond naturally!
+        4. **There's been awkward silence** - Someone should break it!
+        5. **The topic is highly relevant to YOU** - Share your unique perspective!
+        6. **Someone needs help or support** - Friends respond to friends!
+        
+        WHEN TO ACT (medium priority):
+        - You want to react but words feel forced or unnecessary
+        - Showing emotion through body language is more powerful than speaking
+        - High tension moment where silence + action is more dramatic
+        - You're uncomfortable/unsure and just want to show physical reaction
+        - Someone said something shocking and you need a moment to process
+        - Physical reaction conveys your feeling better than words would
+
+        WHEN TO STAY SILENT (stay quiet):
+        - You JUST spoke in the last message (let others respond first)
+        - Someone else already said exactly what you'd say
+        - You've made the same point 2-3+ times already (don't be repetitive!)
+        - **If others already reacted to danger/concern, you don't need to pile on with the SAME reaction**
+        - Someone clearly wants to end a topic and you'd just push it again
+        - Another character is better suited to respond to this specific topic
+        - The conversation doesn't involve you and you have nothing unique to add
+        - **Multiple people already said similar things - don't be the third person saying the same thing**
+
+        SPECIAL SITUATIONS:
+        - **RESPECT BOUNDARIES**: If someone has stated their position, accept it or change approach
+        - **REACT TO DANGER/CONCERN**: If friend mentions pain/danger/threat, respond with concern ONLY if you have something UNIQUE to add beyond what others said
+        - **WITHDRAWAL CONTEXT**: If someone needs rest after revealing something serious, acknowledge both parts
+        - **DON'T GANG UP**: If another character already made your exact point, DON'T repeat it - offer a DIFFERENT suggestion or stay quiet
+        - **BE INDEPENDENT**: Have your own opinions - don't just echo what others said with slightly different words
+        - **NATURAL FLOW**: Sometimes "Alright, if you say so" or changing subjects IS the right move
+        - **CHECK WHAT OTHERS SAID**: Look at the last 2-3 messages. If they already covered your concern, you don't need to repeat it"""
+
+# Shared rules for writing the dialogue and action of a response
+RESPONSE_GUIDELINES = """**CRITICAL - ACTION VARIETY RULES (READ THIS CAREFULLY):**
+        1. **CHECK THE CONVERSATION ABOVE** - Look at your previous messages. What actions did you ALREADY do?
+        2. **NEVER REPEAT ACTIONS** - If you already "leaned forward", "sat back", "crossed arms", "looked at someone" - DON'T DO IT AGAIN
+        3. **PHYSICAL CONSISTENCY** - If you already sat down or leaned back, you can't lean back AGAIN. Instead: stand up, walk somewhere, gesture differently, adjust position, look away, etc.
+        4. **VARIETY IS MANDATORY** - Each of your actions MUST be different from all your previous actions in this conversation
+        5. **EXAMPLES OF VARIETY**:
+        - First message: "leans back against sofa"
+        - Second message: "sits forward suddenly" or "stands up" or "runs hand through hair"
+        - Third message: "paces to the window" or "fidgets with wand" or "slumps in chair"
+        - NEVER: "leans back" again after already doing it!
+
+        - Stay COMPLETELY IN CHARACTER with your unique speaking style
+        - Don't repeat what others just said - add something NEW or DON'T SPEAK
+        - Keep messages realistic for casual conversation
+        - If you have nothing unique to add, choose "silent" type
+        - Your personality should be OBVIOUS from how you speak and act
+        - Don't sound like you're giving a lecture or writing an essay
+        - Use natural dialogue, contractions, and emotion
+        - Show, don't tell - use actions to convey personality
+        - **INDEPENDENCE**: Have your own opinions - don't just support what others said
+        - **BACKING OFF**: Sometimes "Alright, fair enough" or "Suit yourself" is the perfect response
+        - **RESPECTING AUTONOMY**: If someone clearly doesn't want to talk about something, that's OKAY
+        - **NATURAL FLOW**: Not every topic needs resolution. Sometimes you just move on.
+        - **REACT TO DANGER/CONCERN**: If your friend mentions pain, danger, or a threat - REACT! Even if they want to sleep after."""
+
+
+# Fixed instructions for each kind of character call; the static half of the prompt
+SYSTEM_RULES = {
+    "decision": f"""DECIDING HOW TO RESPOND:
+        {DECISION_GUIDANCE}
+
+        OUTPUT FORMAT (strict JSON):
+        
+        For "speak" type:
+        {{
+        "type": "speak",
+        "priority": 0.0 to 1.0 (how urgent/important is your response),
+        "reasoning": "brief explanation of your decision",
+        "dialogue": "your actual spoken words here(25-70 words)",
+        "action": "physical actions/body language accompanying speech. For example: 'smiles warmly', 'leans forward eagerly', 'frowns slightly', etc. in 15-20 words"
+        }}
+        
+        For "act" type:
+        {{
+        "type": "act",
+        "priority": 0.0 to 1.0,
+        "reasoning": "brief explanation of your decision",
+        "action": "silent physical action/reaction without speaking. For example 'crosses arms and looks away', 'paces to the window nervously', 'sits down heavily with a sigh', etc. in 15-20 words"
+        }}
+        
+        For "silent" type:
+        {{
+        "type": "silent",
+        "priority": 0.0,
+        "reasoning": "brief explanation why you're staying quiet"
+        }}
+
+        IMPORTANT:
+        - For "speak": Include dialogue (required) and action 
+        - For "act": Only include action (no dialogue)
+        - For "silent": Only type, priority, and reasoning
+
+        {RESPONSE_GUIDELINES}""",
+    "bid": f"""DECIDING HOW TO RESPOND:
+        {DECISION_GUIDANCE}
+        
+        OUTPUT FORMAT (strict JSON, nothing else):
+        {{
+        "type": "speak" | "act" | "silent",
+        "priority": 0.0 to 1.0 (how urgent/important is your response, 0.0 for "silent"),
+        "reasoning": "brief explanation of your decision in under 20 words"
+        }}""",
+    "speak": f"""WRITING YOUR RESPONSE:
+        OUTPUT FORMAT (strict JSON):
+        {{
+        "dialogue": "your actual spoken words here(25-70 words)",
+        "action": "physical actions/body language accompanying speech. For example: 'smiles warmly', 'leans forward eagerly', 'frowns slightly', etc. in 15-20 words"
+        }}
+        
+        {RESPONSE_GUIDELINES}""",
+    "act": f"""WRITING YOUR RESPONSE:
+        OUTPUT FORMAT (strict JSON):
+        {{
+        "action": "silent physical action/reaction without speaking. For example 'crosses arms and looks away', 'paces to the window nervously', 'sits down heavily with a sigh', etc. in 15-20 words"
+        }}
+        
+        {RESPONSE_GUIDELINES}""",
+}
+
+
+# Stand-ins for fields a decision or bid leaves out, so a partial answer still counts
+DECISION_DEFAULTS = {"type": "silent", "priority": 0.0, "reasoning": "No reasoning provided"}
+
+
+def _render_memory_event(event: TimelineEvent, is_own: bool) -> Optional[str]:
+    """Render one remembered event, framing the reader's own messages and actions as "You"."""
+    if isinstance(event, Message):
+        # This character's own messages - frame as "You said"
+        prefix = "You" if is_own else event.character
+        return f"{prefix}: *{event.action_description}* {event.dialouge}"
+    elif isinstance(event, Scene):
+        return f"[Scene at {event.location}]: {event.description}"
+    elif isinstance(event, Action):
+        # This character's own action - frame as "You"
+        prefix = "You" if is_own else event.character
+        return f"{prefix}: *{event.description}*"
+    elif isinstance(event, CharacterEntry):
+        return f"[{'You' if is_own else event.character} entered]: {event.description}"
+    elif isinstance(event, CharacterExit):
+        return f"[{'You' if is_own else event.character} left]: {event.description}"
+    return None
+
+
+def _memory_perspective(event: TimelineEvent, reader: Optional[str]) -> bool:
+    """Whether the reader is the character the event is about."""
+    return getattr(event, "character", None) == reader
+
+
+# Every character other than the one involved reads an event the same way, so they share its rendering.
+# Lines are bounded by max_lines and windows (one per memory and window size) by an LRU
+_memory_render_cache = RenderCache(_render_memory_event, _memory_perspective)
 
 
 class CharacterManager:
@@ -17,7 +188,14 @@ class CharacterManager:
     def __init__(self):
         """Initialize CharacterManager."""
         self.model_name = Config.DEFAULT_MODEL
-        self.model = GenerativeModel(self.model_name)
+        self.model = get_model(self.model_name)
+        self.summary_manager = SummaryManager()
+        
+        # Static system prompts, keyed by (character name, prompt kind)
+        self._system_prompts: Dict[Tuple[str, str], str] = {}
+        
+        # Vector index over each character's memory, keyed by character name
+        self._memory_indexes: Dict[str, MemoryIndex] = {}
     
     def create_character(
         self, 
@@ -57,6 +235,7 @@ class CharacterManager:
         """
             
         if event is not None:
+            # Embedding waits for the next recall (see retrieve_relevant_memories)
             character.memory.event.append(event)
     
     def update_character_state(
@@ -107,13 +286,10 @@ class CharacterManager:
     
     def build_state_context(self, character: Character) -> str:
         """Build the character's current state context including and current objective."""
-        if not character.state:
+        if not character.state or not character.state.current_objective:
             return ""
         
-        if character.state.current_objective:
-            context = f"\n- Current Objective: {character.state.current_objective}"
-        
-            return context
+        return f"\n- Current Objective: {character.state.current_objective}"
     
     def build_memory_context(self, character: Character, last_n_messages: Optional[int] = None) -> str:
         """Build the memory context string with actions noted from character's perceived messages.
@@ -121,44 +297,186 @@ class CharacterManager:
         Args:
             character: The Character whose memory to build context from
             last_n_messages: Optional number of recent messages to include. If None, includes all messages.
+                The window reaches further back to events the memory summary does not cover yet
+                (by at most one summary chunk; older ones are marked as left out).
         
         Returns:
             Formatted memory context string
         """
-        context_lines = []
-        if character.memory and character.memory.event:
-            events = character.memory.event
-            if last_n_messages is not None:
-                events = events[-last_n_messages:]
+        if not (character.memory and character.memory.event):
+            return ""
+        
+        start = self._memory_window_start(character, last_n_messages)
+        events = character.memory.event[start:]
+        
+        # Each event is rendered once per perspective; an unchanged window is returned as-is.
+        # Windows belong to this memory object: characters of other sessions may share the name
+        context = _memory_render_cache.window(
+            (id(character.memory), character.persona.name, last_n_messages),
+            events,
+            reader=character.persona.name
+        )
+        elided = self.summary_manager.elided_note(character.memory.summary, start)
+        return f"{elided}\n{context}" if elided else context
+    
+    def _memory_window_start(self, character: Character, last_n_messages: Optional[int]) -> int:
+        """Get the position in a character's memory where its recent window starts."""
+        return self.summary_manager.window_start(
+            character.memory.summary, len(character.memory.event), last_n_messages
+        )
+    
+    def get_memory_index(self, character: Character, end: Optional[int] = None) -> MemoryIndex:
+        """
+        Get the vector index over a character's memory, indexing events remembered since the last call.
+        
+        Args:
+            character: The Character whose memory index to get
+            end: Only index events before this position (None for the whole memory)
+        
+        Returns:
+            The character's MemoryIndex
+        """
+        name = character.persona.name
+        index = self._memory_indexes.get(name)
+        if index is None:
+            index = MemoryIndex(
+                dim=Config.MEMORY_INDEX_DIM,
+                embed=load_embedder(Config.MEMORY_EMBEDDING_MODEL)
+            )
+            self._memory_indexes[name] = index
+        # Embedded from a neutral perspective so every reader's index agrees
+        index.sync(character.memory.event, _memory_render_cache.line, end=end)
+        return index
+    
+    def retrieve_relevant_memories(
+        self,
+        character: Character,
+        last_n_messages: int = 10,
+        k: Optional[int] = None
+    ) -> List[TimelineEvent]:
+        """
+        Find remembered events older than the recent window that are relevant to it.
+        
+        Args:
+            character: The Character whose memory to search
+            last_n_messages: Size of the recent window the prompt already shows
+            k: Maximum number of events (defaults to Config.MEMORY_RETRIEVAL_K)
+        
+        Returns:
+            Relevant older events in chronological order
+        """
+        if not Config.MEMORY_RETRIEVAL or not (character.memory and character.memory.event):
+            return []
+        
+        events = character.memory.event
+        older_count = self._memory_window_start(character, last_n_messages)
+        if older_count <= 0:
+            return []
+        
+        # The latest few events and the character's objective say what is relevant now;
+        # the whole window would drown them in everyday words
+        query_lines = [_memory_render_cache.line(event) for event in events[-Config.MEMORY_QUERY_EVENTS:]]
+        query = "\n".join(line for line in query_lines if line is not None)
+        if character.state and character.state.current_objective:
+            query += "\n" + character.state.current_objective
+        
+        # Only events older than the window are searched, so only they have to be embedded;
+        # the index catches up on them here rather than each time an event is remembered
+        positions = self.get_memory_index(character, end=older_count).search(
+            query,
+            k=Config.MEMORY_RETRIEVAL_K if k is None else k,
+            before=older_count,
+            min_score=Config.MEMORY_RETRIEVAL_MIN_SCORE
+        )
+        return [events[position] for position in positions]
+    
+    def build_recall_context(self, character: Character, last_n_messages: int = 10) -> str:
+        """
+        Build the prompt section with relevant older memories (see retrieve_relevant_memories).
+        
+        Args:
+            character: The Character recalling
+            last_n_messages: Size of the recent window the prompt already shows
+        
+        Returns:
+            Prompt section, or "" if nothing relevant was found
+        """
+        recalled = self.retrieve_relevant_memories(character, last_n_messages=last_n_messages)
+        if not recalled:
+            return ""
+        
+        name = character.persona.name
+        lines = [_memory_render_cache.line(event, name) for event in recalled]
+        recalled_context = "\n".join(line for line in lines if line is not None)
+        return f"""
+        THINGS YOU REMEMBER FROM EARLIER (relevant now):
+        {recalled_context}"""
+    
+    def build_summary_context(self, character: Character) -> str:
+        """
+        Build the summarized memory of events older than the recent memory window.
+        
+        Args:
+            character: The Character whose memory summary to use
+        
+        Returns:
+            Prompt section with the rolling summaries, or "" if nothing has been summarized yet
+        """
+        if not character.memory:
+            return ""
+        summary_context = self.summary_manager.get_summary_context(character.memory.summary)
+        if not summary_context:
+            return ""
+        return f"""
+        WHAT HAPPENED EARLIER (summarized, your perspective):
+        {summary_context}"""
+    
+    async def update_memory_summary_async(self, character: Character) -> int:
+        """
+        Bring a character's rolling memory summary up to date, summarizing each full
+        chunk of newly remembered events once, from the character's perspective.
+        
+        Args:
+            character: The Character whose memory to summarize
+        
+        Returns:
+            Number of LLM calls made
+        """
+        if not character.memory or character.memory.summary is None:
+            return 0
+        name = character.persona.name
+        
+        def render(events: List[TimelineEvent]) -> str:
+            lines = [_memory_render_cache.line(event, name) for event in events]
+            return "\n".join(line for line in lines if line is not None)
+        
+        return await self.summary_manager.update_summary_async(
+            character.memory.summary, character.memory.event, render, perspective=name
+        )
+    
+    def build_system_prompt(self, character: Character, prompt_kind: str = "decision") -> str:
+        """
+        Get the static part of a character's prompt: persona plus the fixed rules for one kind of call.
+        Built once per character and kind and then reused, so every request starts with an
+        identical prefix that provider-side prompt caching can hit.
+        
+        Args:
+            character: The Character the prompt is for
+            prompt_kind: "decision" (decide and respond in one call), "bid", "speak" or "act"
             
-            for event in events:
-                if isinstance(event, Message):
-                    if event.character == character.persona.name:
-                        # This character's own messages - frame as "You said"
-                        prefix = "You"
-                    else:
-                        prefix = event.character
-                    context_lines.append(f"{prefix}: *{event.action_description}* {event.dialouge}")
-                elif isinstance(event, Scene):
-                    context_lines.append(f"[Scene at {event.location}]: {event.description}")
-                elif isinstance(event, Action):
-                    if event.character == character.persona.name:
-                        # This character's own action - frame as "You"
-                        context_lines.append(f"You: *{event.description}*")
-                    else:
-                        context_lines.append(f"{event.character}: *{event.description}*")
-                elif isinstance(event, CharacterEntry):
-                    if event.character == character.persona.name:
-                        context_lines.append(f"[You entered]: {event.description}")
-                    else:
-                        context_lines.append(f"[{event.character} entered]: {event.description}")
-                elif isinstance(event, CharacterExit):
-                    if event.character == character.persona.name:
-                        context_lines.append(f"[You left]: {event.description}")
-                    else:
-                        context_lines.append(f"[{event.character} left]: {event.description}")
-        
-        return "\n".join(context_lines)
+        Returns:
+            The system prompt string
+        """
+        key = (character.persona.name, prompt_kind)
+        system_prompt = self._system_prompts.get(key)
+        if system_prompt is None:
+            persona_context = self.build_persona_context(character)
+            system_prompt = f"""{persona_context}
+        
+        {SYSTEM_RULES[prompt_kind]}
+        """
+            self._system_prompts[key] = system_prompt
+        return system_prompt
     
     def build_decision_prompt(
         self, 
@@ -167,126 +485,121 @@ class CharacterManager:
         """
         Build the prompt for deciding whether to speak FROM THIS CHARACTER'S PERSPECTIVE.
         Each character sees the conversation through their own lens.
+        Only the volatile part (state and memory); send it with build_system_prompt(character).
         
         Args:
             character: The AICharacter making the decision
-            story_context: Optional story context to guide the narrative
             
         Returns:
             The complete prompt string 
         """ 
 
-        persona_context = self.build_persona_context(character)
-        state_context = self.build_state_context(character)
+        state_context = self.build_state_context(character) or " No current objective"
+        summary_context = self.build_summary_context(character)
+        recall_context = self.build_recall_context(character, last_n_messages=10)
         memory_context = self.build_memory_context(character, last_n_messages=10)
         
-        prompt = f"""{persona_context}{state_context}
+        prompt = f"""YOUR CURRENT STATE:{state_context}{summary_context}{recall_context}
         WHAT YOU EXPERIENCED (your perspective):
         {memory_context}
         DECISION:
         Based on YOUR experiences, YOUR traits, and YOUR current state, decide how you want to respond right now.
+        Follow the OUTPUT FORMAT and guidelines above.
+        """
+        return prompt
+    
+    def build_bid_prompt(
+        self,
+        character: Character
+    ) -> str:
+        """
+        Build the short prompt for bidding on the next turn without writing the response.
+        Used by two-stage speaker selection; only the winner gets a response prompt.
+        Only the volatile part; send it with build_system_prompt(character, "bid").
         
-        THREE OPTIONS:
-        1. **SPEAK** - Respond with dialogue (and accompanying action)
-        2. **ACT** - React physically/emotionally WITHOUT speaking (silent action)
-        3. **SILENT** - Do nothing, stay quiet
+        Args:
+            character: The Character making the decision
         
-        WHEN TO SPEAK (high priority):
-        1. **Someone greets the group or asks how everyone is doing** - It's natural to respond as friends!
-        2. **Someone reveals important/concerning information** - React with your authentic concern!
-        3. **You're directly addressed or mentioned** - Respond naturally!
-        4. **There's been awkward silence** - Someone should break it!
-        5. **The topic is highly relevant to YOU** - Share your unique perspective!
-        6. **Someone needs help or support** - Friends respond to friends!
+        Returns:
+            The complete prompt string
+        """
+        state_context = self.build_state_context(character) or " No current objective"
+        summary_context = self.build_summary_context(character)
+        recall_context = self.build_recall_context(character, last_n_messages=10)
+        memory_context = self.build_memory_context(character, last_n_messages=10)
         
-        WHEN TO ACT (medium priority):
-        - You want to react but words feel forced or unnecessary
-        - Showing emotion through body language is more powerful than speaking
-        - High tension moment where silence + action is more dramatic
-        - You're uncomfortable/unsure and just want to show physical reaction
-        - Someone said something shocking and you need a moment to process
-        - Physical reaction conveys your feeling better than words would
-
-        WHEN TO STAY SILENT (stay quiet):
-        - You JUST spoke in the last message (let others respond first)
-        - Someone else already said exactly what you'd say
-        - You've made the same point 2-3+ times already (don't be repetitive!)
-        - **If others already reacted to danger/concern, you don't need to pile on with the SAME reaction**
-        - Someone clearly wants to end a topic and you'd just push it again
-        - Another character is better suited to respond to this specific topic
-        - The conversation doesn't involve you and you have nothing unique to add
-        - **Multiple people already said similar things - don't be the third person saying the same thing**
-
-        SPECIAL SITUATIONS:
-        - **RESPECT BOUNDARIES**: If someone has stated their position, accept it or change approach
-        - **REACT TO DANGER/CONCERN**: If friend mentions pain/danger/threat, respond with concern ONLY if you have something UNIQUE to add beyond what others said
-        - **WITHDRAWAL CONTEXT**: If someone needs rest after revealing something serious, acknowledge both parts
-        - **DON'T GANG UP**: If another character already made your exact point, DON'T repeat it - offer a DIFFERENT suggestion or stay quiet
-        - **BE INDEPENDENT**: Have your own opinions - don't just echo what others said with slightly different words
-        - **NATURAL FLOW**: Sometimes "Alright, if you say so" or changing subjects IS the right move
-        - **CHECK WHAT OTHERS SAID**: Look at the last 2-3 messages. If they already covered your concern, you don't need to repeat it
-
-        OUTPUT FORMAT (strict JSON):
+        prompt = f"""YOUR CURRENT STATE:{state_context}{summary_context}{recall_context}
+        WHAT YOU EXPERIENCED (your perspective):
+        {memory_context}
+        DECISION:
+        Based on YOUR experiences, YOUR traits, and YOUR current state, decide how you want to respond right now.
+        Do NOT write the response itself yet - only decide.
+        """
+        return prompt
+    
+    def build_response_prompt(
+        self,
+        character: Character,
+        response_type: str,
+        reasoning: Optional[str] = None
+    ) -> str:
+        """
+        Build the prompt for writing the response a character has already decided on.
+        Only the volatile part; send it with build_system_prompt(character, response_type).
         
-        For "speak" type:
-        {{
-        "type": "speak",
-        "priority": 0.0 to 1.0 (how urgent/important is your response),
-        "reasoning": "brief explanation of your decision",
-        "dialogue": "your actual spoken words here(25-70 words)",
-        "action": "physical actions/body language accompanying speech. For example: 'smiles warmly', 'leans forward eagerly', 'frowns slightly', etc. in 15-20 words"
-        }}
+        Args:
+            character: The Character who won the turn
+            response_type: "speak" or "act"
+            reasoning: The character's reasoning from its bid, if any
         
-        For "act" type:
-        {{
-        "type": "act",
-        "priority": 0.0 to 1.0,
-        "reasoning": "brief explanation of your decision",
-        "action": "silent physical action/reaction without speaking. For example 'crosses arms and looks away', 'paces to the window nervously', 'sits down heavily with a sigh', etc. in 15-20 words"
-        }}
+        Returns:
+            The complete prompt string
+        """
+        state_context = self.build_state_context(character) or " No current objective"
+        summary_context = self.build_summary_context(character)
+        recall_context = self.build_recall_context(character, last_n_messages=10)
+        memory_context = self.build_memory_context(character, last_n_messages=10)
         
-        For "silent" type:
-        {{
-        "type": "silent",
-        "priority": 0.0,
-        "reasoning": "brief explanation why you're staying quiet"
-        }}
-
-        IMPORTANT:
-        - For "speak": Include dialogue (required) and action 
-        - For "act": Only include action (no dialogue)
-        - For "silent": Only type, priority, and reasoning
-
-        **CRITICAL - ACTION VARIETY RULES (READ THIS CAREFULLY):**
-        1. **CHECK THE CONVERSATION ABOVE** - Look at your previous messages. What actions did you ALREADY do?
-        2. **NEVER REPEAT ACTIONS** - If you already "leaned forward", "sat back", "crossed arms", "looked at someone" - DON'T DO IT AGAIN
-        3. **PHYSICAL CONSISTENCY** - If you already sat down or leaned back, you can't lean back AGAIN. Instead: stand up, walk somewhere, gesture differently, adjust position, look away, etc.
-        4. **VARIETY IS MANDATORY** - Each of your actions MUST be different from all your previous actions in this conversation
-        5. **EXAMPLES OF VARIETY**:
-        - First message: "leans back against sofa"
-        - Second message: "sits forward suddenly" or "stands up" or "runs hand through hair"
-        - Third message: "paces to the window" or "fidgets with wand" or "slumps in chair"
-        - NEVER: "leans back" again after already doing it!
-
-        - Stay COMPLETELY IN CHARACTER with your unique speaking style
-        - Don't repeat what others just said - add something NEW or DON'T SPEAK
-        - Keep messages realistic for casual conversation
-        - If you have nothing unique to add, choose "silent" type
-        - Your personality should be OBVIOUS from how you speak and act
-        - Don't sound like you're giving a lecture or writing an essay
-        - Use natural dialogue, contractions, and emotion
-        - Show, don't tell - use actions to convey personality
-        - **INDEPENDENCE**: Have your own opinions - don't just support what others said
-        - **BACKING OFF**: Sometimes "Alright, fair enough" or "Suit yourself" is the perfect response
-        - **RESPECTING AUTONOMY**: If someone clearly doesn't want to talk about something, that's OKAY
-        - **NATURAL FLOW**: Not every topic needs resolution. Sometimes you just move on.
-        - **REACT TO DANGER/CONCERN**: If your friend mentions pain, danger, or a threat - REACT! Even if they want to sleep after.
+        if response_type == "speak":
+            decision = "You have decided to SPEAK - respond with dialogue and an accompanying action."
+        else:
+            decision = "You have decided to ACT - react physically/emotionally WITHOUT speaking."
+        
+        if reasoning:
+            decision += f"\n        Your reasoning: {reasoning}"
+        
+        prompt = f"""YOUR CURRENT STATE:{state_context}{summary_context}{recall_context}
+        WHAT YOU EXPERIENCED (your perspective):
+        {memory_context}
+        YOUR TURN:
+        {decision}
         """
         return prompt
     
     def decide_turn_response(
         self, 
         character: Character
+    ) -> Tuple[str, float, str, Optional[str], Optional[str]]:
+        """
+        Decide whether this character should speak, act silently, or stay silent (blocking wrapper).
+        Each character uses different generation settings for unique voices.
+        
+        Args:
+            character: The Character making the decision
+            
+        Returns:
+            Tuple of (response_type, priority, reasoning, dialouge, action)
+            - response_type: "speak", "act", or "silent"
+            - priority: 0.0 to 1.0
+            - reasoning: Explanation of decision
+            - dialouge: For "speak" = dialogue, For "act" = action, For "silent" = None
+            - action: For "speak" = body_language, For "act"/"silent" = None
+        """
+        return run_sync(self.decide_turn_response_async(character))
+    
+    async def decide_turn_response_async(
+        self, 
+        character: Character
     ) -> Tuple[str, float, str, Optional[str], Optional[str]]:
         """
         Decide whether this character should speak, act silently, or stay silent.
@@ -309,15 +622,19 @@ class CharacterManager:
             prompt = self.build_decision_prompt(character)
             
             # Generate with character's unique settings
-            response = self.model.generate_content(
+            response = await self.model.generate_content_async(
                 prompt, 
+                system_prompt=self.build_system_prompt(character, "decision"),
                 temperature=character.persona.temperature, 
                 top_p=character.persona.top_p, 
-                frequency_penalty=character.persona.frequency_penalty
+                frequency_penalty=character.persona.frequency_penalty,
+                stage="decision",
+                response_format=response_schemas.DECISION,
+                character=character.persona.name
             )
             
             # Parse JSON response
-            decision_data = parse_json_response(response.text)
+            decision_data = parse_json_response(response.text, defaults=DECISION_DEFAULTS)
             
             response_type = decision_data.get("type", "silent").lower()
             priority = decision_data.get("priority", 0.0)
@@ -347,6 +664,160 @@ class CharacterManager:
         except Exception as e:
             raise e
     
+    def decide_turn_bid(
+        self,
+        character: Character
+    ) -> Tuple[str, float, str, Optional[str], Optional[str]]:
+        """
+        Decide how this character wants to respond without generating the response (blocking wrapper).
+        
+        Args:
+            character: The Character making the decision
+        
+        Returns:
+            Tuple of (response_type, priority, reasoning, None, None)
+        """
+        return run_sync(self.decide_turn_bid_async(character))
+    
+    async def decide_turn_bid_async(
+        self,
+        character: Character
+    ) -> Tuple[str, float, str, Optional[str], Optional[str]]:
+        """
+        Decide how this character wants to respond without generating the response.
+        The bid is capped at Config.BID_MAX_TOKENS so polling every character stays cheap;
+        the dialogue/action is generated afterwards for the winner only.
+        
+        Args:
+            character: The Character making the decision
+        
+        Returns:
+            Tuple of (response_type, priority, reasoning, None, None), shaped like
+            decide_turn_response() with the response fields left empty
+        """
+        prompt = self.build_bid_prompt(character)
+        
+        response = await self.model.generate_content_async(
+            prompt,
+            system_prompt=self.build_system_prompt(character, "bid"),
+            temperature=character.persona.temperature,
+            top_p=character.persona.top_p,
+            frequency_penalty=character.persona.frequency_penalty,
+            max_tokens=Config.BID_MAX_TOKENS,
+            stage="bid",
+            response_format=response_schemas.BID,
+            character=character.persona.name
+        )
+        
+        decision_data = parse_json_response(response.text, defaults=DECISION_DEFAULTS)
+        
+        response_type = decision_data.get("type", "silent").lower()
+        priority = decision_data.get("priority", 0.0)
+        reasoning = decision_data.get("reasoning", "No reasoning provided")
+        
+        return (response_type, priority, reasoning, None, None)
+    
+    def generate_turn_response(
+        self,
+        character: Character,
+        response_type: str,
+        reasoning: Optional[str] = None
+    ) -> Tuple[Optional[str], Optional[str]]:
+        """
+        Generate the dialogue/action for a decided turn (blocking wrapper).
+        
+        Args:
+            character: The Character who won the turn
+            response_type: "speak" or "act"
+            reasoning: The character's reasoning from its bid, if any
+        
+        Returns:
+            Tuple of (dialogue, action)
+        """
+        return run_sync(self.generate_turn_response_async(character, response_type, reasoning))
+    
+    async def generate_turn_response_async(
+        self,
+        character: Character,
+        response_type: str,
+        reasoning: Optional[str] = None
+    ) -> Tuple[Optional[str], Optional[str]]:
+        """
+        Generate the dialogue/action for a turn the character has already won.
+        
+        Args:
+            character: The Character who won the turn
+            response_type: "speak" or "act"
+            reasoning: The character's reasoning from its bid, if any
+        
+        Returns:
+            Tuple of (dialogue, action); dialogue is None for "act"
+        """
+        prompt = self.build_response_prompt(character, response_type, reasoning)
+        
+        response = await self.model.generate_content_async(
+            prompt,
+            system_prompt=self.build_system_prompt(character, response_type),
+            temperature=character.persona.temperature,
+            top_p=character.persona.top_p,
+            frequency_penalty=character.persona.frequency_penalty,
+            stage="response",
+            response_format=response_schemas.SPEAK if response_type == "speak" else response_schemas.ACT,
+            character=character.persona.name
+        )
+        
+        response_data = parse_json_response(response.text)
+        
+        if response_type == "speak":
+            return response_data.get("dialogue", None), response_data.get("action", None)
+        return None, response_data.get("action", None)
+    
+    def start_turn_response_stream(
+        self,
+        character: Character,
+        response_type: Optional[str] = None,
+        reasoning: Optional[str] = None
+    ) -> DecisionStream:
+        """
+        Start a streamed turn decision for this character.
+        Must be called from a running event loop; generation continues in a background task.
+        
+        Args:
+            character: The Character making the decision
+            response_type: If the character already won the turn with a bid, the decided
+                "speak"/"act" type; only the response is then generated
+            reasoning: The character's reasoning from its bid, if any
+        
+        Returns:
+            DecisionStream exposing the header (type, priority, reasoning) as soon as it is
+            parsed, and the dialogue/action text fragment by fragment
+        """
+        if response_type is None:
+            prompt = self.build_decision_prompt(character)
+            system_prompt = self.build_system_prompt(character, "decision")
+            response_format = response_schemas.DECISION
+            stream = DecisionStream(character.persona.name)
+        else:
+            prompt = self.build_response_prompt(character, response_type, reasoning)
+            system_prompt = self.build_system_prompt(character, response_type)
+            response_format = response_schemas.SPEAK if response_type == "speak" else response_schemas.ACT
+            stream = DecisionStream(
+                character.persona.name,
+                header=(response_type, 1.0, reasoning or "No reasoning provided")
+            )
+        
+        chunks = self.model.stream_content_async(
+            prompt,
+            system_prompt=system_prompt,
+            temperature=character.persona.temperature,
+            top_p=character.persona.top_p,
+            frequency_penalty=character.persona.frequency_penalty,
+            stage="decision" if response_type is None else "response",
+            response_format=response_format,
+            character=character.persona.name
+        )
+        return stream.start(chunks)
+    
     def broadcast_event_to_characters(self, characters: List[Character], event: TimelineEvent) -> None:
         """
         Add a TimelineEvent to all characters' events.
@@ -357,4 +828,25 @@ class CharacterManager:
             event: The event being broadcasted
         """
         for character in characters:
-            self.update_character_memory(character, event=event)
\ No newline at end of file
+            self.update_character_memory(character, event=event)
+    
+    def attach_memories(
+        self,
+        characters: List[Character],
+        events: List[TimelineEvent],
+        presence_intervals: Dict[str, List[Tuple[int, Optional[int]]]]
+    ) -> None:
+        """
+        Give characters the events they witnessed in bulk, e.g. when resuming a saved conversation.
+        Equivalent to broadcasting every event to whoever was present at that moment, but
+        each range is stored as a view over the events instead of being copied.
+        
+        Args:
+            characters: Characters whose memories to fill
+            events: Timeline events in order
+            presence_intervals: Ranges of event indexes each character witnessed
+                (see TimelineManager.compute_presence_intervals)
+        """
+        for character in characters:
+            for start, end in presence_intervals.get(character.persona.name, []):
+                character.memory.event.add_range(events, start, end)
\ No newline at end of file
@@ -9,8 +9,10 @@ sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from data_models import Story, Character, TimelineHistory
 from config import Config
-from openrouter_client import GenerativeModel
+from openrouter_client import get_model
 from helpers.response_parser import parse_json_response
+from helpers import response_schemas
+from helpers.async_runner import run_sync
 from managers.timelineManager import TimelineManager
 
 
@@ -25,7 +27,8 @@ class StoryManager:
             story: The story to manage
         """
         self.story = story
-        self.model = GenerativeModel(Config.DEFAULT_MODEL)
+        self.model = get_model(Config.DEFAULT_MODEL)
+        self.timeline_manager = TimelineManager()
     
     def get_current_objective(self) -> Optional[str]:
         """Get the current story objective."""
@@ -75,6 +78,23 @@ class StoryManager:
         self,
         active_characters: List[Character],
         timeline: TimelineHistory
+    ) -> Dict[str, Any]:
+        """
+        Blocking wrapper around evaluate_and_assign_objectives_async().
+        
+        Args:
+            active_characters: List of currently active characters
+            timeline: TimelineHistory object containing all context
+            
+        Returns:
+            Dictionary with evaluation results (see evaluate_and_assign_objectives_async)
+        """
+        return run_sync(self.evaluate_and_assign_objectives_async(active_characters, timeline))
+    
+    async def evaluate_and_assign_objectives_async(
+        self,
+        active_characters: List[Character],
+        timeline: TimelineHistory
     ) -> Dict[str, Any]:
         """
         Unified LLM call that handles both initial assignment and ongoing evaluation.
@@ -120,10 +140,8 @@ class StoryManager:
             for char in active_characters
         )
         
-        # Build timeline summary using TimelineManager
-        
-        timeline_manager = TimelineManager()
-        timeline_text = timeline_manager.get_timeline_context(timeline, recent_event_count=15)
+        # Build timeline summary using the shared TimelineManager
+        timeline_text = self.timeline_manager.get_timeline_context(timeline, recent_event_count=15)
         
         # Build character info
         char_info = []
@@ -203,7 +221,13 @@ class StoryManager:
             }}"""
 
         try:
-            response = self.model.generate_content(prompt)
+            response_format = response_schemas.judge_format(
+                [char.persona.name for char in active_characters],
+                ["assigned"] if is_first_turn else ["completed", "continuing"]
+            )
+            response = await self.model.generate_content_async(
+                prompt, priority="background", stage="judge", response_format=response_format
+            )
             result = parse_json_response(response.text)
             return result
             
@@ -0,0 +1,215 @@
+"""
+Manager for incremental, hierarchical summaries of long timelines and memories.
+"""
+
+from typing import Callable, List, Optional, Sequence
+import sys
+from pathlib import Path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from data_models import RollingSummary, SummaryNode, TimelineEvent
+from config import Config
+from openrouter_client import get_model
+from helpers.response_parser import parse_json_response
+from helpers import response_schemas
+from helpers.async_runner import run_sync
+
+
+class SummaryManager:
+    """
+    Keeps RollingSummary hierarchies up to date.
+
+    Each chunk of events is summarized exactly once; groups of summaries are then
+    rolled into higher-level summaries. Prompts include the summary frontier plus a
+    fixed window of recent events, so their size does not grow with the campaign.
+    """
+
+    def __init__(
+        self,
+        chunk_size: Optional[int] = None,
+        fanout: Optional[int] = None,
+        max_levels: Optional[int] = None
+    ):
+        """
+        Initialize SummaryManager.
+
+        Args:
+            chunk_size: Events per first-level summary (defaults to Config.SUMMARY_CHUNK_SIZE)
+            fanout: Summaries rolled into one on the level above (defaults to Config.SUMMARY_FANOUT)
+            max_levels: Number of summary levels; the top one rolls into itself
+                (defaults to Config.SUMMARY_MAX_LEVELS)
+        """
+        self.chunk_size = chunk_size or Config.SUMMARY_CHUNK_SIZE
+        self.fanout = max(fanout or Config.SUMMARY_FANOUT, 2)
+        self.max_levels = max(max_levels or Config.SUMMARY_MAX_LEVELS, 1)
+        self.model = get_model(Config.DEFAULT_MODEL)
+
+    def update_summary(
+        self,
+        summary: RollingSummary,
+        events: Sequence[TimelineEvent],
+        render: Callable[[List[TimelineEvent]], str],
+        perspective: Optional[str] = None
+    ) -> int:
+        """
+        Summarize every full chunk not yet covered and roll summaries up (blocking wrapper).
+
+        Returns:
+            Number of LLM calls made
+        """
+        return run_sync(self.update_summary_async(summary, events, render, perspective))
+
+    async def update_summary_async(
+        self,
+        summary: RollingSummary,
+        events: Sequence[TimelineEvent],
+        render: Callable[[List[TimelineEvent]], str],
+        perspective: Optional[str] = None
+    ) -> int:
+        """
+        Summarize every full chunk not yet covered and roll summaries up.
+
+        Args:
+            summary: The hierarchy to update in place
+            events: The append-only events it summarizes (timeline events or a memory)
+            render: Function turning a list of events into prompt text
+            perspective: Name of the character whose memory this is, or None for the narrator
+
+        Returns:
+            Number of LLM calls made
+        """
+        summary.align(events)
+        calls = 0
+
+        while True:
+            chunk = summary.next_chunk(len(events), self.chunk_size)
+            if chunk is None:
+                break
+            start, end = chunk
+            chunk_events = list(events[start:end])
+            text = await self._summarize_events_async(render(chunk_events), perspective)
+            calls += 1
+            # Refused if a concurrent update already covered this chunk
+            if not summary.add_chunk(start, end, text, chunk_events[-1].timeline_id):
+                break
+
+            while True:
+                children = summary.next_rollup(self.fanout, self.max_levels)
+                if children is None:
+                    break
+                text = await self._roll_up_async(children, perspective)
+                calls += 1
+                if not summary.apply_rollup(children, text, self.max_levels):
+                    break
+
+        return calls
+
+    def window_start(self, summary: Optional[RollingSummary], event_count: int, recent_count: Optional[int]) -> int:
+        """
+        Get where a prompt's window of recent events has to start so that every event
+        is either summarized or shown. Summaries advance a chunk at a time and lag
+        behind in the background, so the last recent_count events are extended back
+        to the first event no summary covers yet, but by at most one chunk: if the
+        summaries fall further behind (failing, or missing after a resume), the
+        oldest uncovered events are left out (see elided_count) rather than letting
+        every prompt grow with the conversation.
+
+        Args:
+            summary: The summaries shown alongside the window (None if there are none)
+            event_count: Number of events
+            recent_count: Size of the recent window, or None for all events
+
+        Returns:
+            Position of the first event in the window
+        """
+        if recent_count is None:
+            return 0
+        start = max(event_count - recent_count, 0)
+        if Config.ROLLING_SUMMARIES and summary is not None:
+            start = max(min(start, summary.summarized_count), event_count - recent_count - self.chunk_size, 0)
+        return start
+
+    def elided_count(self, summary: Optional[RollingSummary], start: int) -> int:
+        """
+        Get how many events before a window (see window_start) are neither summarized nor shown.
+
+        Args:
+            summary: The summaries shown alongside the window (None if there are none)
+            start: Position of the first event in the window
+
+        Returns:
+            Number of left-out events
+        """
+        if not Config.ROLLING_SUMMARIES or summary is None:
+            return 0
+        return max(start - summary.summarized_count, 0)
+
+    def elided_note(self, summary: Optional[RollingSummary], start: int) -> str:
+        """Get the prompt line marking the events left out before a window, or "" if there are none."""
+        count = self.elided_count(summary, start)
+        if not count:
+            return ""
+        return f"[... {count} earlier events, not summarized yet, are left out ...]"
+
+    def get_summary_context(self, summary: Optional[RollingSummary]) -> str:
+        """
+        Format a summary frontier for a prompt, oldest first.
+
+        Args:
+            summary: The hierarchy to format
+
+        Returns:
+            One line per summary, or "" if nothing has been summarized yet
+        """
+        if not summary or not summary.nodes:
+            return ""
+        return "\n".join(f"- {node.text}" for node in summary.nodes)
+
+    async def _summarize_events_async(self, events_text: str, perspective: Optional[str]) -> str:
+        """Summarize one chunk of rendered events."""
+        if perspective:
+            viewpoint = f"Summarize these events as {perspective} experienced them, written in the second person (\"you\")."
+        else:
+            viewpoint = "Summarize these events as a neutral narrator."
+
+        prompt = f"""You are summarizing part of a roleplay timeline so it can be remembered later.
+        EVENTS:
+        {events_text}
+        TASK: {viewpoint}
+        Write 2-3 sentences covering important decisions, revelations, changes of location,
+        who came and went, and how relationships shifted. Leave out small talk.
+
+        OUTPUT FORMAT (strict JSON):
+        {{
+        "summary": "Your 2-3 sentence summary here"
+        }}"""
+        return await self._generate_summary_async(prompt)
+
+    async def _roll_up_async(self, children: List[SummaryNode], perspective: Optional[str]) -> str:
+        """Condense consecutive summaries into one."""
+        summaries_text = "\n".join(f"- {node.text}" for node in children)
+        viewpoint = f" Keep {perspective}'s perspective (second person)." if perspective else ""
+
+        prompt = f"""You are condensing consecutive summaries of a roleplay timeline into one.
+        SUMMARIES (oldest first):
+        {summaries_text}
+        TASK: Merge them into a single 2-4 sentence summary that keeps the facts that still
+        matter for the story: goals, decisions, revelations and relationships.{viewpoint}
+
+        OUTPUT FORMAT (strict JSON):
+        {{
+        "summary": "Your 2-4 sentence summary here"
+        }}"""
+        return await self._generate_summary_async(prompt)
+
+    async def _generate_summary_async(self, prompt: str) -> str:
+        """Run a summary prompt and extract the summary text."""
+        response = await self.model.generate_content_async(
+            prompt, temperature=0.3, priority="background", stage="summary",
+            response_format=response_schemas.SUMMARY
+        )
+        summary_data = parse_json_response(response.text)
+        summary = summary_data.get("summary") if isinstance(summary_data, dict) else None
+        if not summary:
+            raise ValueError("Summary response did not contain a summary")
+        return summary.strip()
@@ -3,14 +3,52 @@ Timeline Manager for unified timeline event operations.
 Combines message and scene management into a single chronological timeline.
 """
 
-from typing import List, Optional, Dict
+from typing import List, Optional, Dict, Tuple
 import sys
 from pathlib import Path
 sys.path.insert(0, str(Path(__file__).parent.parent))
 from data_models import Message, Scene, Action, TimelineHistory, TimelineEvent, CharacterEntry, CharacterExit
 from config import Config
-from openrouter_client import GenerativeModel
+from openrouter_client import get_model
 from helpers.response_parser import parse_json_response
+from helpers import response_schemas
+from helpers.async_runner import run_sync
+from helpers.render_cache import RenderCache
+from managers.summaryManager import SummaryManager
+from storage import ConversationStore, events_from_dicts
+from storage.serialization import EVENT_TYPES
+
+# event_type filters accepted by get_recent_events()
+EVENT_TYPE_FILTERS = {
+    "message": Message,
+    "scene": Scene,
+    "action": Action,
+    "entry": CharacterEntry,
+    "exit": CharacterExit,
+}
+
+# Record "type" tag of each event class, for filtering events read from a store
+RECORD_TYPES = {event_class: record_type for record_type, event_class in EVENT_TYPES.items()}
+
+
+def _render_timeline_event(event: TimelineEvent, perspective=None) -> Optional[str]:
+    """Render one event as a line of the narrator's timeline context."""
+    if isinstance(event, Message):
+        return f"{event.character}: {event.dialouge}"
+    elif isinstance(event, Scene):
+        return f"[SCENE at {event.location}] {event.description}"
+    elif isinstance(event, Action):
+        return f"[ACTION] {event.character}: {event.description}"
+    elif isinstance(event, CharacterEntry):
+        return f"[ENTERED] {event.character}: {event.description}"
+    elif isinstance(event, CharacterExit):
+        return f"[LEFT] {event.character}: {event.description}"
+    return None
+
+
+# Shared by every TimelineManager so the scene, movement and judge prompts reuse each other's work.
+# Lines are bounded by max_lines and windows (one per timeline and window size) by an LRU
+_timeline_render_cache = RenderCache(_render_timeline_event)
 
 
 class TimelineManager:
@@ -19,7 +57,8 @@ class TimelineManager:
     def __init__(self):
         """Initialize TimelineManager."""
         self.model_name = Config.DEFAULT_MODEL
-        self.model = GenerativeModel(self.model_name)
+        self.model = get_model(self.model_name)
+        self.summary_manager = SummaryManager()
 
     # ========== Timeline Operations ==========
     
@@ -60,6 +99,7 @@ class TimelineManager:
             event: TimelineEvent instance to add (Message or Scene)
         """
         timeline.events.append(event)
+        timeline.sync_indexes()
         
         # If it's a message, update participants
         if isinstance(event, Message):
@@ -89,39 +129,38 @@ class TimelineManager:
     
     def get_recent_events(
         self, 
-        timeline: TimelineHistory, 
+        timeline: Optional[TimelineHistory], 
         n: Optional[int] = 10,
-        event_type: Optional[str] = None
+        event_type: Optional[str] = None,
+        store: Optional[ConversationStore] = None
     ) -> List[TimelineEvent]:
         """
         Get the n most recent events from timeline.
         
         Args:
-            timeline: TimelineHistory instance to retrieve from
+            timeline: TimelineHistory instance to retrieve from (may be None when reading from a store)
             n: Number of recent events, or None to get all events
             event_type: Optional filter - "message", "scene", "action", "entry", "exit" or None for all
+            store: Optional ConversationStore to answer from instead, e.g. for a saved
+                session that is not loaded (only saved events are returned)
             
         Returns:
             List of recent events
         """
-        events = timeline.events
+        event_class = EVENT_TYPE_FILTERS.get(event_type)
+        if store is not None:
+            record_type = RECORD_TYPES[event_class] if event_class is not None else None
+            return events_from_dicts(store.recent_events(n, record_type))
         
-        # Filter by type if specified
-        if event_type == "message":
-            events = [e for e in events if isinstance(e, Message)]
-        elif event_type == "scene":
-            events = [e for e in events if isinstance(e, Scene)]
-        elif event_type == "action":
-            events = [e for e in events if isinstance(e, Action)]
-        elif event_type == "entry":
-            events = [e for e in events if isinstance(e, CharacterEntry)]
-        elif event_type == "exit":
-            events = [e for e in events if isinstance(e, CharacterExit)]
+        # Filter by type if specified, using the timeline's per-type index
+        if event_class is not None:
+            return timeline.get_events_of_type(event_class, n)
         
         # Return all events if n is None, otherwise return last n events
+        # (slicing the compact event store builds the events as a list)
         if n is None:
-            return events
-        return events[-n:] if len(events) > n else events
+            return timeline.events[:]
+        return timeline.events[-n:]
     
     def get_current_location(self, timeline: TimelineHistory) -> Optional[str]:
         """
@@ -133,34 +172,79 @@ class TimelineManager:
         Returns:
             Current location string or None
         """
-        scenes = self.get_recent_events(timeline,n=1,event_type="scene")
-        return scenes[0].location if scenes else None
+        return timeline.get_current_location()
     
-    def get_timeline_context(self, timeline: TimelineHistory, recent_event_count: int = 10) -> str:
+    def compute_presence_intervals(
+        self,
+        events: List[TimelineEvent],
+        initially_present: List[str]
+    ) -> Dict[str, List[Tuple[int, Optional[int]]]]:
+        """
+        Work out, in a single pass, which stretches of the timeline each character witnessed.
+        Follows add_event(): presence is updated before an event is broadcast, so an entering
+        character witnesses its own entry and a leaving character does not witness its exit.
+        
+        Args:
+            events: Timeline events in order
+            initially_present: Characters present before the first event
+            
+        Returns:
+            Dictionary mapping character names to half-open (start, end) event index ranges,
+            usable as events[start:end]. A character still present has a final range with end=None.
+        """
+        present_since = {name: 0 for name in initially_present}
+        intervals: Dict[str, List[Tuple[int, Optional[int]]]] = {name: [] for name in initially_present}
+        
+        for index, event in enumerate(events):
+            if isinstance(event, CharacterExit):
+                start = present_since.pop(event.character, None)
+                if start is not None:
+                    intervals[event.character].append((start, index))
+            elif isinstance(event, (Message, Action, CharacterEntry)):
+                # Speaking or acting also brings a character (back) into the scene
+                if event.character not in present_since:
+                    present_since[event.character] = index
+                    intervals.setdefault(event.character, [])
+        
+        for name, start in present_since.items():
+            intervals[name].append((start, None))
+        
+        return intervals
+    
+    def get_timeline_context(self, timeline: TimelineHistory, recent_event_count: Optional[int] = 10) -> str:
         """
-        Build a formatted string representation of timeline events.
+        Build a formatted string representation of timeline events: the rolling summaries,
+        then the recent events. The recent part is at least recent_event_count events and
+        reaches back to the first event not yet summarized (by at most one summary chunk;
+        older unsummarized events are marked as left out).
         
         Args:
-            events: List of TimelineEvent instances to format
+            timeline: TimelineHistory instance to format
+            recent_event_count: Minimum number of recent events shown, or None for all events
             
         Returns:
             Formatted timeline string with one event per line
         """
-        timeline_context = []
-        events = self.get_recent_events(timeline, n=recent_event_count)
-        for event in events:
-            if isinstance(event, Message):
-                timeline_context.append(f"{event.character}: {event.dialouge}")
-            elif isinstance(event, Scene):
-                timeline_context.append(f"[SCENE at {event.location}] {event.description}")
-            elif isinstance(event, Action):
-                timeline_context.append(f"[ACTION] {event.character}: {event.description}")
-            elif isinstance(event, CharacterEntry):
-                timeline_context.append(f"[ENTERED] {event.character}: {event.description}")
-            elif isinstance(event, CharacterExit):
-                timeline_context.append(f"[LEFT] {event.character}: {event.description}")
-        
-        return "\n".join(timeline_context) if timeline_context else "No recent activity"
+        start = self.summary_manager.window_start(timeline.summary, len(timeline.events), recent_event_count)
+        events = timeline.events[start:]
+        
+        # Each event is rendered once; an unchanged window is returned as-is
+        timeline_context = _timeline_render_cache.window((timeline.id, recent_event_count), events)
+        elided = self.summary_manager.elided_note(timeline.summary, start)
+        if elided and recent_event_count is not None:
+            timeline_context = f"{elided}\n{timeline_context}"
+        
+        # Events older than the window are only seen through their rolling summaries
+        summary_context = self.summary_manager.get_summary_context(timeline.summary)
+        if summary_context and recent_event_count is not None:
+            return f"EARLIER (summarized):\n{summary_context}\nRECENT EVENTS:\n{timeline_context or 'No recent activity'}"
+        
+        return timeline_context if timeline_context else "No recent activity"
+    
+    def render_events(self, events: List[TimelineEvent]) -> str:
+        """Render a list of events as timeline context lines (used for chunk summaries)."""
+        lines = [_timeline_render_cache.line(event) for event in events]
+        return "\n".join(line for line in lines if line is not None)
     
     # ========== Message Operations ==========
     
@@ -217,6 +301,25 @@ class TimelineManager:
         scene_type: str,
         timeline: TimelineHistory,
         recent_event_count: int = 15
+    ) -> Scene:
+        """
+        Generate a scene event based on specified type (blocking wrapper).
+        
+        Args:
+            scene_type: Type of scene to generate - 'transition' or 'environmental' (required)
+            timeline: TimelineHistory instance
+            recent_event_count: How many recent events to consider for context
+            
+        Returns:
+            The newly created Scene
+        """
+        return run_sync(self.generate_scene_event_async(scene_type, timeline, recent_event_count))
+    
+    async def generate_scene_event_async(
+        self,
+        scene_type: str,
+        timeline: TimelineHistory,
+        recent_event_count: int = 15
     ) -> Scene:
         """
         Generate a scene event based on specified type.
@@ -315,7 +418,9 @@ class TimelineManager:
                 "event_description": "A sudden gust of ice-cold wind tears through the library, extinguishing half the lights. Pages flutter wildly as a single ancient tome slides off a high shelf and crashes open on the table between them—landing on a page marked with a glowing symbol."
                 }}"""
             
-            response = self.model.generate_content(prompt, temperature=0.85)
+            response = await self.model.generate_content_async(
+                prompt, temperature=0.85, stage="scene_gen", response_format=response_schemas.SCENE
+            )
             result = parse_json_response(response.text)
             location = result.get("location", "Unknown Location").strip()
             event_desc = result.get("event_description", "").strip()
@@ -330,6 +435,20 @@ class TimelineManager:
             raise RuntimeError(f"Failed to generate {scene_type} scene event: {e}")
         
     def should_generate_scene(self, timeline: TimelineHistory, recent_event_count: int = 15) -> Optional[dict]:
+        """
+        Use LLM to decide if a scene event should be generated and what type it should be (blocking wrapper).
+        
+        Args:
+            timeline: TimelineHistory instance
+            recent_event_count: Number of recent events to include in context
+            
+        Returns:
+            dict with 'scene_generated' (bool), 'scene_type' (str), 'location' (str), 'event_description' (str) if scene should be generated,
+            None if no scene should be generated
+        """
+        return run_sync(self.should_generate_scene_async(timeline, recent_event_count))
+    
+    async def should_generate_scene_async(self, timeline: TimelineHistory, recent_event_count: int = 15) -> Optional[dict]:
         """
         Use LLM to decide if a scene event should be generated and what type it should be.
         
@@ -406,10 +525,12 @@ class TimelineManager:
         Decide now based on the timeline above."""
         
         try:
-            response = self.model.generate_content(
+            response = await self.model.generate_content_async(
                 prompt,
                 temperature=0.8,
-                max_tokens=300
+                max_tokens=300,
+                stage="scene_decision",
+                response_format=response_schemas.SCENE_DECISION
             )
             
             scene_data = parse_json_response(response.text)
@@ -417,6 +538,7 @@ class TimelineManager:
             if scene_data.get("scene_generated", False):
                 return {
                     'scene_generated': True,
+                    'scene_type': scene_data.get('scene_type') or 'environmental',
                     'location': scene_data.get('location'),
                     'event_description': scene_data.get('event_description')
                 }
@@ -500,6 +622,29 @@ class TimelineManager:
         all_characters: List[str],
         current_participants: List[str],
         current_location: str
+    ) -> tuple[List[Dict[str, str]], List[Dict[str, str]]]:
+        """
+        Make ONE API call to decide both character entries AND exits (blocking wrapper).
+        
+        Args:
+            timeline_context: Full timeline history context
+            all_characters: List of all character names in the story
+            current_participants: List of characters currently present
+            current_location: Current scene location
+            
+        Returns:
+            Tuple of (entries, exits):
+            - entries: List of dicts with keys: 'character', 'description'
+            - exits: List of dicts with keys: 'character', 'description'
+        """
+        return run_sync(self.decide_character_movements_async(timeline_context, all_characters, current_participants, current_location))
+    
+    async def decide_character_movements_async(
+        self,
+        timeline_context: str,
+        all_characters: List[str],
+        current_participants: List[str],
+        current_location: str
     ) -> tuple[List[Dict[str, str]], List[Dict[str, str]]]:
         """
         Make ONE API call to decide both character entries AND exits.
@@ -562,8 +707,10 @@ class TimelineManager:
         If no movements should happen, return: {{"entries": [], "exits": []}}
         Remember: Only include movements that make narrative sense RIGHT NOW."""
         try:
-            response = self.model.generate_content(prompt)
-            result = parse_json_response(response.text)
+            response = await self.model.generate_content_async(
+                prompt, stage="movement", response_format=response_schemas.MOVEMENTS
+            )
+            result = parse_json_response(response.text, defaults={"entries": [], "exits": []})
             entries = result.get("entries", [])
             exits = result.get("exits", [])
 
@@ -574,11 +721,141 @@ class TimelineManager:
             return [], []
     
     
+    def direct_scene(
+        self,
+        timeline: TimelineHistory,
+        all_characters: List[str],
+        recent_event_count: int = 15
+    ) -> Tuple[Optional[dict], List[Dict[str, str]], List[Dict[str, str]]]:
+        """
+        Make ONE "director" API call deciding the scene event and character entries/exits (blocking wrapper).
+        
+        Args:
+            timeline: TimelineHistory instance
+            all_characters: List of all character names in the story
+            recent_event_count: Number of recent events to include in context
+            
+        Returns:
+            Tuple of (scene_decision, entries, exits), shaped like the results of
+            should_generate_scene() and decide_character_movements()
+        """
+        return run_sync(self.direct_scene_async(timeline, all_characters, recent_event_count))
+    
+    async def direct_scene_async(
+        self,
+        timeline: TimelineHistory,
+        all_characters: List[str],
+        recent_event_count: int = 15
+    ) -> Tuple[Optional[dict], List[Dict[str, str]], List[Dict[str, str]]]:
+        """
+        Make ONE "director" API call deciding the scene event and character entries/exits.
+        Replaces should_generate_scene_async() + decide_character_movements_async(), which
+        send the same timeline context twice.
+        
+        Args:
+            timeline: TimelineHistory instance
+            all_characters: List of all character names in the story
+            recent_event_count: Number of recent events to include in context
+            
+        Returns:
+            Tuple of (scene_decision, entries, exits):
+            - scene_decision: dict like should_generate_scene_async() returns, or None for no scene
+            - entries: List of dicts with keys: 'character', 'description'
+            - exits: List of dicts with keys: 'character', 'description'
+            Movements apply after the scene, so with a transition they happen at the new location.
+        """
+        timeline_str = self.get_timeline_context(timeline, recent_event_count=recent_event_count)
+        current_location = self.get_current_location(timeline) or "Unknown"
+        current_participants = list(timeline.current_participants)
+        absent_characters = [c for c in all_characters if c not in current_participants]
+        
+        prompt = f"""You are the director of this roleplay story. Based on the timeline, decide in ONE answer whether a scene event happens now and which characters (if any) enter or exit.
+        CURRENT SCENE:
+        Current Location: {current_location}
+        Currently Present: {', '.join(current_participants) if current_participants else 'None'}
+        Absent Characters: {', '.join(absent_characters) if absent_characters else 'None'}
+        
+        RECENT TIMELINE (in chronological order):
+        {timeline_str}
+
+        DECISION 1 - SCENE EVENT (at most one):
+        - "transition": the characters move to a new location (they expressed intent to go somewhere, or the story needs to move on)
+        - "environmental": something happens at the current location (physical event, discovery, mysterious occurrence, interruption)
+        Generate one only if the conversation has stalled, reached a natural transition point, or needs momentum.
+        Do NOT generate one during an active conversation, mid-dialogue, in an emotional moment, or within 5-10 messages of the last scene event.
+
+        DECISION 2 - ENTRIES AND EXITS:
+        Move characters only when it makes narrative sense RIGHT NOW (story flow, motivations, cause and effect).
+        Only absent characters can enter and only present characters can exit. If you chose a transition, movements happen at the new location.
+        Entry descriptions (2-3 sentences) say only what the entering character can PHYSICALLY OBSERVE: the surroundings, who is present, and visible body language or tension - never earlier conversations, reasons or thoughts.
+        Exit descriptions take 1-2 sentences describing how they leave.
+
+        OUTPUT FORMAT (strict JSON):
+        {{
+            "scene_generated": true or false,
+            "scene_type": "transition" or "environmental" (omit if no scene),
+            "location": "New location for a transition, or {current_location}" (omit if no scene),
+            "event_description": "2-3 sentences with vivid sensory details" (omit if no scene),
+            "entries": [{{"character": "character_name", "description": "..."}}],
+            "exits": [{{"character": "character_name", "description": "..."}}]
+        }}
+        If nothing should happen, return: {{"scene_generated": false, "entries": [], "exits": []}}"""
+        
+        try:
+            response = await self.model.generate_content_async(
+                prompt, temperature=0.8, stage="director", response_format=response_schemas.DIRECTOR
+            )
+            result = parse_json_response(response.text, defaults={"scene_generated": False, "entries": [], "exits": []})
+        except Exception as e:
+            print(f"⚠️  Error in director decision: {e}")
+            return None, [], []
+        
+        scene_decision = None
+        if result.get("scene_generated", False) and result.get("event_description"):
+            scene_decision = {
+                'scene_generated': True,
+                'scene_type': result.get('scene_type') or 'environmental',
+                'location': result.get('location') or current_location,
+                'event_description': result.get('event_description')
+            }
+        entries = [e for e in result["entries"] or [] if isinstance(e, dict) and e.get("character") in absent_characters]
+        exits = [e for e in result["exits"] or [] if isinstance(e, dict) and e.get("character") in current_participants]
+        return scene_decision, entries, exits
+    
     # ========== Summary Operations ==========
     
+    async def update_summary_async(self, timeline: TimelineHistory) -> int:
+        """
+        Bring the timeline's rolling summary up to date, summarizing each full chunk of
+        new events once and rolling older summaries up.
+        
+        Args:
+            timeline: TimelineHistory instance to summarize
+            
+        Returns:
+            Number of LLM calls made
+        """
+        return await self.summary_manager.update_summary_async(
+            timeline.summary, timeline.events, self.render_events
+        )
+    
     def summarize_timeline(self, timeline: TimelineHistory) -> str:
+        """
+        Generate a brief AI-powered summary of the timeline (blocking wrapper).
+        
+        Args:
+            timeline: TimelineHistory instance to summarize
+            
+        Returns:
+            Summary string
+        """
+        return run_sync(self.summarize_timeline_async(timeline))
+    
+    async def summarize_timeline_async(self, timeline: TimelineHistory) -> str:
         """
         Generate a brief AI-powered summary of the timeline.
+        Built from the rolling summaries plus the events not yet summarized,
+        so the prompt stays the same size however long the timeline is.
         
         Args:
             timeline: TimelineHistory instance to summarize
@@ -589,7 +866,15 @@ class TimelineManager:
         if not timeline.events:
             return "No events to summarize."
         
-        timeline_str = self.get_timeline_context(timeline, recent_event_count=None)
+        try:
+            await self.update_summary_async(timeline)
+        except Exception as e:
+            raise RuntimeError(f"Failed to generate summary: {e}")
+        
+        summary_context = self.summary_manager.get_summary_context(timeline.summary)
+        timeline_str = self.render_events(timeline.events[timeline.summary.summarized_count:])
+        if summary_context:
+            timeline_str = f"EARLIER (summarized):\n{summary_context}\nRECENT EVENTS:\n{timeline_str or 'No recent activity'}"
         
         prompt = f"""You are summarizing a roleplay timeline between characters.
         Title: {timeline.title}
@@ -609,7 +894,9 @@ class TimelineManager:
         Keep it brief but capture the essence of what happened."""
 
         try:
-            response = self.model.generate_content(prompt, temperature=0.7)
+            response = await self.model.generate_content_async(
+                prompt, temperature=0.7, stage="summary", response_format=response_schemas.SUMMARY
+            )
             summary_data = parse_json_response(response.text)
             summary = summary_data.get("summary", "Unable to generate summary.")
             timeline.timeline_summary = summary
@@ -4,17 +4,30 @@ Handles ONLY turn decision logic - determines who should speak next.
 All timeline operations are delegated to TimelineManager.
 """
 
-from concurrent.futures import ThreadPoolExecutor, as_completed
+import asyncio
 import random
-import time
-from typing import List, Optional, Tuple
+import re
+from typing import Any, Callable, Dict, List, NamedTuple, Optional, Tuple
 from colorama import Fore, Style
 
-from data_models import Message, TimelineHistory, Character, Scene, CharacterEntry, CharacterExit
+from data_models import Message, Action, TimelineHistory, Character, Scene, CharacterEntry, CharacterExit
 from managers.timelineManager import TimelineManager
 from managers.characterManager import CharacterManager
 from managers.storyManager import StoryManager
+from helpers.async_runner import run_sync
+from helpers.decision_stream import DecisionStream
+from helpers.pacing import PacingPolicy, get_pacing_policy, pause_output, LINE, SCENE, MOVEMENT, STALL
+from helpers.metrics import current_session, get_metrics
 from config import Config
+from openrouter_client import RateLimitError, call_deadline
+
+
+class SpeakerCandidate(NamedTuple):
+    """A character's generated decision, kept so it can be spoken in a later slot."""
+    
+    character: Character
+    decision: Tuple[str, float, str, Optional[str], Optional[str]]
+    position: int  # Number of timeline events the decision was generated against
 
 
 class TurnManager:
@@ -25,6 +38,11 @@ class TurnManager:
     - Decide who should speak next based on context
     - Coordinate between AI characters to determine speaking order
     - Process consecutive AI responses naturally
+    
+    The engine is asyncio-native: every LLM call in a turn is awaited on one
+    event loop, so a single worker can drive many sessions concurrently.
+    The synchronous methods are thin wrappers that run the async variants on
+    the shared background loop.
     """
     
     def __init__(
@@ -33,7 +51,19 @@ class TurnManager:
         timeline: TimelineHistory,
         max_consecutive_ai_turns: int = None,
         priority_randomness: float = None,
-        save_callback: Optional[callable] = None
+        save_callback: Optional[callable] = None,
+        stream_responses: Optional[bool] = None,
+        stream_callback: Optional[Callable[[Character, str, Optional[str], str], None]] = None,
+        pipelined_turns: Optional[bool] = None,
+        reuse_candidates: Optional[bool] = None,
+        two_stage_decisions: Optional[bool] = None,
+        round_deadline: Optional[float] = None,
+        pacing: Optional[PacingPolicy] = None,
+        session_id: Optional[str] = None,
+        story_manager: Optional[StoryManager] = None,
+        judge_in_background: Optional[bool] = None,
+        judge_every_cycles: Optional[int] = None,
+        director_mode: Optional[bool] = None
     ):
         """
         Initialize the turn manager.
@@ -44,63 +74,189 @@ class TurnManager:
             max_consecutive_ai_turns: Maximum number of consecutive AI turns (defaults to Config.MAX_CONSECUTIVE_AI_TURNS)
             priority_randomness: Random factor to add to priority for naturalness (defaults to Config.PRIORITY_RANDOMNESS)
             save_callback: Optional callback function to save conversation after AI responses
+            stream_responses: Stream the selected speaker's dialogue as it is generated (defaults to Config.STREAM_RESPONSES)
+            stream_callback: Optional callback(character, response_type, field, fragment) receiving streamed
+                "dialogue"/"action" fragments; called with field=None when the response is complete.
+                Defaults to printing to the console.
+            pipelined_turns: Run scene/movement decisions concurrently with a speculative first
+                round of character decisions (defaults to Config.PIPELINED_TURNS)
+            reuse_candidates: Keep runners-up decisions and speak them in later slots while they
+                are still valid, instead of re-polling every character each round
+                (defaults to Config.REUSE_CANDIDATES)
+            two_stage_decisions: Poll characters with short bids (type, priority, reasoning) and
+                generate dialogue/action only for the selected speaker
+                (defaults to Config.TWO_STAGE_DECISIONS)
+            round_deadline: Seconds to wait for a round of decisions; after that a speaker is chosen
+                from the decisions that arrived and the rest are cancelled. The decision calls do not
+                wait or retry past it. 0 waits for everyone (defaults to Config.ROUND_DEADLINE)
+            pacing: Pauses the console makes around lines, scenes and movements; the engine
+                itself never waits for them (defaults to Config.PACING)
+            session_id: Session the LLM calls of this conversation are accounted to
+                (defaults to the timeline id)
+            story_manager: StoryManager whose objectives the judge evaluates (defaults to one without a story)
+            judge_in_background: Run the objective judge in a background worker whose updates are
+                applied before the next decision round (defaults to Config.JUDGE_IN_BACKGROUND)
+            judge_every_cycles: Response cycles between judge evaluations; 0 judges only on trigger
+                events such as scene transitions (defaults to Config.JUDGE_EVERY_CYCLES)
+            director_mode: Decide the scene event and character entries/exits in one "director"
+                call instead of two (defaults to Config.DIRECTOR_MODE)
         """
         self.characters = characters
         self.timeline = timeline
         
+        # Memories reference the shared timeline instead of copying every event
+        for character in characters:
+            if character.memory:
+                character.memory.bind_timeline(timeline)
+        
         self.max_consecutive_ai_turns = max_consecutive_ai_turns or Config.MAX_CONSECUTIVE_AI_TURNS
         self.priority_randomness = priority_randomness or Config.PRIORITY_RANDOMNESS
+        # Recorded sessions replay identically only if speakers are drawn the same way
+        seed = Config.RANDOM_SEED
+        if seed is None and Config.LLM_CACHE_MODE in ("record", "replay"):
+            seed = 0
+        self._random = random.Random(seed)
         self.save_callback = save_callback
+        self.stream_responses = Config.STREAM_RESPONSES if stream_responses is None else stream_responses
+        self.stream_callback = stream_callback or self._print_stream_fragment
+        self.pipelined_turns = Config.PIPELINED_TURNS if pipelined_turns is None else pipelined_turns
+        self.reuse_candidates = Config.REUSE_CANDIDATES if reuse_candidates is None else reuse_candidates
+        self.two_stage_decisions = Config.TWO_STAGE_DECISIONS if two_stage_decisions is None else two_stage_decisions
+        self.round_deadline = Config.ROUND_DEADLINE if round_deadline is None else round_deadline
+        self.pacing = pacing or get_pacing_policy()
+        self.session_id = session_id or timeline.id
+        self.judge_in_background = Config.JUDGE_IN_BACKGROUND if judge_in_background is None else judge_in_background
+        self.judge_every_cycles = Config.JUDGE_EVERY_CYCLES if judge_every_cycles is None else judge_every_cycles
+        self.director_mode = Config.DIRECTOR_MODE if director_mode is None else director_mode
         
         # Initialize managers
         self.timeline_manager = TimelineManager()
         self.character_manager = CharacterManager()
-        self.story_manager = StoryManager()
+        self.story_manager = story_manager or StoryManager()
         
         self.turn_count = 0
         self.consecutive_silence_rounds = 0
+        
+        # Streamed decisions of the current round, keyed by character name
+        self._round_streams: Dict[str, DecisionStream] = {}
+        self._stream_field: Optional[str] = None
+        self._round_position = 0
+        
+        # Runners-up decisions available for reuse, keyed by character name
+        self._candidates: Dict[str, SpeakerCandidate] = {}
+        self._pending_candidates: Dict[str, asyncio.Task] = {}
+        self._last_speaker: Optional[str] = None
+        
+        # Reasoning behind the selected speaker's bid, handed to the response stage
+        self._winner_reasoning: Optional[str] = None
+        
+        # Background update of the rolling summaries, at most one at a time
+        self._summary_task: Optional[asyncio.Task] = None
+        
+        # Background objective judge: requests made while it runs are coalesced into one
+        # evaluation of the latest timeline, and its result waits for the next decision round
+        self._judge_task: Optional[asyncio.Task] = None
+        self._judge_requested = False
+        self._judge_result: Optional[Tuple[Dict[str, Any], List[Character]]] = None
+        self._judge_unsaved = False
+        self._judge_cycles = 0
+        self._judge_position = len(timeline.events)
     
-    def _collect_speaking_decisions(self) -> List[Tuple[Character, Tuple[str, float, str, Optional[str], Optional[str]]]]:
+    async def _collect_speaking_decisions_async(
+        self,
+        characters: List[Character]
+    ) -> List[Tuple[Character, Tuple[str, float, str, Optional[str], Optional[str]]]]:
         """
-        Collect response decisions from all AI characters using parallel execution.
+        Collect response decisions from the given AI characters concurrently.
         
+        Args:
+            characters: Characters to ask for a decision
+            
         Returns:
             List of tuples containing (character, decision_tuple) for characters that want to respond (speak or act)
         """
         decisions = []
         quota_exceeded = False
+        position = len(self.timeline.events)
+        
+        self._cancel_round_streams()
+        self._round_position = position
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + self.round_deadline if self.round_deadline else None
+        round_end = deadline
+        
+        # Define worker coroutine for concurrent execution
+        async def get_character_decision(character):
+            # The round's budget bounds each call's attempts and retries (and the start of a stream)
+            with call_deadline(round_end):
+                return await get_decision(character)
         
-        # Define worker function for parallel execution
-        def get_character_decision(character):
-            return character, self.character_manager.decide_turn_response(
+        async def get_decision(character):
+            if self.two_stage_decisions:
+                # Bids only; the winner's response is generated after selection
+                return character, await self.character_manager.decide_turn_bid_async(character)
+            if self.stream_responses:
+                # Only the header is needed to pick a speaker; dialogue keeps streaming
+                stream = self.character_manager.start_turn_response_stream(character)
+                self._round_streams[character.persona.name] = stream
+                response_type, priority, reasoning = await stream.header()
+                return character, (response_type, priority, reasoning, None, None)
+            return character, await self.character_manager.decide_turn_response_async(
                 character
             )
         
-        # Execute all character decisions in parallel
-        with ThreadPoolExecutor(max_workers=len(self.characters)) as executor:
-            futures = {executor.submit(get_character_decision, char): char for char in self.characters}
-            
-            # Process results as they complete
-            for future in as_completed(futures):
-                try:
-                    character, (response_type, priority, reasoning, dialogue, action) = future.result()
-                    
-                    # Check for quota exceeded error
-                    if reasoning == "API_QUOTA_EXCEEDED":
-                        quota_exceeded = True
-                        continue
-                    
-                    if response_type in ["speak", "act"]:
-                        decisions.append((character, (response_type, priority, reasoning, dialogue, action)))
-                        emoji = "💭" if response_type == "speak" else "👤"
-                        type_label = "Speech" if response_type == "speak" else "Action"
-                        print(f"{emoji} {character.persona.name}: Priority {priority:.2f} ({type_label}) - {reasoning}")
-                    else:
-                        print(f"🤐 {character.persona.name}: {reasoning}")
+        # Run all character decisions concurrently on the event loop
+        tasks = {asyncio.ensure_future(get_character_decision(char)): char for char in characters}
+        pending = set(tasks)
+        
+        # Process results as they complete
+        try:
+            while pending:
+                timeout = None if deadline is None else max(deadline - loop.time(), 0)
+                done, pending = await asyncio.wait(pending, timeout=timeout, return_when=asyncio.FIRST_COMPLETED)
+                if not done:
+                    if decisions:
+                        # Round deadline: choose among the decisions in, drop the stragglers
+                        late = ", ".join(tasks[task].persona.name for task in pending)
+                        print(f"⏱️  Not waiting any longer for {late}")
+                        for task in pending:
+                            stream = self._round_streams.pop(tasks[task].persona.name, None)
+                            if stream is not None:
+                                stream.cancel()
+                        break
+                    # Nobody has asked to respond yet; the rest are out of budget and end shortly
+                    deadline = None
+                    continue
+                for task in done:
+                    try:
+                        character, (response_type, priority, reasoning, dialogue, action) = task.result()
                         
-                except Exception as e:
-                    character = futures[future]
-                    print(f"⚠️Error getting decision from {character.persona.name}: {e}")
+                        # Streamed decisions are remembered once their text is complete
+                        if character.persona.name not in self._round_streams:
+                            self._remember_candidate(
+                                character,
+                                (response_type, priority, reasoning, dialogue, action),
+                                position
+                            )
+                        
+                        if response_type in ["speak", "act"]:
+                            decisions.append((character, (response_type, priority, reasoning, dialogue, action)))
+                            emoji = "💭" if response_type == "speak" else "👤"
+                            type_label = "Speech" if response_type == "speak" else "Action"
+                            print(f"{emoji} {character.persona.name}: Priority {priority:.2f} ({type_label}) - {reasoning}")
+                        else:
+                            print(f"🤐 {character.persona.name}: {reasoning}")
+                            
+                    except RateLimitError:
+                        # Still rate limited after the client's retries
+                        quota_exceeded = True
+                    except Exception as e:
+                        character = tasks[task]
+                        print(f"⚠️Error getting decision from {character.persona.name}: {e}")
+        finally:
+            # A cancelled round must not leave orphaned decision calls behind
+            for task in tasks:
+                task.cancel()
         
         if quota_exceeded:
             print("⚠️API QUOTA EXCEEDED")
@@ -126,9 +282,10 @@ class TurnManager:
             return None
         
         # Sort by priority with small random factor for naturalness
+        # (drawn in name order, so the arrival order of decisions does not matter)
         decisions_with_adjusted_priority = [
-            (char, decision_tuple, decision_tuple[1] + random.uniform(-self.priority_randomness, self.priority_randomness))
-            for char, decision_tuple in decisions
+            (char, decision_tuple, decision_tuple[1] + self._random.uniform(-self.priority_randomness, self.priority_randomness))
+            for char, decision_tuple in sorted(decisions, key=lambda decision: decision[0].persona.name)
         ]
         
         decisions_with_adjusted_priority.sort(key=lambda x: x[2], reverse=True)
@@ -138,53 +295,179 @@ class TurnManager:
         action = decision_tuple[4]
         return (selected_character, response_type, dialogue, action)
     
-    def _process_meta_narrative_decisions(self) -> None:
+    async def _process_meta_narrative_decisions_async(
+        self
+    ) -> Optional[List[Tuple[Character, Tuple[str, float, str, Optional[str], Optional[str]]]]]:
         """
-        Process meta-narrative decisions sequentially.
+        Process meta-narrative decisions (scene events, then character entries/exits).
         
         Workflow:
         1. Check if scene transition should happen
         2. Check for character entries and exits (ONE combined API call)
         
+        In director mode both are decided by one call and applied in the same order.
         All decisions use full timeline context (not filtered by character memory).
+        In pipelined mode both checks run concurrently with a speculative first round
+        of character decisions (see _process_meta_narrative_pipelined_async).
+        
+        Returns:
+            The speculative first-round decisions if they are still valid, otherwise None
         """
+        if self.pipelined_turns:
+            return await self._process_meta_narrative_pipelined_async()
+        
+        if self.director_mode:
+            scene_decision, entries, exits = await self._decide_meta_narrative_async()
+            await self._apply_scene_decision_async(scene_decision)
+            await self._apply_character_movements_async(entries, exits)
+            return None
+        
         # Step 1: Check for scene transition
-        scene_decision = self.timeline_manager.should_generate_scene(self.timeline, recent_event_count=15)
-        if scene_decision:
-            scene_type = scene_decision.get('scene_type', 'environmental')
-            scene = self.timeline_manager.create_scene(
-                scene_type=scene_type,
-                location=scene_decision['location'],
-                description=scene_decision['event_description']
-            )
-            self.timeline_manager.add_event(self.timeline, scene)
-            
-            # Broadcast scene to currently active characters only
-            active_characters = [c for c in self.characters if c.persona.name in self.timeline.current_participants]
-            self.character_manager.broadcast_event_to_characters(active_characters, scene)
-            
-            # Display scene based on type
-            if scene_type == 'transition':
-                print(f"\n🚶 SCENE TRANSITION")
-                print(f"📍 New Location: {scene.location}")
-            else:
-                print(f"\n🌅 ENVIRONMENTAL SCENE")
-                print(f"📍 Location: {scene.location}")
-            print(f"{scene.description}\n")
-            
-            time.sleep(1)
+        scene_decision = await self.timeline_manager.should_generate_scene_async(self.timeline, recent_event_count=15)
+        await self._apply_scene_decision_async(scene_decision)
         
         # Step 2: Check for character entries AND exits 
         timeline_context = self.timeline_manager.get_timeline_context(self.timeline, recent_event_count=15)
         current_location = self.timeline_manager.get_current_location(self.timeline)
         all_character_names = [c.persona.name for c in self.characters]
         
-        entries, exits = self.timeline_manager.decide_character_movements(
+        entries, exits = await self.timeline_manager.decide_character_movements_async(
             timeline_context=timeline_context,
             all_characters=all_character_names,
             current_participants=self.timeline.current_participants,
             current_location=current_location or "Unknown"
         )
+        await self._apply_character_movements_async(entries, exits)
+        return None
+    
+    async def _process_meta_narrative_pipelined_async(
+        self
+    ) -> Optional[List[Tuple[Character, Tuple[str, float, str, Optional[str], Optional[str]]]]]:
+        """
+        Run the scene and movement decisions (or the director call) concurrently with a
+        speculative round of character decisions.
+        
+        Both meta-narrative calls see the timeline as it is before either lands. The
+        speculative decisions are kept only if no scene, entry or exit was added;
+        otherwise they are cancelled so the first round is re-requested against the
+        updated timeline.
+        
+        Returns:
+            The speculative first-round decisions if still valid, otherwise None
+        """
+        meta_task = asyncio.ensure_future(self._decide_meta_narrative_async())
+        
+        speculative_task = None
+        if self.timeline.events:
+            print("\n🤔 AI characters are thinking...")
+            active_characters = [c for c in self.characters if c.persona.name in self.timeline.current_participants]
+            speculative_task = asyncio.ensure_future(self._collect_speaking_decisions_async(active_characters))
+        
+        try:
+            scene_decision, entries, exits = await meta_task
+            
+            landed = await self._apply_scene_decision_async(scene_decision)
+            landed = await self._apply_character_movements_async(entries, exits) or landed
+        except BaseException:
+            meta_task.cancel()
+            if speculative_task is not None:
+                speculative_task.cancel()
+            self._cancel_round_streams()
+            raise
+        
+        if speculative_task is None:
+            return None
+        if landed:
+            # The stage changed under the speculative round; ask again
+            speculative_task.cancel()
+            self._cancel_round_streams()
+            print("\n🔄 The scene has changed - characters are reconsidering...")
+            return None
+        return await speculative_task
+    
+    async def _decide_meta_narrative_async(
+        self
+    ) -> Tuple[Optional[dict], List[dict], List[dict]]:
+        """
+        Decide the scene event and character entries/exits against the current timeline,
+        with one director call or with the scene and movement calls running concurrently.
+        
+        Returns:
+            Tuple of (scene_decision, entries, exits)
+        """
+        all_character_names = [c.persona.name for c in self.characters]
+        if self.director_mode:
+            return await self.timeline_manager.direct_scene_async(
+                self.timeline, all_character_names, recent_event_count=15
+            )
+        
+        timeline_context = self.timeline_manager.get_timeline_context(self.timeline, recent_event_count=15)
+        current_location = self.timeline_manager.get_current_location(self.timeline)
+        scene_decision, (entries, exits) = await asyncio.gather(
+            self.timeline_manager.should_generate_scene_async(self.timeline, recent_event_count=15),
+            self.timeline_manager.decide_character_movements_async(
+                timeline_context=timeline_context,
+                all_characters=all_character_names,
+                current_participants=list(self.timeline.current_participants),
+                current_location=current_location or "Unknown"
+            )
+        )
+        return scene_decision, entries, exits
+    
+    async def _apply_scene_decision_async(self, scene_decision: Optional[dict]) -> bool:
+        """
+        Add a decided scene event to the timeline and show it.
+        
+        Args:
+            scene_decision: Result of TimelineManager.should_generate_scene_async()
+            
+        Returns:
+            True if a scene was added
+        """
+        if not scene_decision:
+            return False
+        
+        scene_type = scene_decision.get('scene_type', 'environmental')
+        scene = self.timeline_manager.create_scene(
+            scene_type=scene_type,
+            location=scene_decision['location'],
+            description=scene_decision['event_description']
+        )
+        self.timeline_manager.add_event(self.timeline, scene)
+        
+        # Broadcast scene to currently active characters only
+        active_characters = [c for c in self.characters if c.persona.name in self.timeline.current_participants]
+        self.character_manager.broadcast_event_to_characters(active_characters, scene)
+        
+        # Display scene based on type
+        self._pause_before(SCENE, scene.description)
+        if scene_type == 'transition':
+            print(f"\n🚶 SCENE TRANSITION")
+            print(f"📍 New Location: {scene.location}")
+        else:
+            print(f"\n🌅 ENVIRONMENTAL SCENE")
+            print(f"📍 Location: {scene.location}")
+        print(f"{scene.description}\n")
+        
+        self._pause_after(SCENE, scene.description)
+        return True
+    
+    async def _apply_character_movements_async(
+        self,
+        entries: List[dict],
+        exits: List[dict]
+    ) -> bool:
+        """
+        Add decided character entries and exits to the timeline and show them.
+        
+        Args:
+            entries: Entry dicts with 'character' and 'description'
+            exits: Exit dicts with 'character' and 'description'
+            
+        Returns:
+            True if at least one entry or exit was added
+        """
+        landed = False
         
         # Process all character movements (entries and exits) in a single loop
         for movement_info, is_entry in [(info, True) for info in entries] + [(info, False) for info in exits]:
@@ -200,6 +483,7 @@ class TurnManager:
                 continue
             
             action = "entering" if is_entry else "leaving"
+            self._pause_before(MOVEMENT, description)
             print(f"\n👋 {character_name} is {action}...")
             
             # Create appropriate event
@@ -209,22 +493,249 @@ class TurnManager:
                 event = CharacterExit(character=character_name, description=description)
             
             self.timeline_manager.add_event(self.timeline, event)
+            landed = True
             
             # Broadcast to currently active characters
             active_characters = [c for c in self.characters if c.persona.name in self.timeline.current_participants]
             self.character_manager.broadcast_event_to_characters(active_characters, event)
             
             # For entries, also add to the entering character's memory
-            if is_entry:
+            if is_entry and character not in active_characters:
                 self.character_manager.broadcast_event_to_characters([character], event)
             
             print(f"   {Fore.CYAN}{description}{Style.RESET_ALL}")
-            time.sleep(1)
+            self._pause_after(MOVEMENT, description)
+        
+        return landed
+    
+    async def _collect_decisions_with_candidates_async(
+        self,
+        characters: List[Character]
+    ) -> List[Tuple[Character, Tuple[str, float, str, Optional[str], Optional[str]]]]:
+        """
+        Build a round of decisions, reusing still-valid candidates and polling the rest.
+        
+        The character who just responded is neither polled nor reused, since they
+        cannot take the next slot anyway.
+        
+        Args:
+            characters: Currently active characters
+            
+        Returns:
+            List of (character, decision_tuple) for characters that want to respond
+        """
+        reused: List[SpeakerCandidate] = []
+        to_poll: List[Character] = []
+        
+        # Losing streams from the previous round are usually almost finished;
+        # completing them is cheaper than asking those characters again
+        if self._pending_candidates:
+            await asyncio.gather(*self._pending_candidates.values(), return_exceptions=True)
+            self._pending_candidates.clear()
+        
+        for character in characters:
+            name = character.persona.name
+            if name == self._last_speaker:
+                continue
+            candidate = self._candidates.get(name)
+            if candidate is not None and not self._is_candidate_stale(candidate):
+                reused.append(candidate)
+            else:
+                self._candidates.pop(name, None)
+                to_poll.append(character)
+        
+        decisions = []
+        for candidate in reused:
+            response_type, priority, reasoning, _, _ = candidate.decision
+            print(f"♻️  {candidate.character.persona.name}: reusing earlier {response_type} decision (priority {priority:.2f})")
+            if response_type in ["speak", "act"]:
+                decisions.append((candidate.character, candidate.decision))
+        
+        if to_poll:
+            decisions.extend(await self._collect_speaking_decisions_async(to_poll))
+        return decisions
+    
+    def _is_candidate_stale(self, candidate: SpeakerCandidate) -> bool:
+        """
+        Cheap check whether a remembered decision no longer fits the conversation.
+        
+        A candidate is stale when, since it was generated, the character was addressed
+        by name, the topic shifted (scene, entry or exit), the player spoke, the character
+        itself already responded, or more than Config.CANDIDATE_MAX_AGE events happened.
+        
+        Args:
+            candidate: The remembered decision
+            
+        Returns:
+            True if the decision should be regenerated
+        """
+        name = candidate.character.persona.name
+        if name not in self.timeline.current_participants:
+            return True
+        
+        new_events = self.timeline.events[candidate.position:]
+        if len(new_events) > Config.CANDIDATE_MAX_AGE:
+            return True
+        
+        ai_names = {c.persona.name for c in self.characters}
+        mention = re.compile(rf"\b{re.escape(name)}\b", re.IGNORECASE)
+        for event in new_events:
+            if isinstance(event, (Scene, CharacterEntry, CharacterExit)):
+                return True
+            if isinstance(event, (Message, Action)):
+                if event.character == name or event.character not in ai_names:
+                    return True
+                text = event.dialouge if isinstance(event, Message) else event.description
+                if mention.search(text):
+                    return True
+        return False
+    
+    def _remember_candidate(
+        self,
+        character: Character,
+        decision: Tuple[str, float, str, Optional[str], Optional[str]],
+        position: int
+    ) -> None:
+        """Keep a generated decision so a later slot can reuse it."""
+        if not self.reuse_candidates:
+            return
+        existing = self._candidates.get(character.persona.name)
+        if existing is None or existing.position <= position:
+            self._candidates[character.persona.name] = SpeakerCandidate(character, decision, position)
+    
+    async def _remember_stream_async(
+        self,
+        character: Character,
+        stream: DecisionStream,
+        position: int
+    ) -> None:
+        """Remember a losing streamed decision once its text has finished generating."""
+        try:
+            decision = await stream.result()
+        except Exception:
+            return
+        response_type, _, _, dialogue, action = decision
+        if (response_type == "speak" and not dialogue) or (response_type == "act" and not action):
+            return
+        self._remember_candidate(character, decision, position)
+    
+    async def _stream_response_async(
+        self,
+        character: Character,
+        response_type: str,
+        stream: DecisionStream
+    ) -> Tuple[Optional[str], Optional[str]]:
+        """
+        Relay the selected character's words to the stream callback as they arrive.
+        
+        Args:
+            character: The selected character
+            response_type: "speak" or "act"
+            stream: The character's DecisionStream for this round
+            
+        Returns:
+            Tuple of (dialogue, action) once the stream is complete
+        """
+        async for field, fragment in stream.fragments():
+            if response_type == "act" and field != "action":
+                continue
+            self.stream_callback(character, response_type, field, fragment)
+        self.stream_callback(character, response_type, None, "")
+        
+        _, _, _, dialogue, action = await stream.result()
+        return dialogue, action
+    
+    async def _generate_winner_response_async(
+        self,
+        character: Character,
+        response_type: str
+    ) -> Tuple[Optional[DecisionStream], Optional[str], Optional[str]]:
+        """
+        Generate the selected speaker's dialogue/action after a two-stage bid.
+        
+        Args:
+            character: The selected character
+            response_type: "speak" or "act"
+            
+        Returns:
+            Tuple of (stream, dialogue, action); stream is None unless the
+            response was streamed to the stream callback
+        """
+        if self.stream_responses:
+            stream = self.character_manager.start_turn_response_stream(
+                character, response_type, self._winner_reasoning
+            )
+            dialogue, action = await self._stream_response_async(character, response_type, stream)
+            return stream, dialogue, action
+        
+        dialogue, action = await self.character_manager.generate_turn_response_async(
+            character, response_type, self._winner_reasoning
+        )
+        return None, dialogue, action
+    
+    def _pause_before(self, kind: str, text: str) -> None:
+        """Have the console pause before showing this output (the engine does not wait)."""
+        pause_output(self.pacing.delays(kind, text)[0])
+    
+    def _pause_after(self, kind: str, text: str) -> None:
+        """Have the console pause after showing this output (the engine does not wait)."""
+        pause_output(self.pacing.delays(kind, text)[1])
+    
+    def _print_stream_fragment(
+        self,
+        character: Character,
+        response_type: str,
+        field: Optional[str],
+        fragment: str
+    ) -> None:
+        """Default stream callback: print streamed dialogue and action to the console."""
+        if field is None:
+            # Close whatever field was open
+            if self._stream_field == "dialogue":
+                print('"', flush=True)
+            elif self._stream_field == "action":
+                print(f"*{Style.RESET_ALL}", flush=True)
+            self._stream_field = None
+            return
+        
+        if field != self._stream_field:
+            if self._stream_field is None:
+                emoji = "💬" if response_type == "speak" else "👤"
+                print(f"\n{emoji} {character.persona.name}: ", end="")
+            elif self._stream_field == "dialogue":
+                print('" ', end="")
+            elif self._stream_field == "action":
+                print(f"*{Style.RESET_ALL} ", end="")
+            print('"' if field == "dialogue" else f"{Fore.CYAN}*", end="")
+            self._stream_field = field
+        print(fragment, end="", flush=True)
+    
+    def _cancel_round_streams(self) -> None:
+        """Cancel and forget any streamed decisions left over from a round."""
+        for stream in self._round_streams.values():
+            stream.cancel()
+        self._round_streams.clear()
     
     def select_next_speaker(self) -> Optional[Tuple[Character, str, Optional[str], Optional[str]]]:
+        """
+        Select which AI character should respond next (blocking wrapper).
+        
+        Returns:
+            Tuple of (character, response_type, dialogue, action) for the selected character, or None
+        """
+        return run_sync(self.select_next_speaker_async())
+    
+    async def select_next_speaker_async(
+        self,
+        decisions: Optional[List[Tuple[Character, Tuple[str, float, str, Optional[str], Optional[str]]]]] = None
+    ) -> Optional[Tuple[Character, str, Optional[str], Optional[str]]]:
         """
         Select which AI character should respond next (speak or act).
         
+        Args:
+            decisions: Already collected decisions for this round (e.g. from a speculative
+                pipelined round); collected from all active characters if None
+        
         Returns:
             Tuple of (character, response_type, dialogue, action) for the selected character, or None
             - For "speak": dialogue=spoken words, action=body language
@@ -235,27 +746,58 @@ class TurnManager:
         if not recent_events:
             return None
         
-        print("\n🤔 AI characters are thinking...")
-        
-        # Collect decisions from all currently active characters
-        active_characters = [c for c in self.characters if c.persona.name in self.timeline.current_participants]
-        
-        # Temporarily update self.characters for _collect_speaking_decisions
-        original_characters = self.characters
-        self.characters = active_characters
-        decisions = self._collect_speaking_decisions()
-        self.characters = original_characters
+        if decisions is None:
+            self._apply_judge_result()
+            print("\n🤔 AI characters are thinking...")
+            
+            # Collect decisions from all currently active characters
+            active_characters = [c for c in self.characters if c.persona.name in self.timeline.current_participants]
+            if self.reuse_candidates:
+                decisions = await self._collect_decisions_with_candidates_async(active_characters)
+            else:
+                decisions = await self._collect_speaking_decisions_async(active_characters)
         
         if not decisions:
+            self._cancel_round_streams()
             print("💤 No one wants to speak right now.")
             return None
         
         # Select the speaker
         result = self._select_speaker_from_decisions(decisions)
         
+        # The winner's decision is consumed; it must never be replayed
+        self._candidates.pop(result[0].persona.name, None)
+        self._winner_reasoning = next(
+            (decision[2] for character, decision in decisions if character is result[0]),
+            None
+        )
+        
+        # Losing streamed decisions are either kept as candidates or stopped
+        winner_stream = self._round_streams.pop(result[0].persona.name, None)
+        if self.reuse_candidates:
+            for name, stream in self._round_streams.items():
+                character = next(c for c in self.characters if c.persona.name == name)
+                self._pending_candidates[name] = asyncio.ensure_future(
+                    self._remember_stream_async(character, stream, self._round_position)
+                )
+            self._round_streams.clear()
+        self._cancel_round_streams()
+        if winner_stream is not None:
+            self._round_streams[result[0].persona.name] = winner_stream
+        
         return result
     
     def process_ai_responses(self, max_turns: Optional[int] = None) -> List[Tuple[Character, str]]:
+        """Process AI responses until no one wants to speak or max turns reached (blocking wrapper).
+        
+        Args:
+            max_turns: Maximum number of consecutive AI turns (uses default if None)
+            
+        Returns:
+            List of (character, message) tuples for AI turns that want to speak """
+        return run_sync(self.process_ai_responses_async(max_turns))
+    
+    async def process_ai_responses_async(self, max_turns: Optional[int] = None) -> List[Tuple[Character, str]]:
         """Process AI responses ONE AT A TIME until no one wants to speak or max turns reached.
         Each character sees the updated conversation including previous AI responses.
         Returns the list of (character, message) tuples for the caller to handle.
@@ -268,18 +810,26 @@ class TurnManager:
         if max_turns is None:
             max_turns = self.max_consecutive_ai_turns
         
+        # Account every LLM call of this cycle, including background tasks it starts, to the session
+        current_session.set(self.session_id)
+        
+        # Objective updates judged since the last cycle take effect before anyone decides
+        self._apply_judge_result()
+        
         # STEP 1: Process meta-narrative decisions FIRST
         # This happens before character decisions to set the stage
-        self._process_meta_narrative_decisions()
+        first_round = await self._process_meta_narrative_decisions_async()
         
         responses = []
         consecutive_count = 0
         last_speaker = None
+        self._last_speaker = None
         
         while consecutive_count < max_turns:
             # Ask ONE character at a time (sequentially, not in parallel)
             # Note: select_next_speaker() prints its own "thinking" and "no one speaks" messages
-            result = self.select_next_speaker()
+            result = await self.select_next_speaker_async(decisions=first_round)
+            first_round = None
             
             if result is None:
                 # No one wants to speak - increment silence counter
@@ -289,12 +839,13 @@ class TurnManager:
                 # Generate scene event when conversation stalls
                 if self.consecutive_silence_rounds >= 2:
                     try:
-                        scene = self.timeline_manager.generate_scene_event(
+                        scene = await self.timeline_manager.generate_scene_event_async(
                             scene_type="environmental",
                             timeline=self.timeline,
                             recent_event_count=15
                         )
                         
+                        self._pause_before(STALL, scene.description)
                         print(f"\n{scene.description}\n")
                         print("─"*70)
                         
@@ -309,7 +860,7 @@ class TurnManager:
                         if self.save_callback:
                             self.save_callback()
                         
-                        time.sleep(2)
+                        self._pause_after(STALL, scene.description)
                         
                     except Exception as e:
                         print(f"\nError generating scene event: {e}\n")
@@ -323,18 +874,43 @@ class TurnManager:
             self.consecutive_silence_rounds = 0
             
             character, response_type, dialogue, action = result
+            stream = self._round_streams.pop(character.persona.name, None)
             
             # Prevent the same character from responding twice in a row
             if last_speaker == character.persona.name:
+                if stream is not None:
+                    stream.cancel()
                 print(f"   ⏭️  {character.persona.name} already responded, giving others a chance...")
                 continue  # Continue to next iteration instead of breaking, let other characters respond
             
+            # In streaming mode the words are shown while they are generated
+            generated = stream is not None
+            if stream is not None:
+                dialogue, action = await self._stream_response_async(character, response_type, stream)
+            elif self.two_stage_decisions and dialogue is None and action is None:
+                # Two-stage selection: only the winner's bid was made, write the response now
+                generated = True
+                try:
+                    stream, dialogue, action = await self._generate_winner_response_async(
+                        character, response_type
+                    )
+                except Exception as e:
+                    print(f"   ⚠️  Error generating response from {character.persona.name}: {e}")
+                    # The slot is spent: bids that keep winning must not re-fail forever
+                    consecutive_count += 1
+                    continue
+            
             # Validate that we have dialouge before processing
+            # (a response generated after selection cost calls of its own, so its slot counts)
             if response_type == "speak" and not dialogue:
                 print(f"   ⚠️  {character.persona.name} chose to speak but provided no dialogue, skipping...")
+                if generated:
+                    consecutive_count += 1
                 continue
             elif response_type == "act" and not action:
                 print(f"   ⚠️  {character.persona.name} chose to act but provided no action, skipping...")
+                if generated:
+                    consecutive_count += 1
                 continue
             
             # Handle different response types
@@ -355,12 +931,14 @@ class TurnManager:
                 self.character_manager.broadcast_event_to_characters(active_characters, message_obj)
                 
                 # Print with body language in cyan color if available
-                print(f"\n💬 {character.persona.name}:", end="")
-                if body_language:
-                    print(f" {Fore.CYAN}*{body_language}*{Style.RESET_ALL}")
-                    print(f"   \"{dialogue}\"")
-                else:
-                    print(f" {dialogue}")
+                if stream is None:
+                    self._pause_before(LINE, dialogue)
+                    print(f"\n💬 {character.persona.name}:", end="")
+                    if body_language:
+                        print(f" {Fore.CYAN}*{body_language}*{Style.RESET_ALL}")
+                        print(f"   \"{dialogue}\"")
+                    else:
+                        print(f" {dialogue}")
                 
                 responses.append((character, dialogue))
                 
@@ -380,47 +958,193 @@ class TurnManager:
                 self.character_manager.broadcast_event_to_characters(active_characters, action_obj)
                 
                 # Print action without dialogue
-                print(f"\n👤 {character.persona.name}: {Fore.CYAN}*{physical_action}*{Style.RESET_ALL}")
+                if stream is None:
+                    self._pause_before(LINE, physical_action)
+                    print(f"\n👤 {character.persona.name}: {Fore.CYAN}*{physical_action}*{Style.RESET_ALL}")
                 
                 responses.append((character, f"[ACTION: {physical_action}]"))
             
             last_speaker = character.persona.name
+            self._last_speaker = last_speaker
             consecutive_count += 1
             
-            # Small delay for readability and to let next character see the context
-            time.sleep(2)
+            # Give the player time to read before the next line appears
+            self._pause_after(LINE, dialogue or action)
         
         # JUDGE EVALUATION: After turn cycle completes, evaluate objectives
-        if self.story_manager and responses:
-            self._evaluate_objectives_with_judge()
+        if self._judge_due(responses):
+            if self.judge_in_background:
+                self._judge_requested = True
+                self._start_judge_worker()
+            else:
+                judged = await self._evaluate_objectives_with_judge_async()
+                if judged is not None:
+                    self._judge_result = judged
+                    self._apply_judge_result()
+        
+        # Summarize older events while the player reads and types
+        self._schedule_summaries()
         
-        # Save conversation after AI responses if callback is provided
-        if responses and self.save_callback:
+        # Save conversation after AI responses (or objective updates) if callback is provided
+        if (responses or self._judge_unsaved) and self.save_callback:
             self.save_callback()
+            self._judge_unsaved = False
+        
+        if Config.METRICS_TEXTFILE:
+            try:
+                get_metrics().write_prometheus(Config.METRICS_TEXTFILE)
+            except OSError as e:
+                print(f"   ⚠️  Error writing metrics: {e}")
         
         return responses
     
-    def _evaluate_objectives_with_judge(self) -> None:
-        """Evaluate and update character objectives using unified judge LLM call."""
-        if not self.story_manager or not self.story_manager.story:
+    def _schedule_summaries(self) -> None:
+        """Start a background update of the rolling summaries unless one is still running."""
+        if not Config.ROLLING_SUMMARIES:
             return
+        if self._summary_task is not None and not self._summary_task.done():
+            return
+        self._summary_task = asyncio.ensure_future(self._update_summaries_async())
+    
+    async def _update_summaries_async(self) -> None:
+        """
+        Summarize new full chunks of the timeline and of every character's memory.
+        The results are persisted with the next save.
+        """
+        results = await asyncio.gather(
+            self.timeline_manager.update_summary_async(self.timeline),
+            *[self.character_manager.update_memory_summary_async(c) for c in self.characters],
+            return_exceptions=True
+        )
+        for result in results:
+            if isinstance(result, Exception):
+                print(f"   ⚠️  Error updating summaries: {result}")
+                break
+    
+    def _judge_due(self, responses: List[Tuple[Character, str]]) -> bool:
+        """
+        Decide whether the cycle that just finished should be judged.
         
-        # Skip if story is complete
-        if self.story_manager.is_story_complete():
+        A judge evaluation is due every judge_every_cycles cycles in which someone
+        responded, and (with Config.JUDGE_ON_SCENE_TRANSITION) after a scene transition.
+        
+        Args:
+            responses: The responses of the cycle
+            
+        Returns:
+            True if objectives should be evaluated
+        """
+        if not self.story_manager.story or self.story_manager.is_story_complete():
+            return False
+        
+        new_events = self.timeline.events[self._judge_position:]
+        self._judge_position = len(self.timeline.events)
+        if responses:
+            self._judge_cycles += 1
+        
+        triggered = Config.JUDGE_ON_SCENE_TRANSITION and any(
+            isinstance(event, Scene) and event.scene_type == "transition" for event in new_events
+        )
+        if triggered or (self.judge_every_cycles and self._judge_cycles >= self.judge_every_cycles):
+            self._judge_cycles = 0
+            return True
+        return False
+    
+    def judge_progress(self) -> Dict[str, int]:
+        """Get where the objective judge is in the timeline, for saving with the session's progress."""
+        return {"position": self._judge_position, "cycles": self._judge_cycles}
+    
+    def restart_from_timeline(self, judge_progress: Optional[Dict[str, int]] = None) -> None:
+        """
+        Pick up a timeline that was replaced under the turn manager (a resumed or reset session).
+        Background work started for the previous timeline is cancelled and its results dropped,
+        and the judge continues from its saved progress or from the end of the timeline.
+        Call on the engine loop once any tasks are running.
+        
+        Args:
+            judge_progress: Progress saved by judge_progress(), or None to start at the end
+        """
+        for task in (self._summary_task, self._judge_task, *self._pending_candidates.values()):
+            if task is not None and not task.done():
+                task.cancel()
+        self._summary_task = None
+        self._judge_task = None
+        self._pending_candidates.clear()
+        self._candidates.clear()
+        self._cancel_round_streams()
+        self._last_speaker = None
+        self._winner_reasoning = None
+        
+        self._judge_requested = False
+        self._judge_result = None
+        self._judge_unsaved = False
+        event_count = len(self.timeline.events)
+        judge_progress = judge_progress or {}
+        self._judge_position = min(judge_progress.get("position", event_count), event_count)
+        self._judge_cycles = judge_progress.get("cycles", 0)
+    
+    def _start_judge_worker(self) -> None:
+        """Start the judge worker if an evaluation was requested and none is running or waiting to be applied."""
+        if not self._judge_requested or self._judge_result is not None:
             return
+        if self._judge_task is not None and not self._judge_task.done():
+            return
+        self._judge_task = asyncio.ensure_future(self._judge_worker_async())
+    
+    async def _judge_worker_async(self) -> None:
+        """Evaluate objectives against the latest timeline until a result is ready for the next round."""
+        while self._judge_requested:
+            self._judge_requested = False
+            try:
+                judged = await self._evaluate_objectives_with_judge_async()
+            except Exception as e:
+                print(f"   ⚠️  Error evaluating objectives: {e}")
+                continue
+            if judged is not None:
+                self._judge_result = judged
+                return
+    
+    async def _evaluate_objectives_with_judge_async(self) -> Optional[Tuple[Dict[str, Any], List[Character]]]:
+        """
+        Evaluate character objectives using unified judge LLM call.
         
-        print("\n" + "─"*70)
-        print("⚖️  JUDGE EVALUATION")
-        print("─"*70)
+        Returns:
+            Tuple of (judge result, characters it judged), or None if there is nothing to judge
+        """
+        if not self.story_manager or not self.story_manager.story:
+            return None
+        
+        # Skip if story is complete
+        if self.story_manager.is_story_complete():
+            return None
         
         # Get active characters
         active_characters = [c for c in self.characters if c.persona.name in self.timeline.current_participants]
         
         if not active_characters:
-            return
+            return None
         
         # Call unified judge LLM (handles both initial assignment and evaluation)
-        result = self.story_manager.evaluate_and_assign_objectives(active_characters, self.timeline)
+        result = await self.story_manager.evaluate_and_assign_objectives_async(active_characters, self.timeline)
+        return result, active_characters
+    
+    def _apply_judge_result(self) -> None:
+        """
+        Apply a finished judge evaluation: update character objectives and advance the story.
+        Called between decision rounds, so a round never sees half an update.
+        Only the loop that runs the judge applies its result, so the update
+        never races the turn loop or the judge itself.
+        """
+        if self._judge_result is None:
+            return
+        if self._judge_task is not None and self._judge_task.get_loop() is not asyncio.get_running_loop():
+            return
+        result, active_characters = self._judge_result
+        self._judge_result = None
+        
+        print("\n" + "─"*70)
+        print("⚖️  JUDGE EVALUATION")
+        print("─"*70)
         
         # Process character updates
         print("\n📋 Character Objective Updates:")
@@ -435,6 +1159,7 @@ class TurnManager:
             new_objective = char_update.get("objective")
             status = char_update.get("status", "unknown")
             reasoning = char_update.get("reasoning", "")
+            previous_objective = character.state.current_objective
             
             if status == "assigned":
                 print(f"   🎯 {char_name}: New objective assigned")
@@ -453,6 +1178,10 @@ class TurnManager:
                 # Keep current objective (or update if LLM provided one)
                 if new_objective:
                     character.state.current_objective = new_objective
+            
+            # A remembered decision was made for the old objective
+            if character.state.current_objective != previous_objective:
+                self._candidates.pop(char_name, None)
         
         # Check story objective completion
         story_complete = result.get("story_objective_complete", False)
@@ -475,6 +1204,7 @@ class TurnManager:
                 # Clear current objectives so next cycle will assign new ones
                 for character in active_characters:
                     character.state.current_objective = None
+                    self._candidates.pop(character.persona.name, None)
             else:
                 # Story fully complete
                 print(f"\n🎉 STORY COMPLETE!")
@@ -484,6 +1214,8 @@ class TurnManager:
         
         print("─"*70 + "\n")
         
-        # Save after evaluation
-        if self.save_callback:
-            self.save_callback()
\ No newline at end of file
+        # Saved with the rest of the cycle
+        self._judge_unsaved = True
+        
+        # Evaluations requested meanwhile now run against the updated objectives
+        self._start_judge_worker()
\ No newline at end of file
@@ -1,10 +1,244 @@
 """
 OpenRouter API client wrapper.
+
+Models share one AsyncOpenAI client (and its keep-alive HTTP connection pool)
+per base URL and event loop, so creating managers is cheap and sessions driven
+by the same loop reuse warm connections instead of re-doing TLS handshakes.
+Synchronous callers go through the shared background loop in
+helpers.async_runner, so they share that loop's pool as well.
+
+Every request first passes the provider's shared RateLimiter, and failed
+requests are retried with jittered exponential backoff (honoring Retry-After)
+here rather than inside the OpenAI SDK, so retries are rate limited too.
+
+When Config.LLM_CACHE_MODE is set, completions go through the response cache
+in helpers.llm_cache first (reuse, record or offline replay).
+
+With Config.STRUCTURED_OUTPUT, a caller's response_format (see
+helpers.response_schemas) is sent along; a provider that rejects it is asked
+again without one, and the model is not sent one again.
 """
 
-from openai import OpenAI
-from typing import Optional
+import asyncio
+import random
+import threading
+import time
+import weakref
+from collections import deque
+from contextlib import contextmanager
+from contextvars import ContextVar
+from email.utils import parsedate_to_datetime
+from typing import Any, AsyncIterator, Dict, Iterator, Optional, Set, Tuple
+
+import openai
+from openai import AsyncOpenAI, DefaultAsyncHttpxClient
+
+try:
+    from httpx2 import Limits  # HTTP library of current openai releases
+except ImportError:
+    from httpx import Limits  # HTTP library of earlier openai releases
+
 from config import Config
+from helpers.async_runner import run_sync, add_shutdown_hook
+from helpers.rate_limiter import RateLimiter, PRIORITIES, PRIORITY_INTERACTIVE
+from helpers.llm_cache import get_response_cache
+from helpers.fake_llm import get_fake_client
+from helpers.metrics import get_metrics
+
+
+_registry_lock = threading.Lock()
+_clients: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, Dict[Tuple[str, str], AsyncOpenAI]]" = weakref.WeakKeyDictionary()
+_models: Dict[Tuple[str, str, str], "GenerativeModel"] = {}
+_limiters: Dict[str, RateLimiter] = {}
+
+# Models whose provider rejected a response_format; their later requests go without one
+_unstructured_models: Set[str] = set()
+
+# Loop time by which the current task's calls must be done, including retries (see call_deadline)
+_call_deadline: ContextVar[Optional[float]] = ContextVar("call_deadline", default=None)
+
+# Client-side throttling shows up next to the call totals
+get_metrics().register_gauges("roleplay_rate_limiter", lambda: get_rate_limiter().stats())
+
+@contextmanager
+def call_deadline(deadline: Optional[float]) -> Iterator[None]:
+    """
+    Bound the calls made inside the block by a shared deadline.
+
+    Each attempt waits at most until the deadline (or its own timeout, if
+    sooner), and no retry is started that could not finish before it. Tasks
+    created inside the block inherit the deadline.
+
+    Args:
+        deadline: Event loop time (loop.time()) by which calls must be done, or None for no bound
+    """
+    token = _call_deadline.set(deadline)
+    try:
+        yield
+    finally:
+        _call_deadline.reset(token)
+
+
+class RateLimitError(Exception):
+    """The provider rejected a request with HTTP 429 (after any retries)."""
+
+    def __init__(self, message: str, retry_after: Optional[float] = None):
+        super().__init__(message)
+        self.retry_after = retry_after
+
+
+class ResponseTimeoutError(Exception):
+    """A call did not complete within its deadline (after any retries)."""
+
+
+# Errors worth retrying besides rate limits: dropped connections, timeouts and 5xx responses
+_TRANSIENT_ERRORS = (openai.APIConnectionError, openai.InternalServerError, ResponseTimeoutError)
+
+
+def _resolve_api_key(api_key: Optional[str]) -> str:
+    """Return the API key to use, raising if none is configured."""
+    api_key = api_key or Config.OPENROUTER_API_KEY
+    if not api_key and Config.LLM_BACKEND == "fake":
+        return "fake"
+    if not api_key:
+        raise ValueError(
+            "OPENROUTER_API_KEY not set. "
+            "Please set it in your .env file or pass it to the constructor."
+        )
+    return api_key
+
+
+def get_client(api_key: Optional[str] = None, base_url: Optional[str] = None) -> AsyncOpenAI:
+    """
+    Get the shared AsyncOpenAI client for a base URL on the running event loop.
+
+    With Config.LLM_BACKEND = "fake" this is the offline FakeLLMClient instead.
+    The client owns a keep-alive connection pool sized to
+    Config.MAX_CONCURRENT_DECISIONS so a full round of parallel character
+    decisions never has to open a fresh connection. HTTP pools are bound to
+    the loop they were created on, hence one client per (loop, base URL).
+
+    Args:
+        api_key: Optional API key (defaults to Config.OPENROUTER_API_KEY)
+        base_url: Optional base URL (defaults to Config.OPENROUTER_BASE_URL)
+
+    Returns:
+        Shared AsyncOpenAI client instance
+
+    Raises:
+        RuntimeError: If called outside a running event loop
+    """
+    loop = asyncio.get_running_loop()
+    if Config.LLM_BACKEND == "fake":
+        return get_fake_client()
+    api_key = _resolve_api_key(api_key)
+    base_url = base_url or Config.OPENROUTER_BASE_URL
+    key = (base_url, api_key)
+
+    with _registry_lock:
+        loop_clients = _clients.setdefault(loop, {})
+        client = loop_clients.get(key)
+        if client is None:
+            limits = Limits(
+                max_connections=Config.MAX_CONCURRENT_DECISIONS,
+                max_keepalive_connections=Config.MAX_CONCURRENT_DECISIONS,
+                keepalive_expiry=Config.KEEPALIVE_EXPIRY
+            )
+            client = AsyncOpenAI(
+                base_url=base_url,
+                api_key=api_key,
+                http_client=DefaultAsyncHttpxClient(limits=limits),
+                max_retries=0  # Retries go through GenerativeModel and the rate limiter
+            )
+            loop_clients[key] = client
+        return client
+
+
+def get_model(model_name: Optional[str] = None, api_key: Optional[str] = None) -> "GenerativeModel":
+    """
+    Get the shared GenerativeModel for a model name.
+
+    Args:
+        model_name: Model to use (defaults to Config.DEFAULT_MODEL)
+        api_key: Optional API key (defaults to Config.OPENROUTER_API_KEY)
+
+    Returns:
+        Shared GenerativeModel instance
+    """
+    model_name = model_name or Config.DEFAULT_MODEL
+    api_key = _resolve_api_key(api_key)
+    key = (Config.OPENROUTER_BASE_URL, model_name, api_key)
+
+    with _registry_lock:
+        model = _models.get(key)
+    if model is None:
+        model = GenerativeModel(model_name, api_key=api_key)
+        with _registry_lock:
+            model = _models.setdefault(key, model)
+    return model
+
+
+def get_rate_limiter(base_url: Optional[str] = None) -> RateLimiter:
+    """
+    Get the RateLimiter shared by every request to a base URL, across all sessions and loops.
+
+    Args:
+        base_url: Optional base URL (defaults to Config.OPENROUTER_BASE_URL)
+
+    Returns:
+        Shared RateLimiter instance (see RateLimiter.stats() for queue-depth metrics)
+    """
+    base_url = base_url or Config.OPENROUTER_BASE_URL
+    with _registry_lock:
+        limiter = _limiters.get(base_url)
+        if limiter is None:
+            limiter = RateLimiter(
+                requests_per_minute=Config.RATE_LIMIT_REQUESTS_PER_MINUTE,
+                tokens_per_minute=Config.RATE_LIMIT_TOKENS_PER_MINUTE,
+                request_burst=Config.RATE_LIMIT_BURST
+            )
+            _limiters[base_url] = limiter
+        return limiter
+
+
+async def close_clients() -> None:
+    """Close the shared clients owned by the running event loop."""
+    loop = asyncio.get_running_loop()
+    with _registry_lock:
+        loop_clients = _clients.pop(loop, {})
+    for client in loop_clients.values():
+        await client.close()
+
+
+# Pooled clients on the engine loop are closed before the loop stops at exit
+add_shutdown_hook(close_clients)
+
+
+class Response:
+    """Completion result exposing the generated text as .text"""
+
+    def __init__(self, content: str):
+        self.text = content
+
+    def __str__(self):
+        return self.text
+
+
+class _LatencyWindow:
+    """Latencies of recent successful calls of one kind, for choosing when to hedge."""
+    
+    def __init__(self, size: int = 200):
+        self._samples = deque(maxlen=size)
+    
+    def add(self, seconds: float) -> None:
+        self._samples.append(seconds)
+    
+    def percentile(self, fraction: float) -> Optional[float]:
+        """Get the given latency percentile, or None until enough calls were seen."""
+        if len(self._samples) < Config.HEDGE_MIN_SAMPLES:
+            return None
+        ordered = sorted(self._samples)
+        return ordered[min(int(fraction * len(ordered)), len(ordered) - 1)]
 
 
 class GenerativeModel:
@@ -19,61 +253,446 @@ class GenerativeModel:
             api_key: Optional API key (defaults to Config.OPENROUTER_API_KEY)
         """
         self.model_name = model_name
-        self.api_key = api_key or Config.OPENROUTER_API_KEY
+        self.api_key = _resolve_api_key(api_key)
         
-        if not self.api_key:
-            raise ValueError(
-                "OPENROUTER_API_KEY not set. "
-                "Please set it in your .env file or pass it to the constructor."
-            )
+        # Recent latencies keyed by (streamed, max_tokens); a bid and a full decision differ a lot
+        self._latencies: Dict[Tuple[bool, int], _LatencyWindow] = {}
+        # Uncached requests in flight by cache key, so identical concurrent requests share one call
+        self._inflight: Dict[str, "asyncio.Future[str]"] = {}
+    
+    def generate_content(self, prompt: str, **kwargs) -> Response:
+        """
+        Generate content from prompt (blocking wrapper over generate_content_async).
         
-        self._client = OpenAI(
-            base_url=Config.OPENROUTER_BASE_URL,
-            api_key=self.api_key
-        )
+        Args:
+            prompt: The text prompt
+            **kwargs: Additional parameters (system_prompt, priority, timeout, stage, character, response_format, temperature, max_tokens, top_p, frequency_penalty, etc.)
+            
+        Returns:
+            Response object with .text attribute
+        """
+        return run_sync(self.generate_content_async(prompt, **kwargs))
     
-    def generate_content(self, prompt: str, **kwargs):
+    async def generate_content_async(self, prompt: str, **kwargs) -> Response:
         """
-        Generate content from prompt.
+        Generate content from prompt without blocking the event loop.
         
         Args:
             prompt: The text prompt
-            **kwargs: Additional parameters (temperature, max_tokens, top_p, frequency_penalty, etc.)
+            **kwargs: Additional parameters (system_prompt, priority, timeout, stage, character, response_format, temperature, max_tokens, top_p, frequency_penalty, etc.)
             
         Returns:
             Response object with .text attribute
         """
+        params = self._request_params(prompt, kwargs)
+        started = time.monotonic()
         try:
-            temperature = kwargs.get('temperature', Config.MODEL_TEMPERATURE)
-            max_tokens = kwargs.get('max_tokens', Config.MAX_TOKENS)
-            top_p = kwargs.get('top_p', 1.0)
-            frequency_penalty = kwargs.get('frequency_penalty', 0.0)
+            text, usage, cached = await self._generate_async(params, kwargs)
+        except Exception:
+            self._record_call(kwargs, params, started, error=True)
+            raise
+        self._record_call(kwargs, params, started, text, usage, cached)
+        return Response(text)
+    
+    async def _generate_async(self, params: Dict[str, Any], kwargs: Dict[str, Any]) -> Tuple[str, Any, bool]:
+        """
+        Get a completion through the response cache, if one is configured.
+        
+        Returns:
+            Tuple of (text, usage reported by the provider or None, whether no request was sent)
+        """
+        cache = get_response_cache()
+        if cache is None:
+            response = await self._create_async(params, kwargs)
+            return response.choices[0].message.content, getattr(response, "usage", None), False
+        
+        slot, text = cache.lookup(params)
+        if text is not None:
+            return text, None, True
+        
+        loop = asyncio.get_running_loop()
+        pending = self._inflight.get(slot)
+        if pending is not None and pending.get_loop() is loop:
+            return await asyncio.shield(pending), None, True
+        
+        future = loop.create_future()
+        self._inflight[slot] = future
+        try:
+            response = await self._create_async(params, kwargs)
+            text = response.choices[0].message.content
+            cache.store(slot, self.model_name, text)
+            future.set_result(text)
+            return text, getattr(response, "usage", None), False
+        except BaseException as e:
+            future.set_exception(e)
+            future.exception()  # Waiters get the error; nobody else has to retrieve it
+            raise
+        finally:
+            if self._inflight.get(slot) is future:
+                del self._inflight[slot]
+    
+    async def stream_content_async(self, prompt: str, **kwargs) -> AsyncIterator[str]:
+        """
+        Stream content from prompt as it is generated.
+        
+        Args:
+            prompt: The text prompt
+            **kwargs: Additional parameters (system_prompt, priority, timeout, stage, character, response_format, temperature, max_tokens, top_p, frequency_penalty, etc.)
             
-            response = self._client.chat.completions.create(
-                model=self.model_name,
-                messages=[
-                    {"role": "user", "content": prompt}
-                ],
-                temperature=temperature,
-                max_tokens=max_tokens,
-                top_p=top_p,
-                frequency_penalty=frequency_penalty
-            )
-
-            class Response:
-                def __init__(self, content):
-                    self.text = content
-                def __str__(self):
-                    return self.text
+        Yields:
+            Text deltas in the order the model produces them
+        """
+        params = self._request_params(prompt, kwargs)
+        started = time.monotonic()
+        cache = get_response_cache()
+        slot = None
+        if cache is not None:
+            try:
+                slot, text = cache.lookup(params)
+            except Exception:
+                self._record_call(kwargs, params, started, error=True)
+                raise
+            if text is not None:
+                self._record_call(kwargs, params, started, text, cached=True)
+                yield text
+                return
+        
+        parts = []
+        usage = None
+        error = False
+        try:
+            # Retried only until the stream has started
+            stream = await self._create_async(params, kwargs, stream=True)
+            try:
+                async for chunk in stream:
+                    # With include_usage the last chunk carries the usage and no choices
+                    usage = getattr(chunk, "usage", None) or usage
+                    if chunk.choices and chunk.choices[0].delta.content:
+                        parts.append(chunk.choices[0].delta.content)
+                        yield chunk.choices[0].delta.content
+                        
+            except Exception as e:
+                raise self._translate_error(e)
+            finally:
+                # The tokens taken for the stream are settled once it is finished, failed or closed;
+                # without a usage chunk, what was sent and received so far is what it cost
+                total_tokens = getattr(usage, "total_tokens", None)
+                if total_tokens is None:
+                    total_tokens = self._estimate_prompt_tokens(params) + len("".join(parts)) // 4
+                get_rate_limiter().settle(self._estimate_tokens(params), total_tokens)
+        except Exception:
+            error = True
+            raise
+        finally:
+            # Also accounts streams the consumer stopped reading early
+            self._record_call(kwargs, params, started, "".join(parts), usage, error=error)
+        
+        # Only completions read to the end are cached
+        if cache is not None:
+            cache.store(slot, self.model_name, "".join(parts))
+    
+    def _record_call(
+        self,
+        kwargs: Dict[str, Any],
+        params: Dict[str, Any],
+        started: float,
+        text: str = "",
+        usage: Any = None,
+        cached: bool = False,
+        error: bool = False
+    ) -> None:
+        """Account a call in the metrics registry, estimating tokens the provider did not report."""
+        prompt_tokens = getattr(usage, "prompt_tokens", None)
+        completion_tokens = getattr(usage, "completion_tokens", None)
+        if cached:
+            prompt_tokens = completion_tokens = 0
+        if prompt_tokens is None:
+            prompt_tokens = self._estimate_prompt_tokens(params)
+        if completion_tokens is None:
+            completion_tokens = len(text) // 4
+        get_metrics().record_call(
+            stage=kwargs.get('stage', 'other'),
+            model=self.model_name,
+            prompt_tokens=prompt_tokens,
+            completion_tokens=completion_tokens,
+            latency=time.monotonic() - started,
+            character=kwargs.get('character'),
+            cached=cached,
+            error=error
+        )
+    
+    def _request_params(self, prompt: str, kwargs: Dict[str, Any]) -> Dict[str, Any]:
+        """Build chat-completions parameters from a prompt and generation kwargs."""
+        messages = []
+        system_prompt = kwargs.get('system_prompt')
+        if system_prompt:
+            messages.append({"role": "system", "content": self._system_content(system_prompt)})
+        messages.append({"role": "user", "content": prompt})
+        
+        params = {
+            "model": self.model_name,
+            "messages": messages,
+            "temperature": kwargs.get('temperature', Config.MODEL_TEMPERATURE),
+            "max_tokens": kwargs.get('max_tokens', Config.MAX_TOKENS),
+            "top_p": kwargs.get('top_p', 1.0),
+            "frequency_penalty": kwargs.get('frequency_penalty', 0.0)
+        }
+        response_format = kwargs.get('response_format')
+        if response_format and Config.STRUCTURED_OUTPUT and self.model_name not in _unstructured_models:
+            params["response_format"] = response_format
+        return params
+    
+    def _system_content(self, system_prompt: str) -> Any:
+        """
+        Format a static system prompt so provider-side prompt caching can reuse it.
+        Providers with automatic prefix caching only need the prefix to be identical;
+        others need an explicit cache_control breakpoint on the content part.
+        """
+        if not Config.PROMPT_CACHE_CONTROL:
+            return system_prompt
+        return [{"type": "text", "text": system_prompt, "cache_control": {"type": "ephemeral"}}]
+    
+    async def _create_async(self, params: Dict[str, Any], kwargs: Dict[str, Any], stream: bool = False) -> Any:
+        """
+        Send a chat-completions request through the shared rate limiter, retrying
+        rate limits and transient errors with jittered exponential backoff.
+        
+        Args:
+            params: Parameters from _request_params()
+            kwargs: The caller's generation kwargs ("priority" is "interactive" or "background")
+            stream: Request a streamed response
+            
+        Returns:
+            The completion, or the stream of chunks if stream is set
             
-            return Response(response.choices[0].message.content)
+        Raises:
+            RateLimitError: If the provider still rate limits the request after all retries
+            ResponseTimeoutError: If every attempt ran past its deadline, or the
+                call_deadline() budget ran out
+        """
+        loop = asyncio.get_running_loop()
+        deadline = _call_deadline.get()
+        limiter = get_rate_limiter()
+        priority = PRIORITIES.get(kwargs.get('priority', 'interactive'), PRIORITY_INTERACTIVE)
+        estimated_tokens = self._estimate_tokens(params)
+        timeout = kwargs.get('timeout', Config.RESPONSE_TIMEOUT)
+        hedge = Config.HEDGE_REQUESTS and priority == PRIORITY_INTERACTIVE
+        
+        attempt = 0
+        while True:
+            if deadline is not None and loop.time() >= deadline:
+                raise ResponseTimeoutError(f"No time left for a call to {self.model_name}")
+            try:
+                if hedge:
+                    response = await self._hedged_request_async(
+                        params, stream, timeout, limiter, estimated_tokens, priority
+                    )
+                else:
+                    await limiter.acquire(estimated_tokens, priority)
+                    try:
+                        response = await self._request_async(params, stream, timeout)
+                    except BaseException:
+                        # The request was not served: its tokens go back to the bucket
+                        limiter.release(estimated_tokens)
+                        raise
+                if stream:
+                    # Settled by stream_content_async() once the stream ends
+                    return response
+            except Exception as e:
+                if "response_format" in params and _rejects_response_format(e):
+                    # The prompts describe the format too; go on without the schema
+                    _unstructured_models.add(self.model_name)
+                    del params["response_format"]
+                    continue
+                error = e if isinstance(e, _TRANSIENT_ERRORS) else self._translate_error(e)
+                if isinstance(error, RateLimitError):
+                    # Everyone sharing the limiter holds back, not just this request
+                    limiter.pause(error.retry_after or Config.RETRY_BASE_DELAY)
+                delay = self._retry_delay(error, attempt)
+                if delay is None or (deadline is not None and loop.time() + delay >= deadline):
+                    raise error
+                attempt += 1
+                limiter.record_retry()
+                await asyncio.sleep(delay)
+                continue
             
-        except Exception as e:
-
-            error_msg = str(e)
-            if "429" in error_msg or "rate" in error_msg.lower():
-                raise Exception(f"ResourceExhausted: 429 Rate limit exceeded. {error_msg}")
-            elif "401" in error_msg or "invalid" in error_msg.lower():
-                raise Exception(f"InvalidAPIKey: {error_msg}")
+            usage = getattr(response, "usage", None)
+            limiter.settle(estimated_tokens, getattr(usage, "total_tokens", None))
+            return response
+    
+    async def _request_async(self, params: Dict[str, Any], stream: bool, timeout: float) -> Any:
+        """
+        Send one request and wait at most `timeout` seconds for the completion
+        (for a stream: for it to start, and between chunks). Under call_deadline(),
+        the completion (or the start of the stream) is not waited for past the deadline.
+        """
+        client = get_client(self.api_key)
+        extra = {"stream": True, "stream_options": {"include_usage": True}} if stream else {}
+        wait = timeout
+        deadline = _call_deadline.get()
+        if deadline is not None:
+            wait = max(min(timeout, deadline - asyncio.get_running_loop().time()), 0)
+        started = time.monotonic()
+        try:
+            response = await asyncio.wait_for(
+                client.chat.completions.create(timeout=timeout if stream else wait, **extra, **params),
+                wait
+            )
+        except asyncio.TimeoutError:
+            raise ResponseTimeoutError(f"No response from {self.model_name} within {wait:.1f}s")
+        self._latency_window(params, stream).add(time.monotonic() - started)
+        return response
+    
+    async def _hedged_request_async(
+        self,
+        params: Dict[str, Any],
+        stream: bool,
+        timeout: float,
+        limiter: RateLimiter,
+        estimated_tokens: int,
+        priority: int
+    ) -> Any:
+        """
+        Send a request and, if it is still running past the usual (Config.HEDGE_PERCENTILE)
+        latency of this kind of call, a duplicate; the first to complete wins and the
+        other is cancelled.
+        
+        Only the winner's tokens are left for the caller to settle; those of the other
+        copy, or of both if neither succeeds, are released here.
+        """
+        await limiter.acquire(estimated_tokens, priority)
+        sent = 1
+        primary = asyncio.ensure_future(self._request_async(params, stream, timeout))
+        tasks = {primary}
+        winner = None
+        
+        async def send_duplicate():
+            nonlocal sent
+            await limiter.acquire(estimated_tokens, priority)
+            sent += 1
+            limiter.record_hedge()
+            return await self._request_async(params, stream, timeout)
+        
+        try:
+            hedge_after = self._latency_window(params, stream).percentile(Config.HEDGE_PERCENTILE)
+            done = None
+            if hedge_after is not None:
+                done, _ = await asyncio.wait({primary}, timeout=hedge_after)
+            if hedge_after is None or done:
+                response = await primary
+                winner = primary
+                return response
+            
+            racers = {primary, asyncio.ensure_future(send_duplicate())}
+            tasks |= racers
+            error: Optional[BaseException] = None
+            while racers:
+                done, racers = await asyncio.wait(racers, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    if task.exception() is None:
+                        winner = task
+                        return task.result()
+                    error = task.exception()
+            raise error
+        finally:
+            for task in tasks:
+                if not task.done():
+                    task.cancel()
+                elif stream and task is not winner and not task.cancelled() and task.exception() is None:
+                    # Both streams started; drop the loser's connection
+                    asyncio.ensure_future(task.result().close())
+            unsettled = sent - (winner is not None)
+            if unsettled:
+                limiter.release(estimated_tokens * unsettled)
+    
+    def _latency_window(self, params: Dict[str, Any], stream: bool) -> _LatencyWindow:
+        """Get the latency window for a kind of request."""
+        key = (stream, params["max_tokens"])
+        window = self._latencies.get(key)
+        if window is None:
+            window = self._latencies.setdefault(key, _LatencyWindow())
+        return window
+    
+    def _estimate_tokens(self, params: Dict[str, Any]) -> int:
+        """Rough prompt + completion token count of a request."""
+        return self._estimate_prompt_tokens(params) + params["max_tokens"]
+    
+    def _estimate_prompt_tokens(self, params: Dict[str, Any]) -> int:
+        """Rough prompt token count of a request (4 characters per token)."""
+        characters = 0
+        for message in params["messages"]:
+            content = message["content"]
+            if isinstance(content, list):
+                characters += sum(len(part.get("text", "")) for part in content)
             else:
-                raise
\ No newline at end of file
+                characters += len(content)
+        return characters // 4
+    
+    def _retry_delay(self, error: Exception, attempt: int) -> Optional[float]:
+        """
+        Seconds to wait before retrying a failed request, or None if it should not be retried.
+        Uses full-jitter exponential backoff, but never less than the provider's Retry-After.
+        """
+        if attempt >= Config.MAX_RETRIES:
+            return None
+        if isinstance(error, RateLimitError):
+            retry_after = error.retry_after or 0.0
+            if retry_after > Config.RETRY_MAX_DELAY:
+                # e.g. an exhausted daily quota; waiting would only stall the round
+                return None
+        elif isinstance(error, _TRANSIENT_ERRORS):
+            retry_after = 0.0
+        else:
+            return None
+        
+        backoff = random.uniform(0, min(Config.RETRY_MAX_DELAY, Config.RETRY_BASE_DELAY * 2 ** attempt))
+        return max(backoff, retry_after)
+    
+    def _translate_error(self, e: Exception) -> Exception:
+        """Map provider errors onto the exceptions callers already handle."""
+        error_msg = str(e)
+        if (isinstance(e, openai.RateLimitError) or getattr(e, "status_code", None) == 429
+                or "429" in error_msg or "rate limit" in error_msg.lower()):
+            return RateLimitError(
+                f"ResourceExhausted: 429 Rate limit exceeded. {error_msg}",
+                retry_after=_retry_after_seconds(e)
+            )
+        elif "401" in error_msg or "invalid" in error_msg.lower():
+            return Exception(f"InvalidAPIKey: {error_msg}")
+        return e
+
+
+def _rejects_response_format(e: Exception) -> bool:
+    """Whether a provider error says structured outputs are not supported."""
+    if not isinstance(e, openai.BadRequestError):
+        return False
+    error_msg = str(e).lower()
+    return any(word in error_msg for word in ("response_format", "json_schema", "structured output"))
+
+
+def _retry_after_seconds(e: Exception) -> Optional[float]:
+    """Read the Retry-After (or retry-after-ms) header of a provider error, in seconds."""
+    response = getattr(e, "response", None)
+    headers = getattr(response, "headers", None)
+    if not headers:
+        return None
+    
+    retry_after_ms = headers.get("retry-after-ms")
+    if retry_after_ms:
+        try:
+            return max(float(retry_after_ms) / 1000.0, 0.0)
+        except ValueError:
+            pass
+    
+    retry_after = headers.get("retry-after")
+    if not retry_after:
+        return None
+    try:
+        return max(float(retry_after), 0.0)
+    except ValueError:
+        pass
+    try:
+        # HTTP-date form
+        return max(parsedate_to_datetime(retry_after).timestamp() - time.time(), 0.0)
+    except (TypeError, ValueError):
+        return None
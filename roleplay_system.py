@@ -2,14 +2,18 @@
 Main roleplay system coordinator.
 """
 
-from typing import List, Optional
+import sys
+from concurrent.futures import Future
+from typing import Any, Dict, List, Optional
 from pathlib import Path
-from datetime import datetime
-import json
 
-from data_models import CharacterPersona, Character, TimelineHistory
+from data_models import CharacterPersona, Character, CharacterState, TimelineHistory, RollingSummary
 from managers.turn_manager import TurnManager
 from managers.timelineManager import TimelineManager
+from storage import ConversationStore, EventLogStore, SQLiteStore, events_from_dicts, apply_timeline_metadata
+from helpers.pacing import PacedOutput, install_paced_console, uninstall_paced_console
+from helpers.async_runner import call_on_loop
+from helpers.metrics import get_metrics, format_totals
 from config import Config
 
 
@@ -25,7 +29,8 @@ class RoleplaySystem:
         story_manager = None,
         story_name: str = "default",
         initial_location: str = "Common Room",
-        initial_scene_description: str = None
+        initial_scene_description: str = None,
+        session_id: Optional[str] = None
     ):
         """
         Initialize the roleplay system.
@@ -39,13 +44,15 @@ class RoleplaySystem:
             story_name: Name of the story (used for unique conversation filenames)
             initial_location: Starting location for the conversation
             initial_scene_description: Optional initial scene description
+            session_id: Conversation session to save to and resume (defaults to story_name); with the
+                sqlite backend, sessions of the same story are stored side by side
             
         Raises:
-            ValueError: If OPENROUTER_API_KEY is not set
+            ValueError: If OPENROUTER_API_KEY is not set (and the backend is not the offline fake)
         """
         # Configure API with key from Config
         api_key = Config.OPENROUTER_API_KEY
-        if not api_key:
+        if not api_key and Config.LLM_BACKEND != "fake":
             raise ValueError(
                 "OPENROUTER_API_KEY not set in environment. "
                 "Please set it in your .env file or environment variables."
@@ -54,6 +61,7 @@ class RoleplaySystem:
         self.player_name = player_name
         self.model_name = model_name or Config.DEFAULT_MODEL
         self.story_name = story_name
+        self.session_id = session_id or story_name
         
         # Import character manager early to create characters properly
         from managers.characterManager import CharacterManager
@@ -91,7 +99,9 @@ class RoleplaySystem:
         self.turn_manager = TurnManager(
             characters=self.ai_characters,
             timeline=timeline,
-            save_callback=lambda: self._save_conversation()
+            save_callback=lambda: self._save_conversation(),
+            session_id=self.session_id,
+            story_manager=story_manager
         )
         
         # Get references to managers for direct access
@@ -102,6 +112,7 @@ class RoleplaySystem:
         # Setup storage
         self.chat_storage_dir = Path(chat_storage_dir or Config.CHAT_STORAGE_DIR)
         self.chat_storage_dir.mkdir(exist_ok=True)
+        self.store = self._open_store()
         
         # Try to load existing conversation
         self._load_conversation_if_exists()
@@ -113,105 +124,42 @@ class RoleplaySystem:
         Returns:
             True if conversation was loaded, False otherwise
         """
-        filepath = self.get_conversation_file_path()
-        
-        if not filepath.exists():
+        if not self.store.exists():
             return False
         
         try:
-            with open(filepath, 'r', encoding='utf-8') as f:
-                data = json.load(f)
-            
-            # Restore timeline from saved data
-            from data_models import Message, Scene
+            # Latest snapshot plus the events logged after it (or the session's rows)
+            metadata, events_data = self.store.load()
             
             # Clear current timeline events
             self.timeline.events.clear()
             
-            # Restore timeline metadata
-            if 'id' in data:
-                self.timeline.id = data['id']
-            if 'title' in data:
-                self.timeline.title = data['title']
-            if 'participants' in data:
-                self.timeline.participants = data['participants']
-            if 'timeline_summary' in data:
-                self.timeline.timeline_summary = data['timeline_summary']
-            if 'visible_to_user' in data:
-                self.timeline.visible_to_user = data['visible_to_user']
+            # Restore timeline metadata (including the rolling summaries)
+            apply_timeline_metadata(self.timeline, metadata)
+            
+            # Restore events (messages, scenes, actions, entries and exits) in bulk
+            self.timeline.events.extend(events_from_dicts(events_data))
+            events = self.timeline.events
             
-            # Restore events (messages, scenes, and actions)
-            for event_data in data.get('events', []):
-                # Check for explicit type field first (new format)
-                event_type = event_data.get('type')
-                
-                if event_type == 'message' or ('character' in event_data and 'dialouge' in event_data):
-                    # This is a Message
-                    message = Message(
-                        timeline_id=event_data.get('timeline_id'),
-                        timestamp=datetime.fromisoformat(event_data['timestamp']) if 'timestamp' in event_data else datetime.now(),
-                        character=event_data['character'],
-                        dialouge=event_data['dialouge'],
-                        action_description=event_data['action_description']
-                    )
-                    self.timeline.events.append(message)
-                elif event_type == 'scene' or ('location' in event_data and 'description' in event_data):
-                    # This is a Scene
-                    scene = Scene(
-                        timeline_id=event_data.get('timeline_id'),
-                        timestamp=datetime.fromisoformat(event_data['timestamp']) if 'timestamp' in event_data else datetime.now(),
-                        scene_type=event_data.get('scene_type', 'environmental'),
-                        location=event_data['location'],
-                        description=event_data['description']
-                    )
-                    self.timeline.events.append(scene)
-                elif event_type == 'action' or ('character' in event_data and 'description' in event_data):
-                    # This is an Action
-                    from data_models import Action
-                    action = Action(
-                        timeline_id=event_data.get('timeline_id'),
-                        timestamp=datetime.fromisoformat(event_data['timestamp']) if 'timestamp' in event_data else datetime.now(),
-                        character=event_data['character'],
-                        description=event_data['description']
-                    )
-                    self.timeline.events.append(action)
-                elif event_type == 'character_entry':
-                    # This is a CharacterEntry
-                    from data_models import CharacterEntry
-                    entry = CharacterEntry(
-                        timeline_id=event_data.get('timeline_id'),
-                        timestamp=datetime.fromisoformat(event_data['timestamp']) if 'timestamp' in event_data else datetime.now(),
-                        character=event_data['character'],
-                        description=event_data['description']
-                    )
-                    self.timeline.events.append(entry)
-                elif event_type == 'character_exit':
-                    # This is a CharacterExit
-                    from data_models import CharacterExit
-                    exit_event = CharacterExit(
-                        timeline_id=event_data.get('timeline_id'),
-                        timestamp=datetime.fromisoformat(event_data['timestamp']) if 'timestamp' in event_data else datetime.now(),
-                        character=event_data['character'],
-                        description=event_data['description'],
-                        reason=event_data.get('reason')
-                    )
-                    self.timeline.events.append(exit_event)
+            # Work out who was present when, in one pass, starting with all participants
+            presence = self.timeline_manager.compute_presence_intervals(events, self.timeline.participants)
             
-            # Broadcast all events to characters so they have the full context
-            # Replay timeline to track who was present at each point
-            present_at_moment = set(self.timeline.participants)  # Start with all initial participants
+            # Give every character the events it witnessed so it has the full context
+            self.character_manager.attach_memories(self.ai_characters, events, presence)
             
-            for event in self.timeline.events:
-                # Broadcast to whoever was present at this moment
-                active_characters = [c for c in self.ai_characters if c.persona.name in present_at_moment]
-                self.character_manager.broadcast_event_to_characters(active_characters, event)
-                
-                # Update presence based on Entry/Exit events
-                from data_models import CharacterEntry, CharacterExit
-                if isinstance(event, CharacterEntry):
-                    present_at_moment.add(event.character)
-                elif isinstance(event, CharacterExit):
-                    present_at_moment.discard(event.character)
+            # Older saves did not store who is currently present
+            if 'current_participants' not in metadata:
+                self.timeline.current_participants = [
+                    name for name, intervals in presence.items()
+                    if intervals and intervals[-1][1] is None
+                ]
+            
+            # Character states and story objective, for saves that recorded them
+            progress = metadata.get("progress") or {}
+            self._restore_progress(progress)
+            
+            # The judge continues where it was instead of from the initial scene
+            self.turn_manager.restart_from_timeline(progress.get("judge"))
             
             print("\n" + "="*70)
             print("📂 LOADED EXISTING CONVERSATION")
@@ -229,82 +177,62 @@ class RoleplaySystem:
             return False
     
     def _save_conversation(self) -> None:
-        """Save the current conversation to a JSON file in TimelineHistory format."""
-        filename = "group_chat.json"
-        filepath = self.chat_storage_dir / filename
-        
+        """
+        Save events added since the last save, and the current progress, to the store.
+        What changed is taken on the engine loop, so the background judge and summaries
+        never change the timeline halfway through; the store writes it on its own thread,
+        so the engine loop never waits for the disk.
+        """
         try:
-            from data_models import Message, Scene, Action
-            
-            # Manually construct the data structure to ensure proper serialization
-            timeline_data = {
-                "id": self.timeline.id,
-                "title": self.timeline.title,
-                "events": [],
-                "participants": self.timeline.participants,
-                "timeline_summary": self.timeline.timeline_summary,
-                "visible_to_user": self.timeline.visible_to_user
-            }
-            
-            # Serialize each event with all its fields
-            for event in self.timeline.events:
-                if isinstance(event, Message):
-                    event_data = {
-                        "type": "message",
-                        "timeline_id": event.timeline_id,
-                        "timestamp": event.timestamp.isoformat(),
-                        "character": event.character,
-                        "dialouge": event.dialouge,
-                        "action_description": event.action_description
-                    }
-                elif isinstance(event, Scene):
-                    event_data = {
-                        "type": "scene",
-                        "timeline_id": event.timeline_id,
-                        "timestamp": event.timestamp.isoformat(),
-                        "location": event.location,
-                        "description": event.description
-                    }
-                elif isinstance(event, Action):
-                    event_data = {
-                        "type": "action",
-                        "timeline_id": event.timeline_id,
-                        "timestamp": event.timestamp.isoformat(),
-                        "character": event.character,
-                        "description": event.description
-                    }
-                elif isinstance(event, CharacterEntry):
-                    from data_models import CharacterEntry
-                    event_data = {
-                        "type": "character_entry",
-                        "timeline_id": event.timeline_id,
-                        "timestamp": event.timestamp.isoformat(),
-                        "character": event.character,
-                        "description": event.description
-                    }
-                elif isinstance(event, CharacterExit):
-                    from data_models import CharacterExit
-                    event_data = {
-                        "type": "character_exit",
-                        "timeline_id": event.timeline_id,
-                        "timestamp": event.timestamp.isoformat(),
-                        "character": event.character,
-                        "description": event.description,
-                        "reason": event.reason if hasattr(event, 'reason') else None
-                    }
-                else:
-                    continue
-                
-                timeline_data["events"].append(event_data)
-            
-            with open(filepath, 'w', encoding='utf-8') as f:
-                json.dump(timeline_data, f, indent=2, ensure_ascii=False)
-                
+            pending = call_on_loop(self._start_save)
         except Exception as e:
             print(f"⚠️  Error saving conversation: {e}")
+            return
+        pending.add_done_callback(self._report_save_error)
+    
+    def _start_save(self) -> Future:
+        """Capture the timeline and progress for the store's writer thread (on the engine loop)."""
+        return self.store.sync_in_background(self.timeline, self._session_progress())
+    
+    @staticmethod
+    def _report_save_error(pending: Future) -> None:
+        """Report a background save that failed."""
+        if pending.exception() is not None:
+            print(f"⚠️  Error saving conversation: {pending.exception()}")
+    
+    def _session_progress(self) -> Dict[str, Any]:
+        """Get the characters' states and the story objective as a JSON-compatible dictionary."""
+        story = self.turn_manager.story_manager.story
+        return {
+            "character_states": {
+                character.persona.name: character.state.model_dump(mode="json")
+                for character in self.ai_characters if character.state is not None
+            },
+            "objective_index": story.current_objective_index if story else None,
+            "judge": self.turn_manager.judge_progress(),
+        }
+    
+    def _restore_progress(self, progress: Optional[Dict[str, Any]]) -> None:
+        """Restore the characters' states and the story objective saved by _session_progress()."""
+        if not progress:
+            return
+        states = progress.get("character_states", {})
+        for character in self.ai_characters:
+            if character.persona.name in states:
+                character.state = CharacterState.model_validate(states[character.persona.name])
+        story = self.turn_manager.story_manager.story
+        if story is not None and progress.get("objective_index") is not None:
+            story.current_objective_index = progress["objective_index"]
     
     def _add_player_message(self, content: str) -> None:
-        """Add a player message to the conversation."""
+        """
+        Add a player message to the conversation.
+        The timeline is changed on the engine loop, between the steps of its background tasks.
+        """
+        call_on_loop(self._record_player_message, content)
+    
+    def _record_player_message(self, content: str) -> None:
+        """Add a player message to the timeline, tell the present characters and save (on the engine loop)."""
         # Extract action description from brackets if present
         import re
         action_desc = None
@@ -335,23 +263,26 @@ class RoleplaySystem:
     
     def get_conversation_file_path(self) -> Path:
         """Get the file path where the conversation is saved."""
-        # Use story name to create unique conversation file
-        safe_story_name = self.story_name.lower().replace(" ", "_")
-        return self.chat_storage_dir / f"{safe_story_name}_chat.json"
+        if Config.STORAGE_BACKEND == "sqlite":
+            return self.chat_storage_dir / Config.SQLITE_DB_NAME
+        # Use the session (by default the story name) to create a unique conversation file
+        safe_session_name = self.session_id.lower().replace(" ", "_")
+        return self.chat_storage_dir / f"{safe_session_name}_chat.json"
+    
+    def _open_store(self) -> ConversationStore:
+        """Open the conversation store of the configured backend (Config.STORAGE_BACKEND)."""
+        if Config.STORAGE_BACKEND == "sqlite":
+            return SQLiteStore(self.get_conversation_file_path(), self.session_id, story=self.story_name)
+        if Config.STORAGE_BACKEND != "eventlog":
+            raise ValueError(f"Unknown storage backend: {Config.STORAGE_BACKEND}")
+        return EventLogStore(self.get_conversation_file_path())
     
     def reset_conversation(self) -> None:
         """
         Reset the conversation to start fresh.
-        Deletes the saved file and clears current messages.
+        Deletes the saved conversation and clears current messages.
         """
-        filepath = self.get_conversation_file_path()
-        
-        # Delete saved file if it exists
-        if filepath.exists():
-            filepath.unlink()
-        
-        # Clear current timeline events
-        self.timeline.events.clear()
+        call_on_loop(self._clear_conversation)
         
         print("\n" + "="*70)
         print("🔄 CONVERSATION RESET")
@@ -360,6 +291,21 @@ class RoleplaySystem:
         print("Starting fresh conversation...")
         print("="*70 + "\n")
     
+    def _clear_conversation(self) -> None:
+        """Delete the saved session and clear the timeline and memories (on the engine loop)."""
+        # Delete the saved session if it exists
+        self.store.delete()
+        
+        # Clear current timeline events, what the characters remember of them and their summaries
+        self.timeline.events.clear()
+        self.timeline.summary = RollingSummary()
+        self.timeline.character_summaries = {}
+        for character in self.ai_characters:
+            character.memory.event.clear()
+        
+        # Drop the judge, summary and candidate work of the old conversation
+        self.turn_manager.restart_from_timeline()
+    
     def display_welcome(self) -> None:
         """Display welcome message with character information."""
         char_names = ", ".join([char.persona.name for char in self.ai_characters])
@@ -390,6 +336,11 @@ have something to say, creating an organic, dynamic storytelling experience!
 """
         print(welcome)
     
+    def display_stats(self) -> None:
+        """Display LLM calls, tokens, latency and estimated cost of this session per stage."""
+        print("\n📊 LLM USAGE:\n")
+        print(format_totals(get_metrics(), session=self.turn_manager.session_id))
+    
     def display_character_info(self) -> None:
         """Display information about all AI characters."""
         print("\n📖 CHARACTER INFORMATION:\n")
@@ -435,6 +386,11 @@ have something to say, creating an organic, dynamic storytelling experience!
             self.display_character_info()
             return True
         
+        # Check for stats command
+        if user_input.lower() == 'stats':
+            self.display_stats()
+            return True
+        
         # Skip empty inputs
         if not user_input:
             return True
@@ -452,28 +408,39 @@ have something to say, creating an organic, dynamic storytelling experience!
         Args:
             show_char_info: Whether to display character information at start
         """
-        self.display_welcome()
-        
-        if show_char_info:
-            self.display_character_info()
-        
-        # Send initial greeting
-        self._send_initial_greeting()
-        
-        # Main conversation loop
-        while True:
-            try:
-                # Get player input
-                user_input = input(f"\n⚡ {self.player_name}: ").strip()
-                
-                # Handle input and check if should continue
-                should_continue = self._handle_player_input(user_input)
-                if not should_continue:
-                    break
+        # Lines are paced on the console; the turn engine itself never waits.
+        # A console the caller installed is left in place
+        owns_console = not isinstance(sys.stdout, PacedOutput)
+        console = install_paced_console()
+        try:
+            self.display_welcome()
+            
+            if show_char_info:
+                self.display_character_info()
+            
+            # Send initial greeting
+            self._send_initial_greeting()
+            
+            # Main conversation loop
+            while True:
+                try:
+                    # Get player input
+                    user_input = console.input(f"\n⚡ {self.player_name}: ").strip()
                     
-            except KeyboardInterrupt:
-                print("\n\n👋 Interrupted! Ending roleplay...")
-                print(f"💾 Chat saved to: {self.get_conversation_file_path()}")
-                break
-            except Exception as e:
-                print(f"\n❌ Error: {str(e)}\n")
+                    # Handle input and check if should continue
+                    should_continue = self._handle_player_input(user_input)
+                    if not should_continue:
+                        break
+                        
+                except KeyboardInterrupt:
+                    print("\n\n👋 Interrupted! Ending roleplay...")
+                    print(f"💾 Chat saved to: {self.get_conversation_file_path()}")
+                    break
+                except Exception as e:
+                    print(f"\n❌ Error: {str(e)}\n")
+            
+            # Make sure the last batch of logged events reaches the disk
+            self.store.close()
+        finally:
+            if owns_console:
+                uninstall_paced_console()
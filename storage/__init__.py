@@ -0,0 +1,11 @@
+"""
+Persistence for conversations.
+"""
+
+from .serialization import event_to_dict, event_from_dict, events_from_dicts, timeline_metadata, apply_timeline_metadata
+from .base import ConversationStore
+from .event_log import EventLogStore
+from .sqlite_store import SQLiteStore
+
+__all__ = ['event_to_dict', 'event_from_dict', 'events_from_dicts', 'timeline_metadata', 'apply_timeline_metadata',
+           'ConversationStore', 'EventLogStore', 'SQLiteStore']
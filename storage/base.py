@@ -0,0 +1,157 @@
+"""
+Interface shared by the conversation storage backends.
+"""
+
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Dict, List, NamedTuple, Optional, Tuple
+
+import sys
+from pathlib import Path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from data_models import TimelineEvent, TimelineHistory
+from storage.serialization import timeline_metadata
+
+
+class SaveBatch(NamedTuple):
+    """What one save writes, taken from the timeline while nothing can change it."""
+    events: List[TimelineEvent]  # Events added since the last capture, or every event if rewrite is set
+    metadata: Dict[str, Any]  # timeline_metadata() at the time of the capture
+    progress: Optional[Dict[str, Any]]  # Session progress, if given
+    rewrite: bool  # The timeline was cleared or rewritten, so the saved copy is replaced
+
+
+class ConversationStore:
+    """
+    Durable copy of one conversation session.
+
+    A store saves the timeline's events (append-only, in timeline order), its
+    metadata (see storage.timeline_metadata) and the session's progress: the
+    characters' states and the story's objective index. Backends:
+    - EventLogStore: a JSON snapshot plus an append-only JSONL log per session
+    - SQLiteStore: rows in a shared SQLite database, many sessions per story
+
+    Saving is split in two: capture() takes what changed from the timeline (on
+    the thread that owns it, cheaply), and write() serializes and stores it.
+    Writes run one at a time, in order, on the store's writer thread, so a
+    save never holds up the engine loop while it waits for the disk.
+    """
+
+    # Number of timeline events already captured for saving
+    persisted_count = 0
+    _writer: Optional[ThreadPoolExecutor] = None
+
+    def exists(self) -> bool:
+        """Check whether a saved conversation exists."""
+        raise NotImplementedError
+
+    def load(self) -> Tuple[Dict[str, Any], List[Dict[str, Any]]]:
+        """
+        Read the saved conversation.
+
+        Returns:
+            Tuple of (timeline metadata, list of event dictionaries in timeline order).
+            Saved progress, if any, is in the metadata under "progress".
+        """
+        raise NotImplementedError
+
+    def sync(self, timeline: TimelineHistory, progress: Optional[Dict[str, Any]] = None) -> None:
+        """
+        Persist everything added to the timeline since the last call, and wait until it is written.
+
+        Args:
+            timeline: The timeline being saved; events are assumed to be append-only
+            progress: Optional JSON-compatible session progress (character states, story objective)
+        """
+        self.sync_in_background(timeline, progress).result()
+
+    def sync_in_background(self, timeline: TimelineHistory, progress: Optional[Dict[str, Any]] = None) -> Future:
+        """
+        Capture everything added to the timeline since the last call, and write it on the writer thread.
+
+        Args:
+            timeline: The timeline being saved (only read during this call)
+            progress: Optional JSON-compatible session progress
+
+        Returns:
+            Future of the write; it holds the error if the write failed
+        """
+        batch = self.capture(timeline, progress)
+        if self._writer is None:
+            self._writer = ThreadPoolExecutor(max_workers=1, thread_name_prefix="conversation-writer")
+        return self._writer.submit(self.write, batch)
+
+    def capture(self, timeline: TimelineHistory, progress: Optional[Dict[str, Any]] = None) -> SaveBatch:
+        """
+        Take what the next save has to write: the new events (by reference) and the metadata.
+
+        Args:
+            timeline: The timeline being saved
+            progress: Optional session progress
+
+        Returns:
+            The batch for write()
+        """
+        rewrite = len(timeline.events) < self.persisted_count
+        events = timeline.events[0 if rewrite else self.persisted_count:]
+        self.persisted_count = len(timeline.events)
+        return SaveBatch(list(events), timeline_metadata(timeline), progress, rewrite)
+
+    def write(self, batch: SaveBatch) -> None:
+        """Store a batch taken by capture() (called in capture order, on the writer thread)."""
+        raise NotImplementedError
+
+    def wait_for_writes(self) -> None:
+        """Block until every save started so far has been written."""
+        if self._writer is not None:
+            self._writer.submit(lambda: None).result()
+
+    def _stop_writer(self) -> None:
+        """Wait for pending saves and stop the writer thread (a later save starts a new one)."""
+        if self._writer is not None:
+            self._writer.shutdown(wait=True)
+            self._writer = None
+
+    def write_snapshot(self, timeline: TimelineHistory) -> None:
+        """Rewrite the whole saved conversation from the timeline."""
+        raise NotImplementedError
+
+    def recent_events(
+        self,
+        n: Optional[int] = 10,
+        event_type: Optional[str] = None,
+        character: Optional[str] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Get the n most recent saved events, without loading the conversation into a timeline.
+
+        Args:
+            n: Number of events, or None for all of them
+            event_type: Optional record type filter ("message", "scene", "action",
+                "character_entry", "character_exit")
+            character: Optional character filter
+
+        Returns:
+            Event dictionaries in timeline order
+        """
+        self.wait_for_writes()
+        _, events = self.load()
+        if event_type is not None:
+            events = [event for event in events if event.get("type") == event_type]
+        if character is not None:
+            events = [event for event in events if event.get("character") == character]
+        if n is not None:
+            events = events[-n:] if n > 0 else []
+        return events
+
+    def flush(self) -> None:
+        """Force buffered writes to stable storage."""
+
+    def close(self) -> None:
+        """Wait for pending saves, then flush and release the store's files."""
+        self._stop_writer()
+        self.flush()
+
+    def delete(self) -> None:
+        """Delete the saved conversation."""
+        raise NotImplementedError
@@ -0,0 +1,265 @@
+"""
+Append-only event log persistence for conversations.
+
+A conversation is stored as two files:
+- a snapshot (`<name>_chat.json`): the full timeline in the regular chat JSON
+  format, plus the number of events it contains
+- a log (`<name>_chat.log.jsonl`): one JSON record per line for every event
+  (and timeline metadata change) since the snapshot
+
+Saving appends only what changed since the last save, so its cost does not
+grow with the length of the conversation. Every `snapshot_every` events the
+log is compacted into a fresh snapshot, built from the files themselves.
+Loading reads the snapshot and then replays the log tail.
+"""
+
+import json
+import os
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+import sys
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from data_models import TimelineHistory
+from config import Config
+from storage.base import ConversationStore, SaveBatch
+from storage.serialization import event_to_dict, timeline_metadata
+
+
+class EventLogStore(ConversationStore):
+    """Snapshot + append-only JSONL log for a single conversation."""
+
+    def __init__(
+        self,
+        snapshot_path: Path,
+        fsync_every: Optional[int] = None,
+        fsync_interval: Optional[float] = None,
+        snapshot_every: Optional[int] = None
+    ):
+        """
+        Initialize the store.
+
+        Args:
+            snapshot_path: Path of the snapshot file; the log lives next to it
+            fsync_every: Records appended before the log is fsynced (defaults to Config.CHAT_LOG_FSYNC_EVERY)
+            fsync_interval: Max seconds between fsyncs while appending (defaults to Config.CHAT_LOG_FSYNC_INTERVAL)
+            snapshot_every: Logged events before the log is compacted into a snapshot
+                (defaults to Config.CHAT_SNAPSHOT_EVERY)
+        """
+        self.snapshot_path = Path(snapshot_path)
+        self.log_path = self.snapshot_path.with_suffix(".log.jsonl")
+        self.fsync_every = fsync_every or Config.CHAT_LOG_FSYNC_EVERY
+        self.fsync_interval = fsync_interval if fsync_interval is not None else Config.CHAT_LOG_FSYNC_INTERVAL
+        self.snapshot_every = snapshot_every or Config.CHAT_SNAPSHOT_EVERY
+
+        # Number of timeline events already captured for saving, and of event records on disk
+        self.persisted_count = 0
+        self._record_count = 0
+        self._snapshot_count = 0
+        self._metadata: Optional[Dict[str, Any]] = None
+        self._progress: Optional[Dict[str, Any]] = None
+        self._log_file = None
+        self._unsynced = 0
+        self._last_fsync = time.monotonic()
+
+    def exists(self) -> bool:
+        """Check whether a saved conversation exists."""
+        return self.snapshot_path.exists() or self.log_path.exists()
+
+    def load(self) -> Tuple[Dict[str, Any], List[Dict[str, Any]]]:
+        """
+        Read the latest snapshot and replay the log tail on top of it.
+
+        Returns:
+            Tuple of (timeline metadata, list of event dictionaries in timeline order)
+        """
+        metadata, events, snapshot_count = self._read(drop_torn=True)
+
+        self.persisted_count = len(events)
+        self._record_count = len(events)
+        self._snapshot_count = snapshot_count
+        self._metadata = dict(metadata)
+        self._progress = metadata.get("progress")
+        return metadata, events
+
+    def _read(self, drop_torn: bool = False) -> Tuple[Dict[str, Any], List[Dict[str, Any]], int]:
+        """
+        Read the snapshot and the log records after it.
+
+        Args:
+            drop_torn: Cut a torn final log line off the file
+
+        Returns:
+            Tuple of (metadata, event dictionaries, number of events in the snapshot)
+        """
+        metadata: Dict[str, Any] = {}
+        events: List[Dict[str, Any]] = []
+
+        if self.snapshot_path.exists():
+            with open(self.snapshot_path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            events = data.pop("events", [])
+            data.pop("event_count", None)
+            metadata = data
+        snapshot_count = len(events)
+
+        if self.log_path.exists():
+            good_offset = 0
+            torn = False
+            with open(self.log_path, 'rb') as f:
+                for line in f:
+                    try:
+                        if not line.endswith(b"\n"):
+                            raise ValueError("incomplete record")
+                        record = json.loads(line.decode('utf-8'))
+                    except ValueError:
+                        torn = True
+                        break
+                    good_offset += len(line)
+                    # Records already folded into the snapshot have a lower seq and are skipped
+                    seq = record.get("seq", -1)
+                    if "meta" in record:
+                        if seq >= snapshot_count:
+                            metadata.update(record["meta"])
+                    elif seq == len(events):
+                        events.append(record["event"])
+            if torn and drop_torn:
+                # A torn final line from a crash mid-write; drop it so new records
+                # are not appended behind it
+                os.truncate(self.log_path, good_offset)
+
+        return metadata, events, snapshot_count
+
+    def write(self, batch: SaveBatch) -> None:
+        """
+        Append a captured batch to the log, compacting it into a snapshot when it is due.
+
+        Args:
+            batch: Events and metadata taken by capture()
+        """
+        if batch.progress is not None:
+            self._progress = batch.progress
+        metadata = self._with_progress(batch.metadata)
+
+        if batch.rewrite:
+            # The timeline was cleared or rewritten; start over from a full snapshot
+            self._write_snapshot_file(metadata, self._event_dicts(batch.events))
+            return
+
+        if metadata != self._metadata:
+            self._append({"seq": self._record_count, "meta": metadata})
+            self._metadata = metadata
+
+        for event_data in self._event_dicts(batch.events):
+            self._append({"seq": self._record_count, "event": event_data})
+            self._record_count += 1
+
+        if self._record_count - self._snapshot_count >= self.snapshot_every:
+            # Compacted from the files, so the timeline is not needed (or touched) here
+            self.flush()
+            metadata, events, _ = self._read()
+            self._write_snapshot_file(metadata, events)
+        else:
+            self._maybe_fsync()
+
+    def write_snapshot(self, timeline: TimelineHistory) -> None:
+        """
+        Compact the whole timeline into a new snapshot and start an empty log.
+        The snapshot is written to a temporary file and atomically swapped in.
+
+        Args:
+            timeline: The timeline to snapshot
+        """
+        self.wait_for_writes()
+        self._write_snapshot_file(self._current_metadata(timeline), self._event_dicts(timeline.events))
+        self.persisted_count = len(timeline.events)
+
+    def _write_snapshot_file(self, metadata: Dict[str, Any], events: List[Dict[str, Any]]) -> None:
+        """Atomically replace the snapshot with the given metadata and event records, then empty the log."""
+        snapshot = dict(metadata)
+        snapshot["events"] = events
+        snapshot["event_count"] = len(events)
+
+        tmp_path = self.snapshot_path.with_suffix(".json.tmp")
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(snapshot, f, ensure_ascii=False)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, self.snapshot_path)
+
+        # Log records at or above the snapshot's count would be replayed, so the log is emptied
+        self._close_log()
+        with open(self.log_path, 'w', encoding='utf-8') as f:
+            f.flush()
+            os.fsync(f.fileno())
+
+        self._record_count = len(events)
+        self._snapshot_count = len(events)
+        self._metadata = metadata
+
+    def flush(self) -> None:
+        """Force any buffered log records to stable storage."""
+        if self._log_file is not None and self._unsynced:
+            self._log_file.flush()
+            os.fsync(self._log_file.fileno())
+        self._unsynced = 0
+        self._last_fsync = time.monotonic()
+
+    def close(self) -> None:
+        """Wait for pending saves, then flush and close the log file."""
+        self._stop_writer()
+        self.flush()
+        self._close_log()
+
+    def delete(self) -> None:
+        """Delete the snapshot and the log."""
+        self.wait_for_writes()
+        self._close_log()
+        for path in (self.snapshot_path, self.log_path):
+            if path.exists():
+                path.unlink()
+        self.persisted_count = 0
+        self._record_count = 0
+        self._snapshot_count = 0
+        self._metadata = None
+        self._progress = None
+
+    def _current_metadata(self, timeline: TimelineHistory) -> Dict[str, Any]:
+        """Get the timeline metadata, with the latest session progress if there is any."""
+        return self._with_progress(timeline_metadata(timeline))
+
+    def _with_progress(self, metadata: Dict[str, Any]) -> Dict[str, Any]:
+        """Add the latest session progress, if there is any, to a copy of the timeline metadata."""
+        metadata = dict(metadata)
+        if self._progress is not None:
+            metadata["progress"] = self._progress
+        return metadata
+
+    @staticmethod
+    def _event_dicts(events: List[Any]) -> List[Dict[str, Any]]:
+        """Serialize events, skipping types that are not saved."""
+        return [event_data for event_data in map(event_to_dict, events) if event_data is not None]
+
+    def _append(self, record: Dict[str, Any]) -> None:
+        """Append one record to the log (written through to the OS, fsynced in batches)."""
+        if self._log_file is None:
+            self._log_file = open(self.log_path, 'a', encoding='utf-8')
+        self._log_file.write(json.dumps(record, ensure_ascii=False) + "\n")
+        self._log_file.flush()
+        self._unsynced += 1
+
+    def _maybe_fsync(self) -> None:
+        """fsync the log once enough records or time have accumulated."""
+        if not self._unsynced:
+            return
+        if (self._unsynced >= self.fsync_every
+                or time.monotonic() - self._last_fsync >= self.fsync_interval):
+            self.flush()
+
+    def _close_log(self) -> None:
+        """Close the open log file handle, if any."""
+        if self._log_file is not None:
+            self._log_file.close()
+            self._log_file = None
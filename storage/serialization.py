@@ -0,0 +1,175 @@
+"""
+Conversion between timeline objects and the JSON records used on disk.
+"""
+
+from datetime import datetime
+from typing import Annotated, Any, Dict, Iterable, List, Optional, Union
+from pydantic import BaseModel, Discriminator, Tag, TypeAdapter
+
+import sys
+from pathlib import Path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from data_models import TimelineEvent, TimelineHistory, Message, Scene, Action, CharacterEntry, CharacterExit
+
+
+# Record "type" tag for each event class, in isinstance() priority order
+EVENT_TYPES = {
+    "message": Message,
+    "scene": Scene,
+    "action": Action,
+    "character_entry": CharacterEntry,
+    "character_exit": CharacterExit,
+}
+
+# Timeline-level fields stored alongside the events
+TIMELINE_FIELDS = (
+    "id", "title", "participants", "current_participants", "timeline_summary", "visible_to_user",
+    "summary", "character_summaries",
+)
+
+
+def event_type_of(event: TimelineEvent) -> Optional[str]:
+    """Get the record type tag for an event, or None if it is not persisted."""
+    for event_type, event_class in EVENT_TYPES.items():
+        if isinstance(event, event_class):
+            return event_type
+    return None
+
+
+def event_to_dict(event: TimelineEvent) -> Optional[Dict[str, Any]]:
+    """
+    Serialize a timeline event to a JSON-compatible dictionary.
+
+    Args:
+        event: The TimelineEvent to serialize
+
+    Returns:
+        Dictionary with a "type" tag and all event fields, or None for unknown event types
+    """
+    event_type = event_type_of(event)
+    if event_type is None:
+        return None
+
+    event_data = {"type": event_type}
+    event_data.update(event.model_dump(mode="json"))
+    return event_data
+
+
+def _record_type(event_data: Dict[str, Any]) -> Optional[str]:
+    """
+    Get the type tag of an event record.
+    Records written before events carried a "type" tag are recognised by their fields.
+    """
+    event_type = event_data.get("type")
+    if event_type is not None:
+        return event_type
+
+    if "character" in event_data and "dialouge" in event_data:
+        return "message"
+    elif "location" in event_data and "description" in event_data:
+        return "scene"
+    elif "character" in event_data and "description" in event_data:
+        return "action"
+    return None
+
+
+def event_from_dict(event_data: Dict[str, Any]) -> Optional[TimelineEvent]:
+    """
+    Rebuild a timeline event from its dictionary form, with full validation.
+
+    Args:
+        event_data: Dictionary produced by event_to_dict() (or the older chat format)
+
+    Returns:
+        The TimelineEvent, or None if the record type is unknown
+    """
+    event_class = EVENT_TYPES.get(_record_type(event_data))
+    if event_class is None:
+        return None
+
+    fields = {key: value for key, value in event_data.items() if key != "type"}
+    if "timestamp" not in fields:
+        fields["timestamp"] = datetime.now()
+    if event_class is Scene and "scene_type" not in fields:
+        fields["scene_type"] = "environmental"
+    return event_class(**fields)
+
+
+def events_from_dicts(records: Iterable[Dict[str, Any]]) -> List[TimelineEvent]:
+    """
+    Rebuild many timeline events at once for resuming a saved conversation.
+
+    All records are validated in a single call to a precompiled validator
+    for the tagged union of event types, instead of dispatching and
+    constructing each event from Python.
+
+    Args:
+        records: Event dictionaries in timeline order
+
+    Returns:
+        List of TimelineEvents; records of unknown type are skipped
+    """
+    tagged = []
+    for event_data in records:
+        if "type" not in event_data:
+            # Older chat format: tag the record (and fill defaults) before validation
+            event_data = dict(event_data, type=_record_type(event_data))
+            if event_data["type"] == "scene":
+                event_data.setdefault("scene_type", "environmental")
+            event_data.setdefault("timestamp", datetime.now())
+        if event_data["type"] in EVENT_TYPES:
+            tagged.append(event_data)
+
+    return _get_events_adapter().validate_python(tagged)
+
+
+_events_adapter: Optional[TypeAdapter] = None
+
+
+def _get_events_adapter() -> TypeAdapter:
+    """Get the validator for a list of tagged event records, building it on first use."""
+    global _events_adapter
+    if _events_adapter is None:
+        event_union = Union[tuple(
+            Annotated[event_class, Tag(event_type)]
+            for event_type, event_class in EVENT_TYPES.items()
+        )]
+        _events_adapter = TypeAdapter(
+            List[Annotated[event_union, Discriminator(lambda event_data: event_data["type"])]]
+        )
+    return _events_adapter
+
+
+def timeline_metadata(timeline: TimelineHistory) -> Dict[str, Any]:
+    """Get the timeline-level fields (everything except the events) as a dictionary."""
+    metadata = {}
+    for field in TIMELINE_FIELDS:
+        value = getattr(timeline, field)
+        # Copy lists and dump models so the result does not change along with the timeline
+        if isinstance(value, BaseModel):
+            value = value.model_dump(mode="json")
+        elif isinstance(value, dict):
+            value = {
+                key: item.model_dump(mode="json") if isinstance(item, BaseModel) else item
+                for key, item in value.items()
+            }
+        elif isinstance(value, list):
+            value = list(value)
+        metadata[field] = value
+    return metadata
+
+
+def apply_timeline_metadata(timeline: TimelineHistory, metadata: Dict[str, Any]) -> None:
+    """
+    Restore timeline-level fields saved by timeline_metadata(), validating them
+    (e.g. rebuilding rolling summaries from their dictionaries).
+
+    Args:
+        timeline: The timeline to update in place
+        metadata: Saved timeline metadata; unknown fields are ignored
+    """
+    fields = {field: value for field, value in metadata.items() if field in TIMELINE_FIELDS}
+    restored = TimelineHistory.model_validate(fields)
+    for field in fields:
+        setattr(timeline, field, getattr(restored, field))
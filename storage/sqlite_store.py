@@ -0,0 +1,331 @@
+"""
+SQLite persistence for conversations.
+
+All sessions of a story share one database file. Each session has a row in
+`sessions` (timeline metadata, progress, event count) and one row per event
+in `events`, keyed by (session, seq). Events are also indexed by
+(session, character, seq) and (session, type, seq), so a session can be
+resumed with a range query and recent events of one type or character can
+be read without loading the conversation.
+
+The database runs in WAL mode: each save is one transaction with a batched
+insert of the new events (run on the store's writer thread, see
+ConversationStore), readers never block the writer, and sessions of
+the same story can be saved concurrently (from several systems or
+processes) without touching each other's rows.
+"""
+
+import json
+import sqlite3
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+import sys
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from data_models import TimelineHistory
+from config import Config
+from storage.base import ConversationStore, SaveBatch
+from storage.serialization import event_to_dict, timeline_metadata
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS sessions (
+    session TEXT PRIMARY KEY,
+    story TEXT,
+    metadata TEXT NOT NULL,
+    progress TEXT,
+    event_count INTEGER NOT NULL,
+    updated_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS sessions_by_story ON sessions (story, updated_at);
+CREATE TABLE IF NOT EXISTS events (
+    session TEXT NOT NULL,
+    seq INTEGER NOT NULL,
+    type TEXT NOT NULL,
+    character TEXT,
+    data TEXT NOT NULL,
+    PRIMARY KEY (session, seq)
+);
+CREATE INDEX IF NOT EXISTS events_by_character ON events (session, character, seq);
+CREATE INDEX IF NOT EXISTS events_by_type ON events (session, type, seq);
+"""
+
+
+class SQLiteStore(ConversationStore):
+    """One conversation session stored as rows of a shared SQLite database."""
+
+    def __init__(
+        self,
+        db_path: Path,
+        session_id: str,
+        story: Optional[str] = None,
+        busy_timeout: Optional[float] = None
+    ):
+        """
+        Initialize the store.
+
+        Args:
+            db_path: Path of the database file (created on first use)
+            session_id: Session whose rows this store reads and writes
+            story: Story the session belongs to, recorded for list_sessions()
+            busy_timeout: Seconds to wait for another writer's lock (defaults to Config.SQLITE_BUSY_TIMEOUT)
+        """
+        self.db_path = Path(db_path)
+        self.session_id = session_id
+        self.story = story
+        self.busy_timeout = busy_timeout if busy_timeout is not None else Config.SQLITE_BUSY_TIMEOUT
+
+        # Number of timeline events already captured for saving, and of event rows in the database
+        self.persisted_count = 0
+        self._record_count = 0
+        self._metadata: Optional[Dict[str, Any]] = None
+        self._progress: Optional[Dict[str, Any]] = None
+        self._saved_progress: Optional[Dict[str, Any]] = None
+        self._connection: Optional[sqlite3.Connection] = None
+
+    @classmethod
+    def list_sessions(cls, db_path: Path, story: Optional[str] = None) -> List[Dict[str, Any]]:
+        """
+        List the sessions saved in a database, most recently updated first.
+
+        Args:
+            db_path: Path of the database file
+            story: Only list sessions of this story
+
+        Returns:
+            Dicts with keys: session, story, event_count, updated_at
+        """
+        if not Path(db_path).exists():
+            return []
+        connection = _connect(Path(db_path), Config.SQLITE_BUSY_TIMEOUT)
+        try:
+            query = "SELECT session, story, event_count, updated_at FROM sessions"
+            params: Tuple[Any, ...] = ()
+            if story is not None:
+                query += " WHERE story = ?"
+                params = (story,)
+            rows = connection.execute(query + " ORDER BY updated_at DESC", params).fetchall()
+        finally:
+            connection.close()
+        return [
+            {"session": session, "story": story_name, "event_count": count, "updated_at": updated_at}
+            for session, story_name, count, updated_at in rows
+        ]
+
+    def exists(self) -> bool:
+        """Check whether the session has been saved."""
+        row = self._db().execute(
+            "SELECT 1 FROM sessions WHERE session = ?", (self.session_id,)
+        ).fetchone()
+        return row is not None
+
+    def load(self) -> Tuple[Dict[str, Any], List[Dict[str, Any]]]:
+        """
+        Read the session's metadata and all of its events.
+
+        Returns:
+            Tuple of (timeline metadata, list of event dictionaries in timeline order)
+        """
+        metadata: Dict[str, Any] = {}
+        progress = None
+        row = self._db().execute(
+            "SELECT metadata, progress FROM sessions WHERE session = ?", (self.session_id,)
+        ).fetchone()
+        if row is not None:
+            metadata = json.loads(row[0])
+            progress = json.loads(row[1]) if row[1] is not None else None
+        events = self.load_events()
+
+        self.persisted_count = len(events)
+        self._record_count = len(events)
+        self._metadata = dict(metadata)
+        self._progress = progress
+        self._saved_progress = progress
+        if progress is not None:
+            metadata["progress"] = progress
+        return metadata, events
+
+    def load_events(self, start: int = 0, end: Optional[int] = None) -> List[Dict[str, Any]]:
+        """
+        Read a range of the session's events.
+
+        Args:
+            start: First sequence number
+            end: Sequence number after the last event, or None for all remaining events
+
+        Returns:
+            Event dictionaries in timeline order
+        """
+        query = "SELECT data FROM events WHERE session = ? AND seq >= ?"
+        params: Tuple[Any, ...] = (self.session_id, start)
+        if end is not None:
+            query += " AND seq < ?"
+            params += (end,)
+        rows = self._db().execute(query + " ORDER BY seq", params).fetchall()
+        return [json.loads(data) for data, in rows]
+
+    def recent_events(
+        self,
+        n: Optional[int] = 10,
+        event_type: Optional[str] = None,
+        character: Optional[str] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Get the n most recent saved events, answered from the indexes.
+
+        Args:
+            n: Number of events, or None for all of them
+            event_type: Optional record type filter (e.g. "message", "character_entry")
+            character: Optional character filter
+
+        Returns:
+            Event dictionaries in timeline order
+        """
+        if n is not None and n <= 0:
+            return []
+        self.wait_for_writes()
+        query = "SELECT data FROM events WHERE session = ?"
+        params: Tuple[Any, ...] = (self.session_id,)
+        if event_type is not None:
+            query += " AND type = ?"
+            params += (event_type,)
+        if character is not None:
+            query += " AND character = ?"
+            params += (character,)
+        query += " ORDER BY seq DESC"
+        if n is not None:
+            query += " LIMIT ?"
+            params += (n,)
+        rows = self._db().execute(query, params).fetchall()
+        return [json.loads(data) for data, in reversed(rows)]
+
+    def write(self, batch: SaveBatch) -> None:
+        """
+        Insert a captured batch's events and update the session row, in one transaction.
+
+        Args:
+            batch: Events and metadata taken by capture()
+        """
+        if batch.progress is not None:
+            self._progress = batch.progress
+
+        if batch.rewrite:
+            # The timeline was cleared or rewritten; replace the session's rows
+            self._replace_rows(batch.events, batch.metadata)
+            return
+
+        rows = self._event_rows(batch.events, self._record_count)
+        metadata = batch.metadata
+        if not rows and metadata == self._metadata and self._progress == self._saved_progress:
+            return
+
+        connection = self._db()
+        with connection:
+            connection.executemany(
+                "INSERT INTO events (session, seq, type, character, data) VALUES (?, ?, ?, ?, ?)", rows
+            )
+            self._write_session_row(connection, metadata, self._record_count + len(rows))
+
+        self._record_count += len(rows)
+        self._metadata = metadata
+        self._saved_progress = self._progress
+
+    def write_snapshot(self, timeline: TimelineHistory) -> None:
+        """
+        Replace all of the session's rows with the current timeline, in one transaction.
+
+        Args:
+            timeline: The timeline to save
+        """
+        self.wait_for_writes()
+        self._replace_rows(timeline.events, timeline_metadata(timeline))
+        self.persisted_count = len(timeline.events)
+
+    def _replace_rows(self, events: List[Any], metadata: Dict[str, Any]) -> None:
+        """Replace the session's event rows and session row, in one transaction."""
+        rows = self._event_rows(events, 0)
+
+        connection = self._db()
+        with connection:
+            connection.execute("DELETE FROM events WHERE session = ?", (self.session_id,))
+            connection.executemany(
+                "INSERT INTO events (session, seq, type, character, data) VALUES (?, ?, ?, ?, ?)", rows
+            )
+            self._write_session_row(connection, metadata, len(rows))
+
+        self._record_count = len(rows)
+        self._metadata = metadata
+        self._saved_progress = self._progress
+
+    def flush(self) -> None:
+        """Checkpoint the write-ahead log, syncing committed saves to the database file."""
+        if self._connection is not None:
+            self._connection.execute("PRAGMA wal_checkpoint(PASSIVE)")
+
+    def close(self) -> None:
+        """Wait for pending saves, then checkpoint and close the database connection."""
+        self._stop_writer()
+        if self._connection is not None:
+            self.flush()
+            self._connection.close()
+            self._connection = None
+
+    def delete(self) -> None:
+        """Delete the session's rows (other sessions are untouched)."""
+        self.wait_for_writes()
+        connection = self._db()
+        with connection:
+            connection.execute("DELETE FROM events WHERE session = ?", (self.session_id,))
+            connection.execute("DELETE FROM sessions WHERE session = ?", (self.session_id,))
+        self.persisted_count = 0
+        self._record_count = 0
+        self._metadata = None
+        self._progress = None
+        self._saved_progress = None
+
+    def _event_rows(self, events: List[Any], first_seq: int) -> List[Tuple[Any, ...]]:
+        """Build the rows of the given events, numbered from first_seq (unsaved event types are skipped)."""
+        rows = []
+        for event in events:
+            event_data = event_to_dict(event)
+            if event_data is None:
+                continue
+            rows.append((
+                self.session_id,
+                first_seq + len(rows),
+                event_data["type"],
+                event_data.get("character"),
+                json.dumps(event_data, ensure_ascii=False),
+            ))
+        return rows
+
+    def _write_session_row(self, connection: sqlite3.Connection, metadata: Dict[str, Any], event_count: int) -> None:
+        """Insert or update the session's row."""
+        progress = json.dumps(self._progress, ensure_ascii=False) if self._progress is not None else None
+        connection.execute(
+            "INSERT INTO sessions (session, story, metadata, progress, event_count, updated_at) "
+            "VALUES (?, ?, ?, ?, ?, ?) "
+            "ON CONFLICT (session) DO UPDATE SET story = excluded.story, metadata = excluded.metadata, "
+            "progress = excluded.progress, event_count = excluded.event_count, updated_at = excluded.updated_at",
+            (self.session_id, self.story, json.dumps(metadata, ensure_ascii=False), progress,
+             event_count, time.time())
+        )
+
+    def _db(self) -> sqlite3.Connection:
+        """Get the database connection, opening it (and creating the schema) on first use."""
+        if self._connection is None:
+            self.db_path.parent.mkdir(parents=True, exist_ok=True)
+            self._connection = _connect(self.db_path, self.busy_timeout)
+        return self._connection
+
+
+def _connect(db_path: Path, busy_timeout: float) -> sqlite3.Connection:
+    """Open a database in WAL mode and make sure the schema exists."""
+    # Saves run on the writer thread; loads and reads come from the caller's thread
+    connection = sqlite3.connect(db_path, timeout=busy_timeout, check_same_thread=False)
+    connection.execute("PRAGMA journal_mode=WAL")
+    # In WAL mode, NORMAL only syncs at checkpoints; a crash can lose the last saves but never corrupts
+    connection.execute("PRAGMA synchronous=NORMAL")
+    connection.executescript(_SCHEMA)
+    return connection
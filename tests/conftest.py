@@ -0,0 +1,7 @@
+"""
+Shared test setup: make the project modules importable.
+"""
+
+import sys
+from pathlib import Path
+sys.path.insert(0, str(Path(__file__).parent.parent))
@@ -0,0 +1,49 @@
+"""
+Tests that calls under a shared deadline neither wait nor retry past it.
+"""
+
+import asyncio
+import time
+
+import pytest
+
+from config import Config
+from helpers.fake_llm import FakeLLMClient, reset_fake_client
+from openrouter_client import ResponseTimeoutError, call_deadline, get_model
+
+
+@pytest.fixture
+def slow_backend(monkeypatch):
+    monkeypatch.setattr(Config, "LLM_BACKEND", "fake")
+    monkeypatch.setattr(Config, "LLM_CACHE_MODE", "off")
+    monkeypatch.setattr(Config, "HEDGE_REQUESTS", False)
+    monkeypatch.setattr(Config, "RESPONSE_TIMEOUT", 1.0)
+    monkeypatch.setattr(Config, "MAX_RETRIES", 4)
+    monkeypatch.setattr(Config, "RETRY_BASE_DELAY", 0.01)
+    reset_fake_client(FakeLLMClient(latency=lambda kind: 5.0))
+    yield
+    reset_fake_client()
+
+
+def test_call_stops_at_the_deadline(slow_backend):
+    async def call():
+        loop = asyncio.get_running_loop()
+        with call_deadline(loop.time() + 0.3):
+            await get_model().generate_content_async("Hello")
+
+    started = time.monotonic()
+    with pytest.raises(ResponseTimeoutError):
+        asyncio.run(call())
+    # Without the deadline: five attempts of RESPONSE_TIMEOUT each
+    assert time.monotonic() - started < 0.8
+
+
+def test_deadline_is_per_block(slow_backend):
+    async def call():
+        loop = asyncio.get_running_loop()
+        with call_deadline(loop.time() - 1):
+            pass
+        with pytest.raises(ResponseTimeoutError):
+            await get_model().generate_content_async("Hello", timeout=0.1)
+
+    asyncio.run(call())
@@ -0,0 +1,111 @@
+"""
+Tests for the snapshot + JSONL log conversation store.
+"""
+
+import json
+import os
+
+import pytest
+
+from config import Config
+from data_models import Message
+from storage import EventLogStore, events_from_dicts
+
+
+@pytest.fixture
+def timeline_manager(monkeypatch):
+    monkeypatch.setattr(Config, "LLM_BACKEND", "fake")
+    from managers.timelineManager import TimelineManager
+    return TimelineManager()
+
+
+def _timeline(timeline_manager, count):
+    timeline = timeline_manager.create_timeline_history(title="Test", participants=["Jack"])
+    for i in range(count):
+        _say(timeline_manager, timeline, i)
+    return timeline
+
+
+def _say(timeline_manager, timeline, i):
+    timeline_manager.add_event(timeline, Message(character="Jack", dialouge=f"line {i}", action_description="speaks"))
+
+
+def _lines(events):
+    return [event["dialouge"] for event in events]
+
+
+def test_torn_last_line_is_skipped(tmp_path, timeline_manager):
+    timeline = _timeline(timeline_manager, 3)
+    store = EventLogStore(tmp_path / "chat.json", snapshot_every=100)
+    store.sync(timeline)
+    store.close()
+
+    # A crash in the middle of appending the next record
+    with open(store.log_path, "ab") as f:
+        f.write(b'{"seq": 3, "event": {"type": "message", "charac')
+    resumed = EventLogStore(tmp_path / "chat.json", snapshot_every=100)
+    _, events = resumed.load()
+    assert _lines(events) == ["line 0", "line 1", "line 2"]
+
+    # The torn bytes are cut off, so records appended after the resume can be read back
+    _say(timeline_manager, timeline, 3)
+    resumed.sync(timeline)
+    resumed.close()
+    _, events = EventLogStore(tmp_path / "chat.json").load()
+    assert _lines(events) == ["line 0", "line 1", "line 2", "line 3"]
+
+
+def test_compaction_leaves_a_snapshot_and_an_empty_log(tmp_path, timeline_manager):
+    timeline = _timeline(timeline_manager, 0)
+    store = EventLogStore(tmp_path / "chat.json", snapshot_every=5)
+    for i in range(7):
+        _say(timeline_manager, timeline, i)
+        store.sync(timeline, {"objective_index": i})
+    store.close()
+
+    with open(store.snapshot_path, encoding="utf-8") as f:
+        snapshot = json.load(f)
+    assert snapshot["event_count"] == 5
+    assert _lines(snapshot["events"]) == [f"line {i}" for i in range(5)]
+    # Two events logged since the compaction
+    assert sum(1 for line in open(store.log_path, encoding="utf-8") if '"event"' in line) == 2
+
+    metadata, events = EventLogStore(tmp_path / "chat.json").load()
+    assert _lines(events) == [f"line {i}" for i in range(7)]
+    assert metadata["progress"] == {"objective_index": 6}
+    assert [event.timeline_id for event in events_from_dicts(events)] == [event.timeline_id for event in timeline.events]
+
+
+def test_compaction_at_the_boundary_empties_the_log(tmp_path, timeline_manager):
+    timeline = _timeline(timeline_manager, 5)
+    store = EventLogStore(tmp_path / "chat.json", snapshot_every=5)
+    store.sync(timeline)
+    store.close()
+
+    assert os.path.getsize(store.log_path) == 0
+    _, events = EventLogStore(tmp_path / "chat.json").load()
+    assert _lines(events) == [f"line {i}" for i in range(5)]
+
+
+def test_crash_before_the_log_is_emptied_does_not_duplicate_events(tmp_path, timeline_manager):
+    timeline = _timeline(timeline_manager, 4)
+    store = EventLogStore(tmp_path / "chat.json", snapshot_every=100)
+    store.sync(timeline)
+    store.close()
+    log_before = store.log_path.read_bytes()
+
+    # Compact, then put the old log back as if the process died before emptying it
+    store.write_snapshot(timeline)
+    store.close()
+    store.log_path.write_bytes(log_before)
+
+    resumed = EventLogStore(tmp_path / "chat.json", snapshot_every=100)
+    _, events = resumed.load()
+    assert _lines(events) == [f"line {i}" for i in range(4)]
+
+    # Saving goes on after the snapshot's events, not after the stale log
+    _say(timeline_manager, timeline, 4)
+    resumed.sync(timeline)
+    resumed.close()
+    _, events = EventLogStore(tmp_path / "chat.json").load()
+    assert _lines(events) == [f"line {i}" for i in range(5)]
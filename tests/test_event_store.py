@@ -0,0 +1,81 @@
+"""
+Tests for the compact timeline event store.
+"""
+
+import threading
+
+from data_models import Action, Message, Scene, TimelineHistory
+from helpers.event_store import EventStore
+
+
+def test_events_round_trip():
+    store = EventStore()
+    message = Message(character="Harry", dialouge="Hello", action_description="waves")
+    store.append(message)
+    store.append(Scene(scene_type="transition", location="Hall", description="Doors open"))
+
+    assert store[0] is message
+    rebuilt = EventStore([message])
+    del message
+    event = rebuilt[0]
+    assert isinstance(event, Message)
+    assert (event.character, event.dialouge, event.action_description) == ("Harry", "Hello", "waves")
+    assert store[-1].location == "Hall"
+    assert len(store[:]) == 2
+
+
+def test_concurrent_appends_keep_columns_and_indexes_consistent():
+    timeline = TimelineHistory()
+    writers = 4
+    per_writer = 500
+    errors = []
+    start = threading.Barrier(writers + 1)
+
+    def write(name):
+        start.wait()
+        for i in range(per_writer):
+            if i % 10 == 0:
+                timeline.events.append(Scene(scene_type="environmental", location=name, description=str(i)))
+            else:
+                timeline.events.append(Action(character=name, description=str(i)))
+            timeline.sync_indexes()
+
+    def read():
+        start.wait()
+        while any(thread.is_alive() for thread in threads):
+            try:
+                # Every visible row must be complete, and index lookups must not fail
+                for event in timeline.events[-20:]:
+                    assert event.description is not None
+                timeline.get_events_of_type(Scene, 5)
+                timeline.get_current_location()
+            except Exception as e:
+                errors.append(e)
+                return
+
+    threads = [threading.Thread(target=write, args=(f"writer{n}",)) for n in range(writers)]
+    reader = threading.Thread(target=read)
+    for thread in threads:
+        thread.start()
+    reader.start()
+    for thread in threads:
+        thread.join()
+    reader.join()
+
+    assert not errors
+    store = timeline.events
+    total = writers * per_writer
+    assert len(store) == total
+    assert len(store._times) == total
+    assert len(store._ids) == total * 16
+    assert len(store._symbols) == total * 2
+    assert len(store._texts) == total * 2
+
+    timeline.sync_indexes()
+    assert sum(len(positions) for positions in timeline._type_positions.values()) == total
+    for n in range(writers):
+        name = f"writer{n}"
+        events = timeline.get_events_by_character(name)
+        assert len(events) == per_writer - per_writer // 10
+        assert all(event.character == name for event in events)
+    assert len(timeline.get_events_of_type(Scene)) == writers * (per_writer // 10)
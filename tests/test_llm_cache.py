@@ -0,0 +1,82 @@
+"""
+Tests for the LLM response cache and its record/replay modes.
+"""
+
+import pytest
+
+from helpers.llm_cache import (
+    CacheMissError, MemoryCacheBackend, ResponseCache, SQLiteCacheBackend, request_key
+)
+
+PARAMS = {
+    "model": "test/model",
+    "messages": [{"role": "system", "content": "You are Jack."}, {"role": "user", "content": "Ahoy"}],
+    "temperature": 0.7,
+    "max_tokens": 200,
+}
+
+
+def test_request_key_ignores_field_order_and_transport_options():
+    reordered = {key: PARAMS[key] for key in reversed(list(PARAMS))}
+
+    assert request_key(reordered) == request_key(PARAMS)
+    assert request_key({**PARAMS, "stream": True, "timeout": 5}) == request_key(PARAMS)
+
+
+@pytest.mark.parametrize("change", [
+    {"model": "test/other"},
+    {"temperature": 0.2},
+    {"messages": [{"role": "user", "content": "Ahoy!"}]},
+])
+def test_request_key_changes_with_the_completion_inputs(change):
+    assert request_key({**PARAMS, **change}) != request_key(PARAMS)
+
+
+def test_cache_mode_answers_repeated_requests():
+    cache = ResponseCache(MemoryCacheBackend(), "cache")
+
+    slot, text = cache.lookup(PARAMS)
+    assert text is None
+    cache.store(slot, PARAMS["model"], "Ahoy yourself")
+
+    assert cache.lookup(dict(PARAMS)) == (slot, "Ahoy yourself")
+    assert (cache.hits, cache.misses) == (1, 1)
+
+
+def test_replay_returns_each_recorded_occurrence(tmp_path):
+    path = tmp_path / "cache.sqlite3"
+    recorder = ResponseCache(SQLiteCacheBackend(str(path)), "record")
+    for answer in ("first", "second"):
+        slot, text = recorder.lookup(PARAMS)
+        assert text is None
+        recorder.store(slot, PARAMS["model"], answer)
+    recorder.backend.close()
+
+    replay = ResponseCache(SQLiteCacheBackend(str(path)), "replay")
+    answers = [replay.lookup(PARAMS)[1] for _ in range(3)]
+    replay.store("ignored#0", PARAMS["model"], "not stored")
+
+    # Occurrences past the recording get the latest recorded answer
+    assert answers == ["first", "second", "second"]
+    assert len(replay.backend) == 2
+    replay.backend.close()
+
+
+def test_replay_miss_raises():
+    cache = ResponseCache(MemoryCacheBackend(), "replay")
+
+    with pytest.raises(CacheMissError):
+        cache.lookup(PARAMS)
+    assert cache.misses == 1
+
+
+def test_recordings_survive_eviction():
+    backend = MemoryCacheBackend(max_entries=1)
+    recorder = ResponseCache(backend, "record")
+    slot, _ = recorder.lookup(PARAMS)
+    recorder.store(slot, PARAMS["model"], "kept")
+    for i in range(3):
+        backend.put(f"other-{i}", PARAMS["model"], "cached")
+
+    assert ResponseCache(backend, "replay").lookup(PARAMS)[1] == "kept"
+    assert len(backend) == 2
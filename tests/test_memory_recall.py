@@ -0,0 +1,46 @@
+"""
+Tests that memories are embedded when recalled, not when remembered.
+"""
+
+import pytest
+
+from config import Config
+from data_models import CharacterPersona, Message
+
+
+@pytest.fixture
+def character_manager(monkeypatch):
+    monkeypatch.setattr(Config, "LLM_BACKEND", "fake")
+    monkeypatch.setattr(Config, "MEMORY_RETRIEVAL", True)
+    monkeypatch.setattr(Config, "ROLLING_SUMMARIES", False)
+    from managers.characterManager import CharacterManager
+    return CharacterManager()
+
+
+def _remember(manager, character, dialogue):
+    manager.update_character_memory(
+        character, Message(character="Henry", dialouge=dialogue, action_description="speaks")
+    )
+
+
+def test_remembering_does_not_embed(character_manager):
+    character = character_manager.create_character(
+        CharacterPersona(name="Jack", traits=["bold"], speaking_style="brash", background="pirate")
+    )
+    _remember(character_manager, character, "The treasure map is hidden in the lighthouse")
+    for i in range(30):
+        _remember(character_manager, character, f"The sea is calm today, round {i}")
+
+    assert character_manager._memory_indexes == {}
+
+    _remember(character_manager, character, "Where is the treasure map hidden?")
+    recalled = character_manager.retrieve_relevant_memories(character, last_n_messages=10)
+
+    # Caught up on everything older than the window, and nothing newer
+    assert len(character_manager.get_memory_index(character, end=0)) == len(character.memory.event) - 10
+    assert "lighthouse" in recalled[0].dialouge
+
+    for i in range(5):
+        _remember(character_manager, character, f"The wind picks up, round {i}")
+    character_manager.retrieve_relevant_memories(character, last_n_messages=10)
+    assert len(character_manager.get_memory_index(character, end=0)) == len(character.memory.event) - 10
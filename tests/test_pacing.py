@@ -0,0 +1,50 @@
+"""
+Tests for the paced console.
+"""
+
+import io
+import sys
+
+from helpers.pacing import (
+    SCENE, STALL, PacedOutput, get_pacing_policy, install_paced_console, uninstall_paced_console
+)
+
+
+class _BrokenStream(io.StringIO):
+    def write(self, text):
+        if "boom" in text:
+            raise OSError("console gone")
+        return super().write(text)
+
+
+def test_uninstall_restores_stdout(monkeypatch):
+    real = io.StringIO()
+    monkeypatch.setattr(sys, "stdout", real)
+
+    console = install_paced_console()
+    assert sys.stdout is console
+    print("hello")
+    uninstall_paced_console()
+
+    assert sys.stdout is real
+    assert real.getvalue() == "hello\n"
+    assert console.closed
+    assert not console._writer.is_alive()
+
+
+def test_write_errors_reach_stderr(capfd):
+    stream = _BrokenStream()
+    console = PacedOutput(stream)
+    console.write("boom\n")
+    console.write("after\n")
+    console.close()
+
+    assert stream.getvalue() == "after\n"
+    assert "OSError: console gone" in capfd.readouterr().err
+
+
+def test_stall_scenes_pause_longer_than_scenes():
+    pacing = get_pacing_policy("fixed")
+
+    assert pacing.delays(SCENE) == (0.0, 1.0)
+    assert pacing.delays(STALL) == (0.0, 2.0)
@@ -0,0 +1,111 @@
+"""
+Tests for the shared client-side rate limiter.
+"""
+
+import asyncio
+import time
+
+import pytest
+
+import openrouter_client
+from config import Config
+from helpers.fake_llm import FakeLLMClient, reset_fake_client
+from helpers.rate_limiter import PRIORITY_BACKGROUND, PRIORITY_INTERACTIVE, RateLimiter
+from openrouter_client import ResponseTimeoutError, get_model, get_rate_limiter
+
+
+def test_release_returns_tokens():
+    limiter = RateLimiter(requests_per_minute=0, tokens_per_minute=600, token_burst=100)
+
+    async def run():
+        await limiter.acquire(80)
+        limiter.release(80)
+
+    asyncio.run(run())
+    assert limiter.stats()["tokens_available"] == pytest.approx(100, abs=1)
+
+
+def test_queued_requests_are_woken_in_priority_order():
+    # One request per 0.2s: the waiters can only be served by being woken in turn
+    limiter = RateLimiter(requests_per_minute=300, tokens_per_minute=0, request_burst=1)
+    served = []
+
+    async def request(name, priority):
+        await limiter.acquire(priority=priority)
+        served.append(name)
+
+    async def run():
+        await limiter.acquire()
+        await asyncio.gather(
+            request("background", PRIORITY_BACKGROUND),
+            request("interactive", PRIORITY_INTERACTIVE),
+        )
+
+    started = time.monotonic()
+    asyncio.run(run())
+    assert served == ["interactive", "background"]
+    assert time.monotonic() - started < 1.0
+    assert limiter.stats()["queue_depth"] == 0
+
+
+def test_failed_requests_release_their_tokens(monkeypatch):
+    monkeypatch.setattr(Config, "LLM_BACKEND", "fake")
+    monkeypatch.setattr(Config, "LLM_CACHE_MODE", "off")
+    monkeypatch.setattr(Config, "HEDGE_REQUESTS", False)
+    monkeypatch.setattr(Config, "MAX_RETRIES", 2)
+    monkeypatch.setattr(Config, "RETRY_BASE_DELAY", 0.01)
+    monkeypatch.setattr(Config, "RATE_LIMIT_TOKENS_PER_MINUTE", 1)
+    monkeypatch.setattr(openrouter_client, "_limiters", {})
+    reset_fake_client(FakeLLMClient(latency=lambda kind: 5.0))
+    try:
+        limiter = get_rate_limiter()
+        # Refills too slowly to hide a leak
+        limiter._token_level = limiter.token_burst = 1e6
+        with pytest.raises(ResponseTimeoutError):
+            asyncio.run(get_model().generate_content_async("Hello", timeout=0.05))
+    finally:
+        reset_fake_client()
+
+    stats = limiter.stats()
+    assert stats["retries"] == 2
+    assert stats["tokens_available"] == pytest.approx(1e6)
+
+
+@pytest.fixture
+def streaming_limiter(monkeypatch):
+    monkeypatch.setattr(Config, "LLM_BACKEND", "fake")
+    monkeypatch.setattr(Config, "LLM_CACHE_MODE", "off")
+    monkeypatch.setattr(Config, "HEDGE_REQUESTS", False)
+    monkeypatch.setattr(Config, "RATE_LIMIT_TOKENS_PER_MINUTE", 1)
+    monkeypatch.setattr(openrouter_client, "_limiters", {})
+    fake = FakeLLMClient()
+    reset_fake_client(fake)
+    limiter = get_rate_limiter()
+    limiter._token_level = limiter.token_burst = 1e6
+    yield limiter, fake
+    reset_fake_client()
+
+
+def test_finished_streams_settle_their_tokens(streaming_limiter):
+    limiter, fake = streaming_limiter
+
+    async def read_all():
+        return [part async for part in get_model().stream_content_async("Hello", max_tokens=500)]
+
+    asyncio.run(read_all())
+    used = fake.prompt_tokens + fake.completion_tokens
+    assert limiter.stats()["tokens_available"] == pytest.approx(1e6 - used)
+
+
+def test_closed_streams_settle_their_tokens(streaming_limiter):
+    limiter, fake = streaming_limiter
+
+    async def read_first():
+        stream = get_model().stream_content_async("Hello", max_tokens=500)
+        first = await stream.__anext__()
+        await stream.aclose()
+        return first
+
+    first = asyncio.run(read_first())
+    # Only what was received counts, not the whole max_tokens reservation
+    assert 1e6 - limiter.stats()["tokens_available"] < fake.prompt_tokens + len(first) + 10
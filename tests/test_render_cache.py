@@ -0,0 +1,30 @@
+"""
+Tests for the memoized event rendering.
+"""
+
+from types import SimpleNamespace
+
+from helpers.render_cache import RenderCache
+
+
+def _event(event_id, text):
+    return SimpleNamespace(timeline_id=event_id, text=text)
+
+
+def test_windows_are_bounded():
+    cache = RenderCache(lambda event, perspective: event.text, max_windows=3)
+    events = [_event("a", "A"), _event("b", "B")]
+    for session in range(10):
+        assert cache.window(("timeline", session), events) == "A\nB"
+    assert len(cache._windows) == 3
+    assert list(cache._windows) == [("timeline", 7), ("timeline", 8), ("timeline", 9)]
+
+
+def test_recently_used_windows_are_kept():
+    cache = RenderCache(lambda event, perspective: event.text, max_windows=2)
+    events = [_event("a", "A")]
+    cache.window("first", events)
+    cache.window("second", events)
+    cache.window("first", events)
+    cache.window("third", events)
+    assert set(cache._windows) == {"first", "third"}
@@ -0,0 +1,55 @@
+"""
+Tests for parsing and repairing JSON answers.
+"""
+
+import json
+
+import pytest
+
+from helpers.response_parser import extract_json_object, parse_json_response
+
+
+@pytest.mark.parametrize("text", [
+    '{"type": "speak", "priority": 0.7}',
+    '```json\n{"type": "speak", "priority": 0.7}\n```',
+    '```\n{"type": "speak", "priority": 0.7}\n```',
+    'Here is my decision:\n{"type": "speak", "priority": 0.7}\nLet me know if you need more.',
+    '```json\n{"type": "speak", "priority": 0.7}\n```\nThe character speaks because...',
+    '{"type": "speak", "priority": 0.7,}',
+])
+def test_wrapped_and_sloppy_objects_parse(text):
+    assert parse_json_response(text) == {"type": "speak", "priority": 0.7}
+
+
+def test_truncated_object_is_closed():
+    data = parse_json_response('{"type": "speak", "tags": ["bold", "loud"], "dialogue": "We sail at da')
+
+    assert data == {"type": "speak", "tags": ["bold", "loud"], "dialogue": "We sail at da"}
+
+
+@pytest.mark.parametrize("text", [
+    '{"type": "speak", "priority": 0.7, "dialogue"',
+    '{"type": "speak", "priority": 0.7, "dialogue":',
+    '{"type": "speak", "priority": 0.7,',
+])
+def test_truncated_dangling_key_is_dropped(text):
+    assert parse_json_response(text) == {"type": "speak", "priority": 0.7}
+
+
+def test_braces_inside_strings_do_not_end_the_object():
+    text = 'Sure! {"dialogue": "Look: } and { here", "action": "points"} Extra {"x": 1}'
+
+    assert extract_json_object(text) == '{"dialogue": "Look: } and { here", "action": "points"}'
+    assert parse_json_response(text) == {"dialogue": "Look: } and { here", "action": "points"}
+
+
+def test_defaults_fill_missing_and_null_keys():
+    data = parse_json_response('{"type": "act", "action": null}', defaults={"action": "waits", "priority": 0.0})
+
+    assert data == {"type": "act", "action": "waits", "priority": 0.0}
+
+
+@pytest.mark.parametrize("text", ["I would rather not answer.", "[1, 2, 3]", ""])
+def test_answers_without_an_object_raise(text):
+    with pytest.raises(json.JSONDecodeError):
+        parse_json_response(text)
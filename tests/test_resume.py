@@ -0,0 +1,64 @@
+"""
+Tests for resuming and resetting a saved RoleplaySystem session.
+"""
+
+import pytest
+
+from config import Config
+from data_models import CharacterPersona
+
+
+@pytest.fixture
+def open_system(tmp_path, monkeypatch):
+    monkeypatch.setattr(Config, "LLM_BACKEND", "fake")
+    monkeypatch.setattr(Config, "STORAGE_BACKEND", "eventlog")
+    from roleplay_system import RoleplaySystem
+
+    systems = []
+
+    def open_system():
+        system = RoleplaySystem(
+            "Anne",
+            [CharacterPersona(name="Jack", traits=["bold"], speaking_style="brash", background="pirate")],
+            chat_storage_dir=str(tmp_path),
+            story_name="test"
+        )
+        systems.append(system)
+        return system
+
+    yield open_system
+    for system in systems:
+        system.store.close()
+
+
+def test_resume_restores_the_judge_position(open_system):
+    system = open_system()
+    for i in range(4):
+        system._add_player_message(f"line {i}")
+    manager = system.turn_manager
+    manager._judge_position = 3
+    manager._judge_cycles = 1
+    system._save_conversation()
+    system.store.close()
+
+    resumed = open_system().turn_manager
+
+    assert len(resumed.timeline.events) == 5
+    assert resumed._judge_position == 3
+    assert resumed._judge_cycles == 1
+
+
+def test_reset_restarts_the_judge(open_system):
+    system = open_system()
+    for i in range(4):
+        system._add_player_message(f"line {i}")
+    manager = system.turn_manager
+    manager._judge_cycles = 1
+    manager._judge_requested = True
+
+    system.reset_conversation()
+
+    assert manager.timeline.events == []
+    assert manager._judge_position == 0
+    assert manager._judge_cycles == 0
+    assert not manager._judge_requested
@@ -0,0 +1,123 @@
+"""
+Tests for the SQLite conversation store.
+"""
+
+import sqlite3
+import threading
+
+import pytest
+
+from config import Config
+from data_models import Message
+from storage import SQLiteStore, events_from_dicts
+
+
+@pytest.fixture
+def timeline_manager(monkeypatch):
+    monkeypatch.setattr(Config, "LLM_BACKEND", "fake")
+    from managers.timelineManager import TimelineManager
+    return TimelineManager()
+
+
+def _say(timeline_manager, timeline, character, line):
+    timeline_manager.add_event(timeline, Message(character=character, dialouge=line, action_description="speaks"))
+
+
+def _rows(db_path, session):
+    connection = sqlite3.connect(db_path)
+    try:
+        return connection.execute(
+            "SELECT seq, character FROM events WHERE session = ? ORDER BY seq", (session,)
+        ).fetchall()
+    finally:
+        connection.close()
+
+
+def test_round_trip(tmp_path, timeline_manager):
+    timeline = timeline_manager.create_timeline_history(title="Test", participants=["Jack", "Anne"])
+    for i in range(5):
+        _say(timeline_manager, timeline, "Jack" if i % 2 else "Anne", f"line {i}")
+    store = SQLiteStore(tmp_path / "story.db", "a", story="pirates")
+    store.sync(timeline, {"objective_index": 2})
+    store.close()
+
+    resumed = SQLiteStore(tmp_path / "story.db", "a")
+    metadata, events = resumed.load()
+    resumed.close()
+
+    assert metadata["title"] == "Test"
+    assert metadata["progress"] == {"objective_index": 2}
+    assert [event.dialouge for event in events_from_dicts(events)] == [f"line {i}" for i in range(5)]
+    assert [event.timeline_id for event in events_from_dicts(events)] == [event.timeline_id for event in timeline.events]
+
+
+def test_incremental_sync_inserts_only_new_events(tmp_path, timeline_manager):
+    timeline = timeline_manager.create_timeline_history(title="Test", participants=["Jack"])
+    store = SQLiteStore(tmp_path / "story.db", "a")
+    _say(timeline_manager, timeline, "Jack", "first")
+    store.sync(timeline)
+    _say(timeline_manager, timeline, "Jack", "second")
+    _say(timeline_manager, timeline, "Jack", "third")
+    store.sync(timeline)
+    store.sync(timeline)
+
+    assert _rows(tmp_path / "story.db", "a") == [(0, "Jack"), (1, "Jack"), (2, "Jack")]
+    assert [record["dialouge"] for record in store.recent_events(2, "message", "Jack")] == ["second", "third"]
+    store.close()
+
+
+def test_saves_are_written_on_the_writer_thread(tmp_path, timeline_manager):
+    timeline = timeline_manager.create_timeline_history(title="Test", participants=["Jack"])
+    store = SQLiteStore(tmp_path / "story.db", "a")
+    writers = []
+    write = store.write
+    store.write = lambda batch: (writers.append(threading.current_thread()), write(batch))
+
+    _say(timeline_manager, timeline, "Jack", "hello")
+    store.sync_in_background(timeline).result()
+    store.close()
+
+    assert writers and writers[0] is not threading.current_thread()
+    assert len(_rows(tmp_path / "story.db", "a")) == 1
+
+
+def test_resume_continues_the_session(tmp_path, timeline_manager):
+    timeline = timeline_manager.create_timeline_history(title="Test", participants=["Jack"])
+    for i in range(3):
+        _say(timeline_manager, timeline, "Jack", f"line {i}")
+    store = SQLiteStore(tmp_path / "story.db", "a", story="pirates")
+    store.sync(timeline)
+    store.close()
+    other = SQLiteStore(tmp_path / "story.db", "b", story="pirates")
+    other.sync(timeline)
+    other.close()
+
+    # Resume: rebuild the timeline from the rows, then keep saving
+    resumed = SQLiteStore(tmp_path / "story.db", "a", story="pirates")
+    _, events = resumed.load()
+    restored = timeline_manager.create_timeline_history(title="Test", participants=["Jack"])
+    restored.events.extend(events_from_dicts(events))
+    _say(timeline_manager, restored, "Jack", "after resume")
+    resumed.sync(restored)
+    resumed.close()
+
+    assert [seq for seq, _ in _rows(tmp_path / "story.db", "a")] == [0, 1, 2, 3]
+    assert len(_rows(tmp_path / "story.db", "b")) == 3
+    sessions = SQLiteStore.list_sessions(tmp_path / "story.db", "pirates")
+    assert {session["session"]: session["event_count"] for session in sessions} == {"a": 4, "b": 3}
+
+
+def test_cleared_timeline_replaces_the_rows(tmp_path, timeline_manager):
+    timeline = timeline_manager.create_timeline_history(title="Test", participants=["Jack"])
+    for i in range(3):
+        _say(timeline_manager, timeline, "Jack", f"line {i}")
+    store = SQLiteStore(tmp_path / "story.db", "a")
+    store.sync(timeline)
+
+    timeline.events.clear()
+    _say(timeline_manager, timeline, "Jack", "fresh start")
+    store.sync(timeline)
+    _, events = store.load()
+    store.close()
+
+    assert [record["dialouge"] for record in events] == ["fresh start"]
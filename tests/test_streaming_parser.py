@@ -0,0 +1,95 @@
+"""
+Tests for the streaming JSON parser and the decision streams built on it.
+"""
+
+import asyncio
+
+import pytest
+
+from helpers.decision_stream import DecisionStream
+from helpers.response_parser import StreamingJsonParser
+
+DECISION = (
+    '```json\n{"type": "speak", "priority": 0.8, "reasoning": "He knows \\"the\\" map",'
+    ' "dialogue": "Line one\\nline two \\u00e9", "tags": {"mood": ["grim", "}"]}, "action": null}\n```'
+)
+
+
+def _feed_in_chunks(text, size):
+    parser = StreamingJsonParser()
+    fragments = []
+    for start in range(0, len(text), size):
+        fragments.extend(parser.feed(text[start:start + size]))
+    return parser, fragments
+
+
+@pytest.mark.parametrize("size", [1, 2, 3, 7, len(DECISION)])
+def test_chunk_boundaries_do_not_change_the_result(size):
+    parser, fragments = _feed_in_chunks(DECISION, size)
+
+    assert parser.complete
+    assert parser.values == {
+        "type": "speak",
+        "priority": 0.8,
+        "reasoning": 'He knows "the" map',
+        "dialogue": "Line one\nline two é",
+        "tags": {"mood": ["grim", "}"]},
+        "action": None,
+    }
+    dialogue = "".join(fragment for key, fragment in fragments if key == "dialogue")
+    assert dialogue == "Line one\nline two é"
+
+
+def test_string_fragments_arrive_before_the_object_closes():
+    parser = StreamingJsonParser()
+
+    assert parser.feed('{"dialogue": "Ahoy') == [("dialogue", "Ahoy")]
+    assert parser.feed(' there\\') == [("dialogue", " there")]
+    assert parser.feed('u0021') == [("dialogue", "!")]
+    assert "dialogue" not in parser.values
+
+    parser.feed('"}')
+    assert parser.values == {"dialogue": "Ahoy there!"}
+    assert parser.complete
+
+
+def test_truncated_stream_keeps_the_finished_fields():
+    parser, _ = _feed_in_chunks('{"type": "speak", "priority": 0.5, "dialogue": "Cut o', 4)
+
+    assert not parser.complete
+    assert parser.values == {"type": "speak", "priority": 0.5}
+
+
+def test_text_after_the_object_is_ignored():
+    parser, _ = _feed_in_chunks('{"type": "silent"} I hope that helps! {"type": "speak"}', 5)
+
+    assert parser.values == {"type": "silent"}
+
+
+async def _chunks(text, size):
+    for start in range(0, len(text), size):
+        await asyncio.sleep(0)
+        yield text[start:start + size]
+
+
+def test_decision_stream_splits_header_and_dialogue():
+    async def run():
+        stream = DecisionStream("Jack").start(_chunks(DECISION, 3))
+        header = await stream.header()
+        fragments = [fragment async for _, fragment in stream.fragments()]
+        return header, fragments, await stream.result()
+
+    header, fragments, result = asyncio.run(run())
+
+    assert header == ("speak", 0.8, 'He knows "the" map')
+    assert "".join(fragments) == "Line one\nline two é"
+    assert result == ("speak", 0.8, 'He knows "the" map', "Line one\nline two é", None)
+
+
+def test_decision_stream_without_a_header_raises():
+    async def run():
+        stream = DecisionStream("Jack").start(_chunks('Sorry, I cannot {"priority": 0.', 4))
+        await stream.header()
+
+    with pytest.raises(ValueError, match="No decision could be parsed for Jack"):
+        asyncio.run(run())
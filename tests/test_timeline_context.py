@@ -0,0 +1,73 @@
+"""
+Tests that prompts see every event, either summarized or in the recent window.
+"""
+
+import pytest
+
+from config import Config
+from data_models import Message
+
+
+@pytest.fixture
+def timeline_manager(monkeypatch):
+    monkeypatch.setattr(Config, "LLM_BACKEND", "fake")
+    monkeypatch.setattr(Config, "ROLLING_SUMMARIES", True)
+    from managers.timelineManager import TimelineManager
+    return TimelineManager()
+
+
+def _summarize(timeline, summarized_count):
+    for start in range(0, summarized_count, 20):
+        timeline.summary.add_chunk(start, start + 20, f"summary of {start}", timeline.events[start + 19].timeline_id)
+
+
+def _timeline_with_messages(timeline_manager, count):
+    timeline = timeline_manager.create_timeline_history(title="Test", participants=["Harry"])
+    for i in range(count):
+        timeline_manager.add_event(
+            timeline, Message(character="Harry", dialouge=f"line {i}", action_description="talks")
+        )
+    return timeline
+
+
+# Summaries lagging less than a chunk behind the recent window
+@pytest.mark.parametrize("event_count, summarized_count", [(25, 0), (35, 20), (55, 40)])
+def test_every_event_is_summarized_or_in_the_window(timeline_manager, event_count, summarized_count):
+    timeline = _timeline_with_messages(timeline_manager, event_count)
+    _summarize(timeline, summarized_count)
+
+    context = timeline_manager.get_timeline_context(timeline, recent_event_count=10)
+    lines = context.splitlines()
+
+    for position in range(summarized_count, event_count):
+        assert f"Harry: line {position}" in lines
+    for position in range(summarized_count):
+        assert f"Harry: line {position}" not in lines
+    if summarized_count:
+        assert f"- summary of {summarized_count - 20}" in lines
+    assert not any("left out" in line for line in lines)
+
+
+@pytest.mark.parametrize("summarized_count", [0, 20])
+def test_window_extension_is_capped(timeline_manager, summarized_count):
+    timeline = _timeline_with_messages(timeline_manager, 200)
+    _summarize(timeline, summarized_count)
+
+    lines = timeline_manager.get_timeline_context(timeline, recent_event_count=10).splitlines()
+
+    # At most one chunk beyond the recent window, however far the summaries lag
+    window_start = 200 - 10 - Config.SUMMARY_CHUNK_SIZE
+    assert [line for line in lines if line.startswith("Harry: ")] == [
+        f"Harry: line {position}" for position in range(window_start, 200)
+    ]
+    assert f"[... {window_start - summarized_count} earlier events, not summarized yet, are left out ...]" in lines
+
+
+def test_window_keeps_its_size_once_summaries_catch_up(timeline_manager):
+    timeline = _timeline_with_messages(timeline_manager, 30)
+    timeline.summary.add_chunk(0, 20, "summary", timeline.events[19].timeline_id)
+
+    lines = timeline_manager.get_timeline_context(timeline, recent_event_count=15).splitlines()
+
+    assert "Harry: line 15" in lines
+    assert "Harry: line 14" not in lines
@@ -0,0 +1,67 @@
+"""
+Tests for the turn cycle of the TurnManager.
+"""
+
+import asyncio
+
+import pytest
+
+from config import Config
+from data_models import CharacterPersona
+
+
+@pytest.fixture
+def turn_manager(monkeypatch):
+    monkeypatch.setattr(Config, "LLM_BACKEND", "fake")
+    monkeypatch.setattr(Config, "ROLLING_SUMMARIES", False)
+    from managers.characterManager import CharacterManager
+    from managers.timelineManager import TimelineManager
+    from managers.turn_manager import TurnManager
+
+    character = CharacterManager().create_character(
+        CharacterPersona(name="Jack", traits=["bold"], speaking_style="brash", background="pirate")
+    )
+    timeline = TimelineManager().create_timeline_history(title="Test", participants=["Jack"])
+    manager = TurnManager(
+        [character], timeline, max_consecutive_ai_turns=3, two_stage_decisions=True,
+        stream_responses=False, judge_in_background=False
+    )
+    rounds = []
+
+    async def no_meta_decisions():
+        return None
+
+    async def jack_always_wins(decisions=None):
+        rounds.append(1)
+        manager._last_speaker = None
+        return character, "speak", None, None
+
+    monkeypatch.setattr(manager, "_process_meta_narrative_decisions_async", no_meta_decisions)
+    monkeypatch.setattr(manager, "select_next_speaker_async", jack_always_wins)
+    return manager, rounds
+
+
+def test_failed_winner_responses_use_up_the_cycle(turn_manager, monkeypatch):
+    manager, rounds = turn_manager
+
+    async def fail(character, response_type):
+        raise TimeoutError("response timed out")
+
+    monkeypatch.setattr(manager, "_generate_winner_response_async", fail)
+    responses = asyncio.run(manager.process_ai_responses_async())
+
+    assert responses == []
+    assert len(rounds) == 3
+
+
+def test_empty_winner_responses_use_up_the_cycle(turn_manager, monkeypatch):
+    manager, rounds = turn_manager
+
+    async def empty(character, response_type):
+        return None, "", None
+
+    monkeypatch.setattr(manager, "_generate_winner_response_async", empty)
+    responses = asyncio.run(manager.process_ai_responses_async())
+
+    assert responses == []
+    assert len(rounds) == 3